@@ -40,6 +40,7 @@ class Settings(BaseSettings):
     
     # Cache
     CACHE_TTL: int = 300  # 5 minutes
+    RELOAD_POLL_INTERVAL: float = 5.0  # Seconds between checks for a new snapshot (0 disables)
     
     class Config:
         env_file = ".env"
@@ -2,13 +2,16 @@
 CRUD operations for database
 """
 from sqlalchemy.orm import Session
-from sqlalchemy import func, desc, or_
-from typing import List, Optional, Dict
+from sqlalchemy import func, desc, or_, insert, tuple_
+from sqlalchemy.dialects import postgresql, sqlite
+from typing import Iterable, List, Optional, Dict
 from datetime import datetime, timedelta
 from dateutil import parser as date_parser
 
+from api import fulltext
 from api.models.db_models import Article as DBArticle
 from api.models import Article as ArticleModel
+from api.utils.pagination import decode_cursor, encode_cursor
 
 
 def parse_date(date_string: str) -> Optional[datetime]:
@@ -22,20 +25,30 @@ def parse_date(date_string: str) -> Optional[datetime]:
         return None
 
 
+# Rows per bulk insert chunk (one transaction each); keeps the id lookup
+# below SQLite's default limit of 999 bound variables
+BULK_CHUNK_SIZE = 500
+
+
+def _article_values(article: ArticleModel) -> Dict:
+    """Column values for an article row"""
+    return {
+        "id": article.id,
+        "title": article.title,
+        "source": article.source,
+        "url": article.url,
+        "published": parse_date(article.published),
+        "language": article.language,
+        "feed": article.feed,
+        "description": article.description,
+        "category": article.category,
+        "content": article.dict(),
+    }
+
+
 def create_article(db: Session, article: ArticleModel) -> DBArticle:
     """Create new article in database"""
-    db_article = DBArticle(
-        id=article.id,
-        title=article.title,
-        source=article.source,
-        url=article.url,
-        published=parse_date(article.published),
-        language=article.language,
-        feed=article.feed,
-        description=article.description,
-        category=article.category,
-        content=article.dict()
-    )
+    db_article = DBArticle(**_article_values(article))
     db.add(db_article)
     db.commit()
     db.refresh(db_article)
@@ -53,9 +66,24 @@ def get_articles(
     limit: int = 100,
     language: Optional[str] = None,
     category: Optional[str] = None,
-    source: Optional[str] = None
+    source: Optional[str] = None,
+    cursor: Optional[str] = None
 ) -> List[DBArticle]:
-    """Get articles with filters"""
+    """
+    Get articles with filters, newest first
+    
+    With a cursor (see article_cursor) the page starts right after the
+    cursor's (published, id) instead of skipping rows, so deep pages cost the
+    same as the first one. Articles without a publish date come last.
+    
+    Dated and undated articles are read by two queries ordered by
+    (published DESC, id DESC) and (id DESC), so both are range scans of
+    idx_published_id_desc on SQLite and PostgreSQL alike (NULLS LAST would
+    not match the index on either).
+    
+    Raises:
+        ValueError: If the cursor is malformed
+    """
     query = db.query(DBArticle)
     
     if language and language != 'all':
@@ -67,7 +95,40 @@ def get_articles(
     if source:
         query = query.filter(DBArticle.source.ilike(f'%{source}%'))
     
-    return query.order_by(desc(DBArticle.published)).offset(skip).limit(limit).all()
+    dated = query.filter(DBArticle.published.isnot(None))
+    undated = query.filter(DBArticle.published.is_(None))
+    
+    if cursor:
+        published, article_id, _ = decode_cursor(cursor)
+        if published is None:
+            dated = None
+            undated = undated.filter(DBArticle.id < article_id)
+        else:
+            published = datetime.fromisoformat(published)
+            dated = dated.filter(
+                tuple_(DBArticle.published, DBArticle.id) < tuple_(published, article_id)
+            )
+        skip = 0
+    
+    articles = []
+    if dated is not None:
+        articles = dated.order_by(
+            desc(DBArticle.published), desc(DBArticle.id)
+        ).offset(skip).limit(limit).all()
+        if len(articles) == limit:
+            return articles
+        # The page continues into the undated articles
+        skip = 0 if articles or not skip else max(skip - dated.count(), 0)
+    
+    return articles + undated.order_by(
+        desc(DBArticle.id)
+    ).offset(skip).limit(limit - len(articles)).all()
+
+
+def article_cursor(db_article: DBArticle) -> str:
+    """Cursor for the page following this article (pass to get_articles)"""
+    published = db_article.published.isoformat() if db_article.published else None
+    return encode_cursor(published, db_article.id)
 
 
 def search_articles(
@@ -77,7 +138,19 @@ def search_articles(
     limit: int = 100,
     language: Optional[str] = None
 ) -> List[DBArticle]:
-    """Search articles by text"""
+    """Search articles by text (ranked full-text search when available)"""
+    if fulltext.is_enabled(db):
+        matches = fulltext.ranked_matches(db, query_text)
+        if matches is not None:
+            query = db.query(DBArticle).join(matches, matches.c.id == DBArticle.id)
+            
+            if language and language != 'all':
+                query = query.filter(DBArticle.language == language)
+            
+            return query.order_by(
+                matches.c.rank, desc(DBArticle.published)
+            ).offset(skip).limit(limit).all()
+    
     query = db.query(DBArticle)
     
     # Simple text search (works with both SQLite and PostgreSQL)
@@ -187,3 +260,88 @@ def delete_old_articles(db: Session, days: int = 30) -> int:
 def article_exists(db: Session, article_id: str) -> bool:
     """Check if article exists"""
     return db.query(DBArticle).filter(DBArticle.id == article_id).count() > 0
+
+
+def _insert_ignore_duplicates(db: Session):
+    """INSERT that skips rows whose id already exists"""
+    dialect = db.get_bind().dialect.name
+    if dialect == 'postgresql':
+        return postgresql.insert(DBArticle).on_conflict_do_nothing(index_elements=['id'])
+    if dialect == 'sqlite':
+        return sqlite.insert(DBArticle).on_conflict_do_nothing(index_elements=['id'])
+    # Other backends: existing ids are filtered out before inserting
+    return insert(DBArticle)
+
+
+def bulk_ingest_articles(
+    db: Session,
+    articles: Iterable[ArticleModel],
+    chunk_size: int = BULK_CHUNK_SIZE
+) -> Dict[str, int]:
+    """
+    Insert many articles, skipping ones that already exist
+    
+    Articles are written in chunks with one executemany INSERT ... ON CONFLICT
+    DO NOTHING and one transaction per chunk. If a chunk fails, its rows are
+    retried one by one so a single bad article does not lose the chunk.
+    
+    Args:
+        db: Database session
+        articles: Articles to ingest (duplicate ids keep the first occurrence)
+        chunk_size: Rows per transaction
+    
+    Returns:
+        Counts of inserted, skipped (already present or duplicate) and errors
+    """
+    stmt = _insert_ignore_duplicates(db)
+    counts = {"inserted": 0, "skipped": 0, "errors": 0}
+    seen = set()
+    
+    def flush(chunk: List[ArticleModel]):
+        ids = [article.id for article in chunk]
+        existing = {
+            row[0] for row in db.query(DBArticle.id).filter(DBArticle.id.in_(ids))
+        }
+        rows = []
+        for article in chunk:
+            if article.id in existing:
+                counts["skipped"] += 1
+                continue
+            try:
+                rows.append(_article_values(article))
+            except Exception as e:
+                counts["errors"] += 1
+                print(f"Error preparing article {article.id}: {e}")
+        if not rows:
+            return
+        
+        try:
+            db.execute(stmt, rows)
+            db.commit()
+            counts["inserted"] += len(rows)
+        except Exception:
+            db.rollback()
+            for row in rows:
+                try:
+                    db.execute(stmt, [row])
+                    db.commit()
+                    counts["inserted"] += 1
+                except Exception as e:
+                    db.rollback()
+                    counts["errors"] += 1
+                    print(f"Error inserting article {row['id']}: {e}")
+    
+    chunk = []
+    for article in articles:
+        if article.id in seen:
+            counts["skipped"] += 1
+            continue
+        seen.add(article.id)
+        chunk.append(article)
+        if len(chunk) >= chunk_size:
+            flush(chunk)
+            chunk = []
+    if chunk:
+        flush(chunk)
+    
+    return counts
@@ -45,5 +45,12 @@ def get_db():
 
 
 def init_db():
-    """Initialize database - create all tables"""
+    """Initialize database - create all tables and the full-text index"""
+    from api.fulltext import setup_full_text_search
+    from api.models.db_models import Article
+    
     Base.metadata.create_all(bind=engine)
+    # create_all skips existing tables; add indexes introduced since then
+    for index in Article.__table__.indexes:
+        index.create(bind=engine, checkfirst=True)
+    setup_full_text_search(engine)
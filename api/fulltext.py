@@ -0,0 +1,208 @@
+"""
+Full-text search for articles
+SQLite: FTS5 table kept in sync by triggers
+PostgreSQL: generated tsvector column with a GIN index
+"""
+import re
+from typing import Dict, List
+from sqlalchemy import Float, String, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+
+# Plain unicode61 treats combining marks (category M) as separators, which cuts
+# Bangla words at every vowel sign and virama ("বন্যা" -> "বন", "য"). Adding M*
+# to the token categories keeps them whole. Neither this nor the 'simple'
+# configuration stems, so both languages tokenize the same way.
+SQLITE_TOKENIZER = "unicode61 categories 'L* N* Co M*'"
+
+SQLITE_SETUP = [
+    f"""
+    CREATE VIRTUAL TABLE IF NOT EXISTS articles_fts USING fts5(
+        id UNINDEXED, title, description, source,
+        tokenize = "{SQLITE_TOKENIZER}"
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS articles_fts_insert AFTER INSERT ON articles BEGIN
+        INSERT INTO articles_fts(rowid, id, title, description, source)
+        VALUES (new.rowid, new.id, new.title, new.description, new.source);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS articles_fts_delete AFTER DELETE ON articles BEGIN
+        DELETE FROM articles_fts WHERE rowid = old.rowid;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS articles_fts_update
+    AFTER UPDATE OF title, description, source ON articles BEGIN
+        DELETE FROM articles_fts WHERE rowid = old.rowid;
+        INSERT INTO articles_fts(rowid, id, title, description, source)
+        VALUES (new.rowid, new.id, new.title, new.description, new.source);
+    END
+    """,
+]
+
+POSTGRES_SETUP = [
+    """
+    ALTER TABLE articles ADD COLUMN IF NOT EXISTS search_vector tsvector
+    GENERATED ALWAYS AS (
+        setweight(to_tsvector('simple', coalesce(title, '')), 'A') ||
+        setweight(to_tsvector('simple', coalesce(description, '')), 'B') ||
+        setweight(to_tsvector('simple', coalesce(source, '')), 'C')
+    ) STORED
+    """,
+    "CREATE INDEX IF NOT EXISTS idx_articles_search ON articles USING GIN (search_vector)",
+]
+
+# Column weights for bm25 (title, description, source; id is unindexed)
+SQLITE_WEIGHTS = "0.0, 10.0, 3.0, 1.0"
+
+# Whitespace and characters with a meaning in FTS5 / tsquery syntax
+_TERM_SEPARATORS = re.compile(r"[\s\"'`()\[\]{}*:&|!<>^~\-+.,;?/\\@#%=]+")
+
+# Engine URL -> whether full-text search is set up
+_enabled: Dict[str, bool] = {}
+
+
+def search_terms(query_text: str) -> List[str]:
+    """Split a user query into plain search terms"""
+    return [term for term in _TERM_SEPARATORS.split(query_text.lower()) if term]
+
+
+def _sqlite_has_fts5(connection) -> bool:
+    try:
+        connection.execute(text("CREATE VIRTUAL TABLE temp.fts5_probe USING fts5(x)"))
+        connection.execute(text("DROP TABLE temp.fts5_probe"))
+        return True
+    except Exception:
+        return False
+
+
+def _sqlite_tokenizer_keeps_bangla(connection) -> bool:
+    """Check that the tokenizer keeps Bangla words whole (needs SQLite 3.25+ for categories)"""
+    try:
+        connection.execute(text(
+            f"CREATE VIRTUAL TABLE temp.fts5_bangla_probe USING fts5(x, tokenize = \"{SQLITE_TOKENIZER}\")"
+        ))
+        try:
+            connection.execute(text(
+                "INSERT INTO temp.fts5_bangla_probe(x) VALUES ('ঢাকায় বন্যা পরিস্থিতি'), ('বনি যাত্রা শুরু')"
+            ))
+            matched = connection.execute(text(
+                "SELECT x FROM temp.fts5_bangla_probe WHERE fts5_bangla_probe MATCH :match"
+            ).bindparams(match='"বন্যা"*')).scalars().all()
+        finally:
+            connection.execute(text("DROP TABLE temp.fts5_bangla_probe"))
+    except Exception:
+        return False
+    return matched == ['ঢাকায় বন্যা পরিস্থিতি']
+
+
+def _sqlite_fts_outdated(connection) -> bool:
+    """Whether an existing articles_fts table was created with another tokenizer"""
+    sql = connection.execute(text(
+        "SELECT sql FROM sqlite_master WHERE name = 'articles_fts'"
+    )).scalar()
+    return sql is not None and SQLITE_TOKENIZER not in sql
+
+
+def setup_full_text_search(engine: Engine) -> bool:
+    """
+    Create the full-text index for the articles table (idempotent)
+
+    Returns:
+        True if full-text search is available on this database
+    """
+    dialect = engine.dialect.name
+    enabled = False
+    try:
+        with engine.begin() as connection:
+            if dialect == 'sqlite':
+                if _sqlite_has_fts5(connection) and _sqlite_tokenizer_keeps_bangla(connection):
+                    if _sqlite_fts_outdated(connection):
+                        # Re-index with the current tokenizer
+                        connection.execute(text("DROP TABLE articles_fts"))
+                    created = not connection.execute(text(
+                        "SELECT 1 FROM sqlite_master WHERE name = 'articles_fts'"
+                    )).first()
+                    for statement in SQLITE_SETUP:
+                        connection.execute(text(statement))
+                    if created:
+                        # Index articles stored before the table existed
+                        connection.execute(text(
+                            "INSERT INTO articles_fts(rowid, id, title, description, source) "
+                            "SELECT rowid, id, title, description, source FROM articles"
+                        ))
+                    enabled = True
+            elif dialect == 'postgresql':
+                for statement in POSTGRES_SETUP:
+                    connection.execute(text(statement))
+                enabled = True
+    except Exception as e:
+        print(f"Full-text search unavailable, falling back to LIKE search: {e}")
+        enabled = False
+
+    _enabled[str(engine.url)] = enabled
+    return enabled
+
+
+def rebuild_full_text_index(engine: Engine) -> None:
+    """Re-index all articles (SQLite only; e.g. after VACUUM renumbered rowids)"""
+    if engine.dialect.name != 'sqlite':
+        return
+    with engine.begin() as connection:
+        connection.execute(text("DELETE FROM articles_fts"))
+        connection.execute(text(
+            "INSERT INTO articles_fts(rowid, id, title, description, source) "
+            "SELECT rowid, id, title, description, source FROM articles"
+        ))
+
+
+def is_enabled(db: Session) -> bool:
+    """Whether the session's database has the full-text index"""
+    engine = db.get_bind()
+    key = str(engine.url)
+    if key not in _enabled:
+        if engine.dialect.name == 'sqlite':
+            found = db.execute(text(
+                "SELECT 1 FROM sqlite_master WHERE name = 'articles_fts'"
+            )).first()
+        elif engine.dialect.name == 'postgresql':
+            found = db.execute(text(
+                "SELECT 1 FROM information_schema.columns "
+                "WHERE table_name = 'articles' AND column_name = 'search_vector'"
+            )).first()
+        else:
+            found = None
+        _enabled[key] = found is not None
+    return _enabled[key]
+
+
+def ranked_matches(db: Session, query_text: str):
+    """
+    Subquery of (id, rank) for articles matching every query term
+
+    Terms match as prefixes, so "ঢাকা" also finds "ঢাকায়". Lower rank is a
+    better match. Returns None if the query has no searchable terms.
+    """
+    terms = search_terms(query_text)
+    if not terms:
+        return None
+
+    if db.get_bind().dialect.name == 'postgresql':
+        tsquery = " & ".join(f"'{term}':*" for term in terms)
+        statement = text(
+            "SELECT id, -ts_rank_cd(search_vector, query) AS rank "
+            "FROM articles, to_tsquery('simple', :tsquery) AS query "
+            "WHERE search_vector @@ query"
+        ).bindparams(tsquery=tsquery)
+    else:
+        match = " ".join(f'"{term}"*' for term in terms)
+        statement = text(
+            f"SELECT id, bm25(articles_fts, {SQLITE_WEIGHTS}) AS rank "
+            "FROM articles_fts WHERE articles_fts MATCH :match"
+        ).bindparams(match=match)
+
+    return statement.columns(id=String, rank=Float).subquery("fts")
@@ -43,6 +43,7 @@ class NewsResponse(BaseModel):
     language: Optional[str] = Field(None, description="Language filter applied")
     date: Optional[str] = Field(None, description="Date filter applied")
     articles: list[Article] = Field(..., description="List of articles")
+    next_cursor: Optional[str] = Field(None, description="Cursor for the next newest-first page")
 
 
 class SearchResponse(BaseModel):
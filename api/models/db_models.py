@@ -38,7 +38,8 @@ class Article(Base):
     
     # Indexes
     __table_args__ = (
-        Index('idx_published_desc', published.desc()),
+        # Keyset order of get_articles: (published DESC, id DESC)
+        Index('idx_published_id_desc', published.desc(), id.desc()),
         Index('idx_lang_category', language, category),
         Index('idx_source_lang', source, language),
     )
@@ -1,47 +1,51 @@
 """
 Statistics and trending API routes
 """
-from fastapi import APIRouter, Query
+from fastapi import APIRouter, Query, Request
 from datetime import datetime
 
 from api.models import TrendingResponse, Statistics
-from api.utils import data_loader, analyze_trending_topics, calculate_statistics
+from api.utils import data_loader, analyze_trending_topics
+from api.utils.http_cache import cached_json_response
 
 router = APIRouter(tags=["analytics"])
 
 
 @router.get("/trending", response_model=TrendingResponse)
 async def get_trending_topics(
+    request: Request,
     language: str = Query("all", description="Language filter: en, bn, all"),
     limit: int = Query(10, le=50)
 ):
     """Get trending topics"""
     
-    # Load articles
-    articles = data_loader.load_all_news()
+    # Indexed store of all articles
+    store = data_loader.get_store()
     
-    # Filter by language if specified
-    if language != 'all':
-        articles = [a for a in articles if a.language == language]
+    def build():
+        # Filter by language if specified
+        if language != 'all':
+            articles = store.subset(store.by_language.get(language, []))
+        else:
+            articles = store.records
+        
+        # Analyze trending topics
+        topics = analyze_trending_topics(articles, limit)
+        
+        return TrendingResponse(
+            period="today",
+            date=datetime.now().strftime("%Y-%m-%d"),
+            topics=topics
+        )
     
-    # Analyze trending topics
-    topics = analyze_trending_topics(articles, limit)
-    
-    return TrendingResponse(
-        period="today",
-        date=datetime.now().strftime("%Y-%m-%d"),
-        topics=topics
-    )
+    return cached_json_response(request, store, ("trending", language, limit), build)
 
 
 @router.get("/stats", response_model=Statistics)
-async def get_statistics():
+async def get_statistics(request: Request):
     """Get overall statistics"""
     
-    # Load all articles
-    articles = data_loader.load_all_news()
-    
-    # Calculate statistics
-    stats = calculate_statistics(articles)
+    # Statistics straight from the store indexes
+    store = data_loader.get_store()
     
-    return stats
+    return cached_json_response(request, store, ("stats",), store.statistics)
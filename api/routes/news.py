@@ -1,28 +1,49 @@
 """
 News API routes
 """
-from fastapi import APIRouter, Query, HTTPException
+from fastapi import APIRouter, Query, HTTPException, Request
 from typing import Optional
 from datetime import datetime
 
 from api.models import NewsResponse, SearchResponse, HealthResponse
-from api.utils import (
-    data_loader,
-    filter_articles,
-    search_articles,
-    get_latest_articles
-)
+from api.utils import data_loader
+from api.utils.http_cache import cached_json_response
+from api.utils.pagination import decode_cursor
 from api.config import settings
 
 router = APIRouter(prefix="/news", tags=["news"])
 
 
+def _parse_cursor(cursor: Optional[str]):
+    """Decode a pagination cursor; empty means the first newest-first page"""
+    if not cursor:
+        return None
+    try:
+        return decode_cursor(cursor)
+    except ValueError:
+        raise HTTPException(
+            status_code=400,
+            detail={
+                "error": {
+                    "code": "INVALID_CURSOR",
+                    "message": "Cursor is malformed; use next_cursor from a previous response",
+                    "timestamp": datetime.now().isoformat()
+                }
+            }
+        )
+
+
 @router.get("/", response_model=NewsResponse)
 async def get_all_news(
+    request: Request,
     language: Optional[str] = Query("all", description="Language filter: en, bn, all"),
     source: Optional[str] = Query(None, description="Source filter"),
     limit: int = Query(settings.DEFAULT_LIMIT, le=settings.MAX_LIMIT),
-    offset: int = Query(0, ge=0)
+    offset: int = Query(0, ge=0),
+    cursor: Optional[str] = Query(
+        None,
+        description="Keyset pagination: pass empty for the first newest-first page, then next_cursor"
+    )
 ):
     """Get all news articles"""
     
@@ -39,69 +60,89 @@ async def get_all_news(
             }
         )
     
-    # Load all articles
-    articles = data_loader.load_all_news()
+    after = _parse_cursor(cursor)
     
-    # Apply filters
-    filtered = filter_articles(
-        articles,
-        language=language,
-        source=source,
-        limit=limit,
-        offset=offset
-    )
+    # Indexed store of all articles
+    store = data_loader.get_store()
+    
+    def build():
+        next_cursor = None
+        if cursor is not None:
+            # Keyset pagination, newest first: constant cost per page
+            positions = store.newest(limit, language=language, source=source, after=after)
+            filtered = store.page(positions)
+            if len(positions) == limit:
+                next_cursor = store.cursor_after(positions)
+        else:
+            # Apply filters
+            positions = store.filter(language=language, source=source)
+            filtered = store.page(positions, offset=offset, limit=limit)
+        
+        return NewsResponse(
+            total=len(store),
+            count=len(filtered),
+            language=language if language != 'all' else None,
+            date=datetime.now().strftime("%Y-%m-%d"),
+            articles=filtered,
+            next_cursor=next_cursor
+        )
     
-    return NewsResponse(
-        total=len(articles),
-        count=len(filtered),
-        language=language if language != 'all' else None,
-        date=datetime.now().strftime("%Y-%m-%d"),
-        articles=filtered
+    return cached_json_response(
+        request, store, ("news", language, source, limit, offset, cursor), build
     )
 
 
 @router.get("/english", response_model=NewsResponse)
 async def get_english_news(
+    request: Request,
     limit: int = Query(settings.DEFAULT_LIMIT, le=settings.MAX_LIMIT),
     offset: int = Query(0, ge=0)
 ):
     """Get English news only"""
-    articles = data_loader.load_latest_news(settings.OUTPUT_DIR_EN, "en")
+    store = data_loader.get_store(settings.OUTPUT_DIR_EN, "en")
     
-    # Apply pagination
-    filtered = filter_articles(articles, limit=limit, offset=offset)
+    def build():
+        # Apply pagination
+        filtered = store.page(store.all_positions, offset=offset, limit=limit)
+        
+        return NewsResponse(
+            total=len(store),
+            count=len(filtered),
+            language="en",
+            date=datetime.now().strftime("%Y-%m-%d"),
+            articles=filtered
+        )
     
-    return NewsResponse(
-        total=len(articles),
-        count=len(filtered),
-        language="en",
-        date=datetime.now().strftime("%Y-%m-%d"),
-        articles=filtered
-    )
+    return cached_json_response(request, store, ("english", limit, offset), build)
 
 
 @router.get("/bangla", response_model=NewsResponse)
 async def get_bangla_news(
+    request: Request,
     limit: int = Query(settings.DEFAULT_LIMIT, le=settings.MAX_LIMIT),
     offset: int = Query(0, ge=0)
 ):
     """Get Bangla news only (বাংলা)"""
-    articles = data_loader.load_latest_news(settings.OUTPUT_DIR_BN, "bn")
+    store = data_loader.get_store(settings.OUTPUT_DIR_BN, "bn")
     
-    # Apply pagination
-    filtered = filter_articles(articles, limit=limit, offset=offset)
+    def build():
+        # Apply pagination
+        filtered = store.page(store.all_positions, offset=offset, limit=limit)
+        
+        return NewsResponse(
+            total=len(store),
+            count=len(filtered),
+            language="bn",
+            date=datetime.now().strftime("%Y-%m-%d"),
+            articles=filtered
+        )
     
-    return NewsResponse(
-        total=len(articles),
-        count=len(filtered),
-        language="bn",
-        date=datetime.now().strftime("%Y-%m-%d"),
-        articles=filtered
-    )
+    return cached_json_response(request, store, ("bangla", limit, offset), build)
 
 
 @router.get("/search", response_model=SearchResponse)
 async def search_news(
+    request: Request,
     q: str = Query(..., description="Search query"),
     language: Optional[str] = Query(None, description="Language filter: en, bn"),
     category: Optional[str] = Query(None, description="Category filter"),
@@ -110,112 +151,140 @@ async def search_news(
 ):
     """Search news articles"""
     
-    # Load all articles
-    articles = data_loader.load_all_news()
+    # Indexed store of all articles
+    store = data_loader.get_store()
     
-    # Search
-    results = search_articles(articles, q, language, category)
-    
-    # Apply pagination
-    paginated = results[offset:offset+limit]
+    def build():
+        # Search
+        results = store.search(q, language, category)
+        
+        # Apply pagination
+        paginated = store.page_scored(results, offset=offset, limit=limit)
+        
+        return SearchResponse(
+            query=q,
+            total=len(results),
+            count=len(paginated),
+            articles=paginated
+        )
     
-    return SearchResponse(
-        query=q,
-        total=len(results),
-        count=len(paginated),
-        articles=paginated
+    return cached_json_response(
+        request, store, ("search", q, language, category, limit, offset), build
     )
 
 
 @router.get("/latest", response_model=NewsResponse)
 async def get_latest_news(
+    request: Request,
     limit: int = Query(20, le=100),
-    language: Optional[str] = Query(None, description="Language filter: en, bn")
+    language: Optional[str] = Query(None, description="Language filter: en, bn"),
+    cursor: Optional[str] = Query(None, description="next_cursor of the previous page")
 ):
     """Get latest news articles"""
     
-    # Load all articles
-    articles = data_loader.load_all_news()
+    after = _parse_cursor(cursor)
     
-    # Filter by language if specified
-    if language:
-        articles = [a for a in articles if a.language == language]
+    # Indexed store of all articles
+    store = data_loader.get_store()
     
-    # Get latest
-    latest = get_latest_articles(articles, limit)
+    def build():
+        # Get latest (newest-first index, filtered by language if specified)
+        if after is None:
+            positions = store.latest(limit, language)
+        elif language and language not in store.by_language:
+            positions = []
+        else:
+            positions = store.newest(limit, language=language, after=after)
+        latest = store.page(positions)
+        total = len(store.by_language.get(language, [])) if language else len(store)
+        
+        return NewsResponse(
+            total=total,
+            count=len(latest),
+            language=language,
+            date=datetime.now().strftime("%Y-%m-%d"),
+            articles=latest,
+            next_cursor=store.cursor_after(positions) if len(positions) == limit else None
+        )
     
-    return NewsResponse(
-        total=len(articles),
-        count=len(latest),
-        language=language,
-        date=datetime.now().strftime("%Y-%m-%d"),
-        articles=latest
-    )
+    return cached_json_response(request, store, ("latest", limit, language, cursor), build)
 
 
 @router.get("/category/{category}", response_model=NewsResponse)
 async def get_news_by_category(
+    request: Request,
     category: str,
     language: Optional[str] = Query(None, description="Language filter: en, bn"),
     limit: int = Query(settings.DEFAULT_LIMIT, le=settings.MAX_LIMIT)
 ):
     """Get news by category"""
     
-    # Load all articles
-    articles = data_loader.load_all_news()
+    # Indexed store of all articles
+    store = data_loader.get_store()
     
-    # Filter by category
-    filtered = filter_articles(articles, language=language, category=category, limit=limit)
-    
-    if not filtered:
-        raise HTTPException(
-            status_code=404,
-            detail={
-                "error": {
-                    "code": "NO_RESULTS",
-                    "message": f"No articles found for category '{category}'",
-                    "timestamp": datetime.now().isoformat()
+    def build():
+        # Filter by category (only on a cache miss; polls are answered from the ETag)
+        positions = store.filter(language=language, category=category)
+        
+        if not positions:
+            raise HTTPException(
+                status_code=404,
+                detail={
+                    "error": {
+                        "code": "NO_RESULTS",
+                        "message": f"No articles found for category '{category}'",
+                        "timestamp": datetime.now().isoformat()
+                    }
                 }
-            }
+            )
+        
+        filtered = store.page(positions, limit=limit)
+        
+        return NewsResponse(
+            total=len(filtered),
+            count=len(filtered),
+            language=language,
+            date=datetime.now().strftime("%Y-%m-%d"),
+            articles=filtered
         )
     
-    return NewsResponse(
-        total=len(filtered),
-        count=len(filtered),
-        language=language,
-        date=datetime.now().strftime("%Y-%m-%d"),
-        articles=filtered
-    )
+    return cached_json_response(request, store, ("category", category, language, limit), build)
 
 
 @router.get("/source/{source}", response_model=NewsResponse)
 async def get_news_by_source(
+    request: Request,
     source: str,
     limit: int = Query(settings.DEFAULT_LIMIT, le=settings.MAX_LIMIT)
 ):
     """Get news from specific source"""
     
-    # Load all articles
-    articles = data_loader.load_all_news()
-    
-    # Filter by source
-    filtered = filter_articles(articles, source=source, limit=limit)
+    # Indexed store of all articles
+    store = data_loader.get_store()
     
-    if not filtered:
-        raise HTTPException(
-            status_code=404,
-            detail={
-                "error": {
-                    "code": "NO_RESULTS",
-                    "message": f"No articles found from source '{source}'",
-                    "timestamp": datetime.now().isoformat()
+    def build():
+        # Filter by source (only on a cache miss; polls are answered from the ETag)
+        positions = store.filter(source=source)
+        
+        if not positions:
+            raise HTTPException(
+                status_code=404,
+                detail={
+                    "error": {
+                        "code": "NO_RESULTS",
+                        "message": f"No articles found from source '{source}'",
+                        "timestamp": datetime.now().isoformat()
+                    }
                 }
-            }
+            )
+        
+        filtered = store.page(positions, limit=limit)
+        
+        return NewsResponse(
+            total=len(filtered),
+            count=len(filtered),
+            date=datetime.now().strftime("%Y-%m-%d"),
+            articles=filtered
         )
     
-    return NewsResponse(
-        total=len(filtered),
-        count=len(filtered),
-        date=datetime.now().strftime("%Y-%m-%d"),
-        articles=filtered
-    )
+    return cached_json_response(request, store, ("source", source, limit), build)
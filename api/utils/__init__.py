@@ -1,15 +1,14 @@
 """
 Utils package
 """
+from .article_store import ArticleStore, ArticleRecord
 from .data_loader import data_loader
-from .search import search_articles, filter_articles, get_latest_articles
 from .analytics import analyze_trending_topics, calculate_statistics, get_category_counts
 
 __all__ = [
+    "ArticleStore",
+    "ArticleRecord",
     "data_loader",
-    "search_articles",
-    "filter_articles",
-    "get_latest_articles",
     "analyze_trending_topics",
     "calculate_statistics",
     "get_category_counts"
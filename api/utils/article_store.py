@@ -0,0 +1,316 @@
+"""
+Article store - Indexed in-memory view of the loaded news
+"""
+from bisect import bisect_left
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+from api.models import Article, Statistics
+from api.utils.pagination import encode_cursor
+
+
+# Filter combinations whose newest-first ordering is kept per data generation
+MAX_CACHED_FILTERS = 64
+
+
+class ArticleRecord:
+    """Compact article record (materialized into an Article only when returned)"""
+
+    __slots__ = (
+        "id", "title", "source", "url", "published", "language", "feed",
+        "description", "category",
+    )
+
+    def __init__(self, id, title, source, url, published, language, feed,
+                 description=None, category=None):
+        self.id = id
+        self.title = title
+        self.source = source
+        self.url = url
+        self.published = published
+        self.language = language
+        self.feed = feed
+        self.description = description
+        self.category = category
+
+    @classmethod
+    def from_article(cls, article: Article) -> "ArticleRecord":
+        return cls(
+            article.id, article.title, article.source, article.url, article.published,
+            article.language, article.feed, article.description, article.category,
+        )
+
+    def to_article(self, relevance: Optional[float] = None) -> Article:
+        """Build the response model (fields were validated when loaded)"""
+        return Article.model_construct(
+            id=self.id,
+            title=self.title,
+            source=self.source,
+            url=self.url,
+            published=self.published,
+            language=self.language,
+            feed=self.feed,
+            description=self.description,
+            category=self.category,
+            relevance=relevance,
+        )
+
+
+def _intersect(*position_lists: List[int]) -> List[int]:
+    """Intersection of ascending position lists, kept in ascending order"""
+    position_lists = sorted(position_lists, key=len)
+    smallest, others = position_lists[0], [set(p) for p in position_lists[1:]]
+    return [p for p in smallest if all(p in other for other in others)]
+
+
+class ArticleStore:
+    """
+    Articles of one data refresh with prebuilt indexes
+
+    Records keep their load order; positions into that order are indexed by
+    language, category and source/feed, plus a newest-first ordering by
+    published time. Filters become index lookups and pagination a slice.
+    """
+
+    def __init__(
+        self,
+        articles: Iterable[Article],
+        version: str = "",
+        last_modified: Optional[float] = None
+    ):
+        # Identity of the data generation (used for ETags) and its snapshot time
+        self.version = version
+        self.last_modified = last_modified
+        # Serialized response bodies for this generation, see api.utils.http_cache
+        self.responses: Dict[tuple, bytes] = {}
+        self.records: List[ArticleRecord] = [
+            a if isinstance(a, ArticleRecord) else ArticleRecord.from_article(a)
+            for a in articles
+        ]
+        self.by_language: Dict[str, List[int]] = {}
+        self.by_category: Dict[str, List[int]] = {}
+        self.by_source: Dict[str, List[int]] = {}
+        self.by_feed: Dict[str, List[int]] = {}
+
+        for position, record in enumerate(self.records):
+            self.by_language.setdefault(record.language, []).append(position)
+            self.by_category.setdefault(record.category, []).append(position)
+            self.by_source.setdefault(record.source, []).append(position)
+            self.by_feed.setdefault(record.feed, []).append(position)
+
+        # Newest first by (published, id, occurrence), the keyset used by
+        # pagination cursors; occurrence numbers records sharing (published, id)
+        # (one article in several feeds) in load order, so every key is unique
+        occurrences: Dict[Tuple[str, str], int] = {}
+        self._keys: List[Tuple[str, str, int]] = []
+        for record in self.records:
+            key = (record.published, record.id)
+            occurrence = occurrences.get(key, 0)
+            occurrences[key] = occurrence + 1
+            self._keys.append(key + (occurrence,))
+        ascending = sorted(range(len(self.records)), key=self._keys.__getitem__)
+        self._published_keys = [self._keys[position] for position in ascending]
+        self.by_published: List[int] = ascending[::-1]
+        # Newest-first positions and ascending keys per filter combination
+        self._newest_filtered: Dict[tuple, Tuple[List[int], List[Tuple[str, str, int]]]] = {}
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    @property
+    def all_positions(self) -> List[int]:
+        return list(range(len(self.records)))
+
+    def _source_positions(self, source: str) -> List[int]:
+        """Positions whose source or feed contains the text (case-insensitive)"""
+        source_lower = source.lower()
+        matched = set()
+        for index in (self.by_source, self.by_feed):
+            for key, positions in index.items():
+                if source_lower in key.lower():
+                    matched.update(positions)
+        return sorted(matched)
+
+    def filter(
+        self,
+        language: Optional[str] = None,
+        category: Optional[str] = None,
+        source: Optional[str] = None
+    ) -> List[int]:
+        """
+        Positions matching all given filters, in load order
+
+        Args:
+            language: Language filter ('en', 'bn', 'all')
+            category: Category filter
+            source: Source filter (substring of source or feed name)
+
+        Returns:
+            Ascending list of record positions
+        """
+        selected = []
+        if language and language != 'all':
+            selected.append(self.by_language.get(language, []))
+        if category:
+            selected.append(self.by_category.get(category, []))
+        if source:
+            selected.append(self._source_positions(source))
+
+        if not selected:
+            return self.all_positions
+        if len(selected) == 1:
+            return selected[0]
+        return _intersect(*selected)
+
+    def search(
+        self,
+        query: str,
+        language: Optional[str] = None,
+        category: Optional[str] = None
+    ) -> List[Tuple[int, Optional[float]]]:
+        """
+        Matching positions with relevance scores, best first
+
+        Case-insensitive substring scoring: title 0.7 (+0.3 for an exact title),
+        description 0.3, source 0.2, capped at 1.0. Filters are applied through
+        the indexes before scoring.
+        """
+        candidates = self.filter(language=language, category=category)
+        if not query:
+            return [(position, None) for position in candidates]
+
+        query_lower = query.lower()
+        records = self.records
+        results = []
+        for position in candidates:
+            record = records[position]
+            relevance = 0.0
+            title_lower = record.title.lower()
+
+            if query_lower in title_lower:
+                relevance += 0.7
+                if query_lower == title_lower:
+                    relevance += 0.3
+            if query_lower in (record.description or '').lower():
+                relevance += 0.3
+            if query_lower in record.source.lower():
+                relevance += 0.2
+
+            if relevance > 0:
+                results.append((position, min(relevance, 1.0)))
+
+        results.sort(key=lambda item: item[1], reverse=True)
+        return results
+
+    def _newest_positions(
+        self,
+        language: Optional[str],
+        category: Optional[str],
+        source: Optional[str]
+    ) -> Tuple[List[int], List[Tuple[str, str, int]]]:
+        """Newest-first positions matching the filters and their keys in ascending order"""
+        if not (language or category or source):
+            return self.by_published, self._published_keys
+
+        key = (language, category, source)
+        cached = self._newest_filtered.get(key)
+        if cached is None:
+            # Built once per filter combination and data generation
+            allowed = set(self.filter(language=language, category=category, source=source))
+            positions = [position for position in self.by_published if position in allowed]
+            keys = [self._keys[position] for position in reversed(positions)]
+            cached = (positions, keys)
+            if len(self._newest_filtered) >= MAX_CACHED_FILTERS:
+                self._newest_filtered.pop(next(iter(self._newest_filtered)))
+            self._newest_filtered[key] = cached
+        return cached
+
+    def newest(
+        self,
+        limit: int,
+        language: Optional[str] = None,
+        category: Optional[str] = None,
+        source: Optional[str] = None,
+        after: Optional[Tuple] = None
+    ) -> List[int]:
+        """
+        Newest-first positions matching the filters (keyset pagination)
+
+        Args:
+            limit: Maximum number of positions
+            language: Language filter ('en', 'bn', 'all')
+            category: Category filter
+            source: Source filter (substring of source or feed name)
+            after: (published, id, occurrence) of the last item of the previous
+                   page, as returned by decode_cursor
+
+        Returns:
+            Positions ordered by (published, id, occurrence) descending
+        """
+        positions, keys = self._newest_positions(language, category, source)
+        start = 0
+        if after is not None:
+            # Keys are unique, so everything below the cursor follows it
+            occurrence = after[2] if len(after) > 2 else 0
+            below = bisect_left(keys, (after[0] or '', after[1], occurrence))
+            start = len(positions) - below
+        return positions[start:start + limit]
+
+    def latest(self, limit: int, language: Optional[str] = None) -> List[int]:
+        """Newest positions, optionally restricted to one language"""
+        if not language:
+            return self.by_published[:limit]
+        # 'all' is not a language here; it matches nothing
+        return self.newest(limit, language=language) if language in self.by_language else []
+
+    def cursor_after(self, positions: List[int]) -> Optional[str]:
+        """Cursor for the page following the given newest-first positions"""
+        if not positions:
+            return None
+        published, article_id, occurrence = self._keys[positions[-1]]
+        return encode_cursor(published, article_id, occurrence)
+
+    def page(
+        self,
+        positions: List[int],
+        offset: int = 0,
+        limit: Optional[int] = None
+    ) -> List[Article]:
+        """Materialize one page of positions as Article models"""
+        end = offset + limit if limit else None
+        return [self.records[position].to_article() for position in positions[offset:end]]
+
+    def page_scored(
+        self,
+        scored: List[Tuple[int, Optional[float]]],
+        offset: int = 0,
+        limit: Optional[int] = None
+    ) -> List[Article]:
+        """Materialize one page of search results with their relevance"""
+        end = offset + limit if limit else None
+        return [
+            self.records[position].to_article(relevance)
+            for position, relevance in scored[offset:end]
+        ]
+
+    def subset(self, positions: List[int]) -> List[ArticleRecord]:
+        return [self.records[position] for position in positions]
+
+    def statistics(self) -> Statistics:
+        """Overall statistics straight from the indexes"""
+        categories = [category for category in self.by_category if category]
+        if self.records:
+            last_updated = self.records[self.by_published[0]].published
+        else:
+            last_updated = datetime.now().isoformat()
+
+        return Statistics(
+            total_articles=len(self.records),
+            by_language={k: len(v) for k, v in self.by_language.items()},
+            by_source={k: len(v) for k, v in self.by_source.items()},
+            last_updated=last_updated,
+            sources_count=len(self.by_source),
+            categories=sorted(categories)
+        )
+
+    def category_counts(self) -> Dict[str, int]:
+        return {k: len(v) for k, v in self.by_category.items() if k}
@@ -3,19 +3,43 @@ Data loader utility - Load news from JSON files
 """
 import json
 import hashlib
+import threading
+import time
 from pathlib import Path
-from datetime import datetime
 from typing import List, Dict, Optional
-from api.models import Article
+from api.config import settings
+from api.utils.article_store import ArticleRecord, ArticleStore
+
+try:
+    import orjson
+except ImportError:  # optional speedup, see requirements-api.txt
+    orjson = None
+
+
+def _json_loads(data: bytes):
+    """Decode JSON bytes, with orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data.decode('utf-8'))
+
+
+# Article fields that must be strings
+_REQUIRED_TEXT_FIELDS = ("title", "source", "url", "published", "feed")
 
 
 class DataLoader:
     """Load and manage news data from JSON files"""
     
-    def __init__(self, base_dir: str = "."):
+    def __init__(self, base_dir: str = ".", poll_interval: float = 5.0):
         self.base_dir = Path(base_dir)
+        self.poll_interval = poll_interval
         self._cache = {}
-        self._cache_time = {}
+        self._snapshots = {}
+        self._failed = {}
+        self._sources = {}
+        self._stores = {}
+        self._lock = threading.Lock()
+        self._watcher = None
     
     def _generate_article_id(self, article: dict) -> str:
         """Generate unique ID for article"""
@@ -41,18 +65,26 @@ class DataLoader:
     def _load_json_file(self, file_path: Path) -> Dict:
         """Load single JSON file"""
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            with open(file_path, 'rb') as f:
+                return _json_loads(f.read())
         except Exception as e:
             print(f"Error loading {file_path}: {e}")
             return {}
     
-    def _parse_article(self, article_data: dict, feed_name: str, language: str) -> Article:
-        """Parse article data into Article model"""
+    def _parse_article(self, article_data: dict, feed_name: str, language: str) -> ArticleRecord:
+        """
+        Parse article data into a compact record
+        
+        id and category are derived here, once per snapshot; the Article model
+        is only built for records that end up in a response.
+        
+        Raises:
+            ValueError: If a field has the wrong type (as Article validation would)
+        """
         article_id = self._generate_article_id(article_data)
         category = self._detect_category(feed_name, article_data.get('title', ''))
         
-        return Article(
+        record = ArticleRecord(
             id=article_id,
             title=article_data.get('title', 'No title'),
             source=article_data.get('source', 'Unknown'),
@@ -63,43 +95,39 @@ class DataLoader:
             description=article_data.get('description', article_data.get('summary', '')),
             category=category
         )
+        for field in _REQUIRED_TEXT_FIELDS:
+            if not isinstance(getattr(record, field), str):
+                raise ValueError(f"{field} must be a string")
+        if record.description is not None and not isinstance(record.description, str):
+            raise ValueError("description must be a string")
+        return record
     
-    def load_latest_news(self, output_dir: str, language: str) -> List[Article]:
-        """Load latest news from output directory"""
-        cache_key = f"{output_dir}_{language}"
-        
-        # Check cache (5 min TTL)
-        if cache_key in self._cache:
-            cache_age = (datetime.now() - self._cache_time[cache_key]).seconds
-            if cache_age < 300:  # 5 minutes
-                return self._cache[cache_key]
-        
-        articles = []
+    def _latest_snapshot(self, output_dir: str) -> Optional[Path]:
+        """Newest JSON snapshot of an output directory"""
         output_path = self.base_dir / output_dir
         
         if not output_path.exists():
-            return articles
+            return None
         
         # Get latest date folder
         date_folders = sorted([d for d in output_path.iterdir() if d.is_dir()], reverse=True)
         
         if not date_folders:
-            return articles
-        
-        latest_folder = date_folders[0]
+            return None
         
-        # Load all JSON files from latest folder
-        json_files = sorted(latest_folder.glob("*.json"), reverse=True)
+        # Latest JSON file of the latest folder
+        json_files = sorted(date_folders[0].glob("*.json"), reverse=True)
         
-        if not json_files:
-            return articles
-        
-        # Load latest JSON file
-        latest_file = json_files[0]
-        data = self._load_json_file(latest_file)
+        return json_files[0] if json_files else None
+    
+    def _read_snapshot(self, snapshot: Path, language: str) -> Optional[List[ArticleRecord]]:
+        """Parse one snapshot file; None if it could not be read"""
+        data = self._load_json_file(snapshot)
         
         if not data:
-            return articles
+            return None
+        
+        articles = []
         
         # Parse articles
         # Handle both dict with 'feeds' key and direct dict of feeds
@@ -129,13 +157,61 @@ class DataLoader:
                     print(f"Error parsing article: {e}")
                     continue
         
-        # Cache results
+        return articles
+    
+    @staticmethod
+    def _signature(snapshot: Optional[Path]) -> Optional[tuple]:
+        """Identity of a snapshot file: path, inode, mtime and size"""
+        if snapshot is None:
+            return None
+        stat = snapshot.stat()
+        return (str(snapshot), stat.st_ino, stat.st_mtime_ns, stat.st_size)
+    
+    def _refresh(self, cache_key: str, output_dir: str, language: str) -> bool:
+        """Reload a source if its newest snapshot changed; returns whether it was swapped"""
+        snapshot = self._latest_snapshot(output_dir)
+        signature = self._signature(snapshot)
+        if cache_key in self._cache and signature in (
+            self._snapshots.get(cache_key), self._failed.get(cache_key)
+        ):
+            return False
+        
+        if snapshot is None:
+            articles = []
+        else:
+            articles = self._read_snapshot(snapshot, language)
+            if articles is None:
+                # Unreadable (e.g. still being written): keep serving the previous
+                # snapshot and retry once the file changes again
+                self._failed[cache_key] = signature
+                if cache_key in self._cache:
+                    return False
+                articles = []
+                signature = None
+        
+        # Swap in the new list; readers holding the old one are unaffected
         self._cache[cache_key] = articles
-        self._cache_time[cache_key] = datetime.now()
+        self._snapshots[cache_key] = signature
+        return True
+    
+    def load_latest_news(self, output_dir: str, language: str) -> List[ArticleRecord]:
+        """Load latest news from output directory"""
+        cache_key = f"{output_dir}_{language}"
         
-        return articles
+        articles = self._cache.get(cache_key)
+        if articles is not None:
+            return articles
+        
+        # First request for this source: load it now, then keep it watched
+        with self._lock:
+            if cache_key not in self._cache:
+                self._refresh(cache_key, output_dir, language)
+                self._sources[cache_key] = (output_dir, language)
+        self._ensure_watcher()
+        
+        return self._cache[cache_key]
     
-    def load_all_news(self) -> List[Article]:
+    def load_all_news(self) -> List[ArticleRecord]:
         """Load all news from all sources"""
         all_articles = []
         
@@ -158,11 +234,94 @@ class DataLoader:
         
         return all_articles
     
+    def _get_store(self, key: str, cache_keys: List[str], build) -> ArticleStore:
+        """Indexed store, rebuilt only when one of the underlying caches refreshed"""
+        sources = [self._cache.get(cache_key) for cache_key in cache_keys]
+        # Empty results are fresh lists on every call; they must not force a rebuild
+        source_ids = tuple(id(articles) if articles else None for articles in sources)
+        cached = self._stores.get(key)
+        if cached is not None and cached[0] == source_ids:
+            return cached[1]
+        
+        # The data generation is identified by the snapshot files it was built from
+        signatures = tuple(self._snapshots.get(cache_key) for cache_key in cache_keys)
+        version = hashlib.md5(repr((key, signatures)).encode()).hexdigest()[:16]
+        mtimes = [signature[2] for signature in signatures if signature]
+        last_modified = max(mtimes) / 1e9 if mtimes else None
+        
+        store = ArticleStore(build(), version=version, last_modified=last_modified)
+        # Keep the source lists referenced so their ids stay unique
+        self._stores[key] = (source_ids, store, sources)
+        return store
+    
+    def get_store(self, output_dir: Optional[str] = None, language: Optional[str] = None) -> ArticleStore:
+        """
+        Indexed store of all news, or of one output directory
+
+        Built once per data refresh and shared by all requests until then.
+        """
+        if output_dir is not None:
+            articles = self.load_latest_news(output_dir, language)
+            cache_key = f"{output_dir}_{language}"
+            return self._get_store(cache_key, [cache_key], lambda: articles)
+        
+        sources = [
+            ("output_google_news_en", "en"),
+            ("output_google_news_bn", "bn"),
+            ("output_bd_rss", "mixed"),
+        ]
+        for output_dir, language in sources:
+            self.load_latest_news(output_dir, language)
+        cache_keys = [f"{output_dir}_{language}" for output_dir, language in sources]
+        return self._get_store("all", cache_keys, self.load_all_news)
+    
+    def refresh(self) -> bool:
+        """
+        Reload every watched source whose newest snapshot changed
+
+        Returns:
+            True if any source was swapped
+        """
+        changed = False
+        with self._lock:
+            for cache_key, (output_dir, language) in list(self._sources.items()):
+                try:
+                    changed = self._refresh(cache_key, output_dir, language) or changed
+                except Exception as e:
+                    print(f"Error reloading {output_dir}: {e}")
+        
+        if changed:
+            # Rebuild the indexes here so requests never pay for it
+            for store_key in list(self._stores):
+                if store_key == "all":
+                    self.get_store()
+                elif store_key in self._sources:
+                    self.get_store(*self._sources[store_key])
+        return changed
+    
+    def _watch(self):
+        while True:
+            time.sleep(self.poll_interval)
+            self.refresh()
+    
+    def _ensure_watcher(self):
+        """Start the background stat-polling thread once"""
+        if self.poll_interval <= 0 or self._watcher is not None:
+            return
+        with self._lock:
+            if self._watcher is None:
+                self._watcher = threading.Thread(
+                    target=self._watch, name="news-snapshot-watcher", daemon=True
+                )
+                self._watcher.start()
+    
     def clear_cache(self):
         """Clear data cache"""
         self._cache = {}
-        self._cache_time = {}
+        self._snapshots = {}
+        self._failed = {}
+        self._stores = {}
 
 
 # Global data loader instance
-data_loader = DataLoader()
+data_loader = DataLoader(poll_interval=settings.RELOAD_POLL_INTERVAL)
@@ -0,0 +1,92 @@
+"""
+HTTP caching - ETags, conditional requests and cached response bodies
+"""
+from datetime import datetime, timezone
+from email.utils import formatdate, parsedate_to_datetime
+from typing import Callable, Optional
+from fastapi import Request, Response
+from pydantic import BaseModel
+from api.utils.article_store import ArticleStore
+
+
+# Serialized bodies kept per data generation (oldest dropped first)
+MAX_CACHED_RESPONSES = 256
+
+
+def _etag(store: ArticleStore) -> str:
+    # Responses embed today's date, so the tag changes at midnight as well
+    return f'W/"{store.version}-{datetime.now().strftime("%Y%m%d")}"'
+
+
+def _last_modified(store: ArticleStore) -> Optional[float]:
+    """Snapshot time, or the last local midnight if later (responses embed the date)"""
+    if store.last_modified is None:
+        return None
+    midnight = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+    return max(store.last_modified, midnight.timestamp())
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    if if_none_match.strip() == "*":
+        return True
+    # Weak comparison: ignore the W/ prefix on either side
+    opaque = etag.removeprefix("W/")
+    return any(
+        candidate.strip().removeprefix("W/") == opaque
+        for candidate in if_none_match.split(",")
+    )
+
+
+def _not_modified_since(if_modified_since: str, last_modified: float) -> bool:
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    if since.tzinfo is None:
+        since = since.replace(tzinfo=timezone.utc)
+    # HTTP dates have whole-second precision
+    return int(last_modified) <= since.timestamp()
+
+
+def cached_json_response(
+    request: Request,
+    store: ArticleStore,
+    key: tuple,
+    build: Callable[[], BaseModel]
+) -> Response:
+    """
+    JSON response for one data generation, answered with 304 when unchanged
+
+    Args:
+        request: Incoming request (for If-None-Match / If-Modified-Since)
+        store: Store the response is computed from; its version is the ETag
+        key: Endpoint name and parameters identifying the response body
+        build: Builds the response model on a cache miss
+
+    Returns:
+        200 with the cached or freshly serialized body, or 304
+    """
+    etag = _etag(store)
+    last_modified = _last_modified(store)
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if last_modified is not None:
+        headers["Last-Modified"] = formatdate(last_modified, usegmt=True)
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        if _etag_matches(if_none_match, etag):
+            return Response(status_code=304, headers=headers)
+    elif last_modified is not None:
+        if_modified_since = request.headers.get("if-modified-since")
+        if if_modified_since and _not_modified_since(if_modified_since, last_modified):
+            return Response(status_code=304, headers=headers)
+
+    cache_key = key + (etag,)
+    body: Optional[bytes] = store.responses.get(cache_key)
+    if body is None:
+        body = build().model_dump_json().encode("utf-8")
+        if len(store.responses) >= MAX_CACHED_RESPONSES:
+            store.responses.pop(next(iter(store.responses)))
+        store.responses[cache_key] = body
+
+    return Response(content=body, media_type="application/json", headers=headers)
@@ -0,0 +1,44 @@
+"""
+Keyset pagination cursors
+"""
+import base64
+import json
+from typing import Optional, Tuple
+
+
+def encode_cursor(published: Optional[str], article_id: str, occurrence: int = 0) -> str:
+    """
+    Opaque cursor pointing just after the (published, id) of the last item
+
+    occurrence tells apart items sharing (published, id), e.g. one article
+    listed by several feeds; it is only encoded when non-zero.
+    """
+    key = [published, article_id, occurrence] if occurrence else [published, article_id]
+    raw = json.dumps(key, ensure_ascii=False, separators=(',', ':'))
+    return base64.urlsafe_b64encode(raw.encode('utf-8')).decode('ascii').rstrip('=')
+
+
+def decode_cursor(cursor: str) -> Tuple[Optional[str], str, int]:
+    """
+    Decode a cursor produced by encode_cursor
+
+    Returns:
+        (published, id, occurrence)
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        key = json.loads(base64.urlsafe_b64decode(padded).decode('utf-8'))
+        published, article_id = key[0], key[1]
+        occurrence = key[2] if len(key) == 3 else 0
+        if len(key) not in (2, 3):
+            raise ValueError
+    except Exception:
+        raise ValueError("Invalid cursor")
+    if not isinstance(article_id, str) or not (published is None or isinstance(published, str)):
+        raise ValueError("Invalid cursor")
+    if not isinstance(occurrence, int) or isinstance(occurrence, bool) or occurrence < 0:
+        raise ValueError("Invalid cursor")
+    return published, article_id, occurrence
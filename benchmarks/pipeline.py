@@ -0,0 +1,438 @@
+"""
+Benchmark for the crawl -> analyze -> render pipeline of main.py
+
+Builds a throwaway workspace with a synthetic config, frequency word file and
+output/<date>/txt history, serves the newsnow API from a local stub server,
+and times each stage of NewsAnalyzer separately:
+
+    crawl                    NewsAnalyzer._crawl_data (against the stub)
+    read_all_today_titles    merge today's batches
+    count_word_frequency     keyword statistics
+    render_html_content      HTML report
+    split_content_into_batches   notification batches, per channel format
+    run                      NewsAnalyzer.run end to end
+
+Each stage runs --repeat times. The first run is reported separately because
+several stages build caches on first use. Results are written as JSON, and
+--baseline compares against an earlier result file.
+
+Usage:
+    python benchmarks/pipeline.py --days 7 --batches 48 --platforms 11 --titles 50
+    python benchmarks/pipeline.py --output new.json --baseline old.json --fail-over 20
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import random
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+from urllib.parse import parse_qs, urlparse
+
+import pytz
+
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+
+from newshawk.parser import write_titles_file  # noqa: E402
+
+
+SPLIT_FORMATS = ["feishu", "dingtalk", "wework", "telegram", "ntfy", "slack"]
+
+_VOCABULARY = (
+    "人工智能 特斯拉 降价 马斯克 华为 发布 新品 手机 北京 上海 股市 大涨 暴跌 比赛 冠军 "
+    "科技 公司 政策 经济 增长 选举 教育 医疗 汽车 芯片 电影 票房 天气 暴雨 高温"
+).split() + (
+    "Bangladesh cricket election Dhaka economy iPhone launch AI model stocks rally "
+    "team wins budget floods garments exports bank inflation"
+).split()
+
+
+def synthetic_title(rng: random.Random) -> str:
+    if rng.random() < 0.6:
+        return "".join(rng.sample(_VOCABULARY[:30], rng.randint(3, 6)))
+    return " ".join(rng.sample(_VOCABULARY[30:], rng.randint(4, 8)))
+
+
+def platform_ids(count: int) -> List[str]:
+    return [f"p{i:02d}" for i in range(count)]
+
+
+class StubNewsnow:
+    """Local stand-in for the newsnow API (GET /api/s?id=<platform>)"""
+
+    def __init__(self, titles: int, latency_ms: int = 0, seed: int = 0):
+        self.titles = titles
+        self.latency_ms = latency_ms
+        self.seed = seed
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        host, port = self.server.server_address
+        return f"http://{host}:{port}/api/s?id={{}}&latest"
+
+    def _handler(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                query = parse_qs(urlparse(self.path).query)
+                platform_id = query.get("id", [""])[0]
+                if stub.latency_ms:
+                    time.sleep(stub.latency_ms / 1000)
+                rng = random.Random(f"{stub.seed}-{platform_id}-{time.time() // 60}")
+                items = [
+                    {
+                        "title": synthetic_title(rng),
+                        "url": f"https://example.com/{platform_id}/{i}",
+                        "mobileUrl": f"https://m.example.com/{platform_id}/{i}",
+                    }
+                    for i in range(stub.titles)
+                ]
+                body = json.dumps(
+                    {"status": "success", "items": items}, ensure_ascii=False
+                ).encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+        return Handler
+
+    def __enter__(self) -> "StubNewsnow":
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+
+
+def write_workspace(workspace: Path, args: argparse.Namespace, api_host: str) -> None:
+    """config/config.yaml and config/frequency_words.txt for the benchmark run"""
+    config_dir = workspace / "config"
+    config_dir.mkdir(parents=True, exist_ok=True)
+
+    platforms = "\n".join(
+        f'  - id: "{pid}"\n    name: "Platform {pid}"' for pid in platform_ids(args.platforms)
+    )
+    (config_dir / "config.yaml").write_text(
+        f"""app:
+  version_check_url: "{api_host}/version"
+  show_version_update: false
+crawler:
+  request_interval: 0
+  enable_crawler: true
+  use_proxy: false
+  default_proxy: ""
+  max_workers: {args.workers}
+  host_request_interval: 0
+report:
+  mode: "daily"
+  rank_threshold: 5
+notification:
+  enable_notification: false
+  message_batch_size: 4000
+  batch_send_interval: 0
+  feishu_message_separator: "---"
+weight:
+  rank_weight: 0.6
+  frequency_weight: 0.3
+  hotness_weight: 0.1
+platforms:
+{platforms}
+""",
+        encoding="utf-8",
+    )
+
+    rng = random.Random(args.seed)
+    groups = []
+    for i in range(args.groups):
+        words = rng.sample(_VOCABULARY, 2)
+        group = list(words)
+        if i % 5 == 0:
+            group.insert(0, "+" + rng.choice(_VOCABULARY))
+        if i % 7 == 0:
+            group.append("!" + rng.choice(_VOCABULARY))
+        groups.append("\n".join(group))
+    (config_dir / "frequency_words.txt").write_text(
+        "\n\n".join(groups) + "\n", encoding="utf-8"
+    )
+
+
+def write_history(workspace: Path, args: argparse.Namespace) -> int:
+    """
+    Synthetic output/<date>/txt batches for the last --days days
+
+    Each platform keeps a pool of stories per day; every batch ranks a random
+    subset of it, so titles recur across batches like real rankings do.
+    Today's batches are spread over the time before now so that the batch the
+    crawl stage writes is the latest. Returns the number of files written.
+    """
+    rng = random.Random(args.seed)
+    now = datetime.now(pytz.timezone("Asia/Shanghai"))
+    pids = platform_ids(args.platforms)
+    id_to_name = {pid: f"Platform {pid}" for pid in pids}
+    written = 0
+
+    for offset in range(args.days):
+        day = now - timedelta(days=offset)
+        txt_dir = workspace / "output" / day.strftime("%Y-%m-%d") / "txt"
+        txt_dir.mkdir(parents=True, exist_ok=True)
+
+        minutes_available = (now.hour * 60 + now.minute) if offset == 0 else 24 * 60
+        step = max(1, minutes_available // (args.batches + 1))
+        pools = {
+            pid: [synthetic_title(rng) for _ in range(args.titles * 2)] for pid in pids
+        }
+
+        for batch in range(args.batches):
+            minute = batch * step
+            if offset == 0 and minute >= minutes_available:
+                break
+            results = {}
+            for pid in pids:
+                picked = rng.sample(pools[pid], args.titles)
+                results[pid] = {
+                    title: {
+                        "ranks": [rank],
+                        "url": f"https://example.com/{pid}/{abs(hash(title))}",
+                        "mobileUrl": "",
+                    }
+                    for rank, title in enumerate(picked, 1)
+                }
+            filename = f"{minute // 60:02d}-{minute % 60:02d}.txt"
+            write_titles_file(txt_dir / filename, results, id_to_name, [])
+            written += 1
+
+    return written
+
+
+def time_stage(fn: Callable[[], object], repeat: int) -> Dict:
+    runs = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            fn()
+        runs.append(time.perf_counter() - start)
+    return {
+        "first": runs[0],
+        "min": min(runs),
+        "median": statistics.median(runs),
+        "mean": statistics.fmean(runs),
+        "runs": runs,
+    }
+
+
+def git_revision() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=REPO_ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_benchmark(args: argparse.Namespace, workspace: Path) -> Dict:
+    with StubNewsnow(args.titles, args.latency_ms, args.seed) as stub:
+        api_host = stub.url.split("/api/")[0]
+        write_workspace(workspace, args, api_host)
+        batch_files = write_history(workspace, args)
+
+        os.chdir(workspace)
+        os.environ["CONFIG_PATH"] = str(workspace / "config" / "config.yaml")
+        os.environ["FREQUENCY_WORDS_PATH"] = str(workspace / "config" / "frequency_words.txt")
+        # Keeps NewsAnalyzer.run from opening a browser
+        os.environ["DOCKER_CONTAINER"] = "true"
+        os.environ.pop("GITHUB_ACTIONS", None)
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            import main
+
+            main.DataFetcher.API_URL = stub.url
+            analyzer = main.NewsAnalyzer()
+
+        platform_list = platform_ids(args.platforms)
+        word_groups, filter_words = main.load_frequency_words()
+        stages: Dict[str, Dict] = {}
+
+        stages["crawl"] = time_stage(analyzer._crawl_data, args.repeat)
+
+        state: Dict = {}
+
+        def read_titles():
+            state["all"] = main.read_all_today_titles(platform_list)
+
+        stages["read_all_today_titles"] = time_stage(read_titles, args.repeat)
+        all_results, id_to_name, title_info = state["all"]
+        with contextlib.redirect_stdout(io.StringIO()):
+            new_titles = main.detect_latest_new_titles(platform_list)
+
+        def count():
+            state["stats"] = main.count_word_frequency(
+                all_results,
+                word_groups,
+                filter_words,
+                id_to_name,
+                title_info,
+                main.CONFIG["RANK_THRESHOLD"],
+                new_titles,
+                mode="daily",
+            )
+
+        stages["count_word_frequency"] = time_stage(count, args.repeat)
+        stats, total_titles = state["stats"]
+        report_data = main.prepare_report_data(
+            stats, [], new_titles, id_to_name, "daily"
+        )
+
+        stages["render_html_content"] = time_stage(
+            lambda: main.render_html_content(report_data, total_titles, True, "daily"),
+            args.repeat,
+        )
+
+        for format_type in SPLIT_FORMATS:
+            stages[f"split_content_into_batches[{format_type}]"] = time_stage(
+                lambda: main.split_content_into_batches(
+                    report_data, format_type, mode="daily"
+                ),
+                args.repeat,
+            )
+
+        if not args.skip_run:
+            stages["run"] = time_stage(analyzer.run, args.repeat)
+
+    return {
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "git_revision": git_revision(),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "parameters": {
+            "days": args.days,
+            "batches": args.batches,
+            "platforms": args.platforms,
+            "titles": args.titles,
+            "groups": args.groups,
+            "workers": args.workers,
+            "latency_ms": args.latency_ms,
+            "repeat": args.repeat,
+            "seed": args.seed,
+        },
+        "dataset": {
+            "batch_files": batch_files,
+            "today_titles": sum(len(titles) for titles in all_results.values()),
+            "word_groups": len(word_groups),
+            "matched_titles": sum(len(stat["titles"]) for stat in stats),
+        },
+        "stages": stages,
+    }
+
+
+def compare(result: Dict, baseline: Dict, fail_over: Optional[float]) -> bool:
+    """Print median changes against a baseline; False if a stage regressed past fail_over %"""
+    ok = True
+    if baseline.get("parameters") != result["parameters"]:
+        print("\nNote: baseline was run with different parameters:", baseline.get("parameters"))
+    print(f"\n{'stage':<45}{'baseline':>12}{'current':>12}{'change':>10}")
+    for name, stage in result["stages"].items():
+        old = baseline.get("stages", {}).get(name)
+        if not old:
+            print(f"{name:<45}{'-':>12}{stage['median']:>12.4f}{'new':>10}")
+            continue
+        change = (stage["median"] - old["median"]) / old["median"] * 100 if old["median"] else 0.0
+        flag = ""
+        if fail_over is not None and change > fail_over:
+            ok = False
+            flag = "  REGRESSION"
+        print(f"{name:<45}{old['median']:>12.4f}{stage['median']:>12.4f}{change:>9.1f}%{flag}")
+    return ok
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--days", type=int, default=3, help="days of history")
+    parser.add_argument("--batches", type=int, default=24, help="batches per day")
+    parser.add_argument("--platforms", type=int, default=11, help="platforms per batch")
+    parser.add_argument("--titles", type=int, default=50, help="titles per platform per batch")
+    parser.add_argument("--groups", type=int, default=100, help="frequency word groups")
+    parser.add_argument("--workers", type=int, default=8, help="crawler max_workers")
+    parser.add_argument("--latency-ms", type=int, default=0, help="stub API latency per request")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per stage")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--skip-run", action="store_true", help="skip the end-to-end run stage")
+    parser.add_argument("--workdir", help="workspace directory (default: a temp dir)")
+    parser.add_argument("--keep", action="store_true", help="keep the workspace afterwards")
+    parser.add_argument(
+        "--output", default="benchmark-results.json", help="JSON result file"
+    )
+    parser.add_argument("--baseline", help="earlier result file to compare against")
+    parser.add_argument(
+        "--fail-over",
+        type=float,
+        help="exit non-zero if a stage median is this many percent slower than the baseline",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
+    output = Path(args.output).resolve()
+    baseline = json.loads(Path(args.baseline).read_text(encoding="utf-8")) if args.baseline else None
+
+    if args.workdir:
+        workspace = Path(args.workdir).resolve()
+        if workspace.exists() and any(workspace.iterdir()):
+            print(f"Workspace {workspace} is not empty")
+            return 2
+        workspace.mkdir(parents=True, exist_ok=True)
+    else:
+        workspace = Path(tempfile.mkdtemp(prefix="newshawk-bench-"))
+
+    cwd = os.getcwd()
+    try:
+        result = run_benchmark(args, workspace)
+    finally:
+        os.chdir(cwd)
+        if not args.keep:
+            shutil.rmtree(workspace, ignore_errors=True)
+
+    output.write_text(json.dumps(result, indent=2, ensure_ascii=False), encoding="utf-8")
+
+    print(f"Dataset: {result['dataset']}")
+    print(f"{'stage':<45}{'first':>10}{'median':>10}{'min':>10}")
+    for name, stage in result["stages"].items():
+        print(f"{name:<45}{stage['first']:>10.4f}{stage['median']:>10.4f}{stage['min']:>10.4f}")
+    print(f"Results written to {output}")
+    if args.keep:
+        print(f"Workspace kept at {workspace}")
+
+    if baseline is not None and not compare(result, baseline, args.fail_over):
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
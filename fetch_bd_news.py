@@ -4,13 +4,14 @@ Bangladesh News Fetcher using NewsAPI
 Get your free API key from: https://newsapi.org/
 """
 
-import requests
 import json
 import os
 from datetime import datetime
 from pathlib import Path
 from dotenv import load_dotenv
 
+from newshawk.http_pool import get_pool
+
 # Load environment variables from docker/.env file
 load_dotenv("docker/.env")
 
@@ -49,7 +50,7 @@ def fetch_bangladesh_news(api_key, keywords, sources=None, page_size=50):
         params["sources"] = sources
     
     try:
-        response = requests.get(url, params=params, timeout=10)
+        response = get_pool().get(url, params=params, timeout=10)
         response.raise_for_status()
         return response.json()
     except Exception as e:
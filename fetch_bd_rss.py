@@ -10,6 +10,8 @@ import json
 from datetime import datetime
 from pathlib import Path
 
+from newshawk.http_pool import get_pool
+
 # Bangladesh news RSS feeds - VERIFIED WORKING FEEDS ONLY
 # Last tested: 2025-12-20
 BD_RSS_FEEDS = [
@@ -57,7 +59,9 @@ def fetch_rss_feed(feed_info):
     """Fetch and parse RSS feed"""
     try:
         print(f"  Fetching from {feed_info['name']}...", end=" ")
-        feed = feedparser.parse(feed_info['url'])
+        response = get_pool().get(feed_info['url'], timeout=15)
+        response.raise_for_status()
+        feed = feedparser.parse(response.content)
         
         articles = []
         for entry in feed.entries[:30]:  # Get top 30 from each source (increased from 20)
@@ -176,6 +180,9 @@ def main():
     
     print(f"\n📊 Total articles fetched: {len(all_articles)}")
     
+    for line in get_pool().metrics.format_summary():
+        print(f"⏱️  {line}")
+    
     if all_articles:
         # Save without filtering (get all news)
         save_articles(all_articles, use_filter=False)
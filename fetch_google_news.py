@@ -12,6 +12,8 @@ from pathlib import Path
 from typing import List, Dict
 from email.utils import parsedate_to_datetime
 
+from newshawk.http_pool import get_pool
+
 # Google News RSS feeds for Bangladesh - LATEST NEWS ONLY (past 24 hours)
 # Adding when:1d parameter to get only news from last 24 hours
 # Includes both English and Bangla (বাংলা) language feeds
@@ -97,7 +99,9 @@ def is_recent_article(published_date_str: str, max_hours: int = MAX_ARTICLE_AGE_
 def fetch_rss_feed(feed_url: str, filter_recent: bool = True) -> List[Dict]:
     """Fetch and parse RSS feed, optionally filtering for recent articles only"""
     try:
-        feed = feedparser.parse(feed_url)
+        response = get_pool().get(feed_url, timeout=15)
+        response.raise_for_status()
+        feed = feedparser.parse(response.content)
         articles = []
         filtered_count = 0
         
@@ -198,6 +202,9 @@ def main():
         else:
             print(f"⚠️  0 articles")
     
+    for line in get_pool().metrics.format_summary():
+        print(f"⏱️  {line}")
+    
     if all_articles:
         save_articles(all_articles, output_dir)
     else:
@@ -1,24 +1,38 @@
 # coding=utf-8
 
+import hashlib
+import heapq
+import itertools
 import json
 import os
+import queue
 import random
 import re
+import shutil
+import threading
 import time
 import webbrowser
 import smtplib
+import sqlite3
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from email.header import Header
 from email.utils import formataddr, formatdate, make_msgid
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional, Union
+from typing import Dict, Iterator, List, Tuple, Optional, Union
+from urllib.parse import urlparse
 
 import pytz
 import requests
 import yaml
 
+from newshawk.http_pool import configure_pool
+from newshawk.parser import list_batch_files, parse_titles_file, write_titles_file
+from newshawk.similarity import cluster_near_duplicates
+from newshawk.wordmatch import WordGroupMatcher
+
 
 VERSION = "3.4.1"
 
@@ -73,6 +87,14 @@ def load_config():
         "VERSION_CHECK_URL": config_data["app"]["version_check_url"],
         "SHOW_VERSION_UPDATE": config_data["app"]["show_version_update"],
         "REQUEST_INTERVAL": config_data["crawler"]["request_interval"],
+        # 并发抓取：max_workers <= 1 时退回逐个抓取 + request_interval 间隔
+        "MAX_CRAWL_WORKERS": int(
+            os.environ.get("MAX_CRAWL_WORKERS", "").strip()
+            or config_data["crawler"].get("max_workers", 8)
+        ),
+        "HOST_REQUEST_INTERVAL": config_data["crawler"].get(
+            "host_request_interval", 100
+        ),
         "REPORT_MODE": os.environ.get("REPORT_MODE", "").strip()
         or config_data["report"]["mode"],
         "RANK_THRESHOLD": config_data["report"]["rank_threshold"],
@@ -84,6 +106,11 @@ def load_config():
             os.environ.get("MAX_NEWS_PER_KEYWORD", "").strip() or "0"
         )
         or config_data["report"].get("max_news_per_keyword", 0),
+        # 跨平台近似重复标题合并（MinHash/LSH），阈值为字符 bigram Jaccard 相似度
+        "CLUSTER_SIMILAR_TITLES": config_data["report"].get(
+            "cluster_similar_titles", True
+        ),
+        "CLUSTER_THRESHOLD": config_data["report"].get("cluster_threshold", 0.5),
         "USE_PROXY": config_data["crawler"]["use_proxy"],
         "DEFAULT_PROXY": config_data["crawler"]["default_proxy"],
         "ENABLE_CRAWLER": os.environ.get("ENABLE_CRAWLER", "").strip().lower()
@@ -102,6 +129,11 @@ def load_config():
         "BARK_BATCH_SIZE": config_data["notification"].get("bark_batch_size", 3600),
         "SLACK_BATCH_SIZE": config_data["notification"].get("slack_batch_size", 4000),
         "BATCH_SEND_INTERVAL": config_data["notification"]["batch_send_interval"],
+        # 各渠道批次间隔（秒），未配置的渠道使用 batch_send_interval
+        "CHANNEL_SEND_INTERVALS": config_data["notification"].get(
+            "channel_send_intervals", {}
+        )
+        or {},
         "FEISHU_MESSAGE_SEPARATOR": config_data["notification"][
             "feishu_message_separator"
         ],
@@ -254,6 +286,9 @@ CONFIG = load_config()
 print(f"TrendRadar v{VERSION} configuration loaded")
 print(f"Number of monitored platforms: {len(CONFIG['PLATFORMS'])}")
 
+# 抓取、版本检查、各通知渠道共用的 keep-alive 连接池
+HTTP_POOL = configure_pool(pool_maxsize=max(4, CONFIG["MAX_CRAWL_WORKERS"]))
+
 
 # === Utility Functions ===
 def get_beijing_time():
@@ -299,9 +334,6 @@ def check_version_update(
 ) -> Tuple[bool, Optional[str]]:
     """Check version update"""
     try:
-        proxies = None
-        if proxy_url:
-            proxies = {"http": proxy_url, "https": proxy_url}
 
         headers = {
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
@@ -309,8 +341,8 @@ def check_version_update(
             "Cache-Control": "no-cache",
         }
 
-        response = requests.get(
-            version_url, proxies=proxies, headers=headers, timeout=10
+        response = HTTP_POOL.get(
+            version_url, proxy_url=proxy_url, headers=headers, timeout=10
         )
         response.raise_for_status()
 
@@ -346,7 +378,7 @@ def is_first_crawl_today() -> bool:
     if not txt_dir.exists():
         return True
 
-    files = sorted([f for f in txt_dir.iterdir() if f.suffix == ".txt"])
+    files = list_batch_files(txt_dir)
     return len(files) <= 1
 
 
@@ -468,11 +500,87 @@ class PushRecordManager:
 
 
 # === Data Fetching ===
+class HostRateLimiter:
+    """按主机限速：同一主机相邻两次请求至少间隔 min_interval_ms 毫秒（线程安全）"""
+
+    def __init__(self, min_interval_ms: int):
+        self.min_interval = max(0, min_interval_ms) / 1000
+        self._lock = threading.Lock()
+        self._next_slot: Dict[str, float] = {}
+
+    def acquire(self, host: str) -> None:
+        """预约该主机的下一个请求时间片，并等待到达"""
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot.get(host, now))
+            interval = 0.0
+            if self.min_interval > 0:
+                interval = max(0.0, self.min_interval + random.randint(-10, 20) / 1000)
+            self._next_slot[host] = slot + interval
+
+        delay = slot - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+
+
 class DataFetcher:
     """Data Fetching器"""
 
-    def __init__(self, proxy_url: Optional[str] = None):
+    API_URL = "https://newsnow.busiyi.world/api/s?id={}&latest"
+
+    HEADERS = {
+        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
+        "Accept": "application/json, text/plain, */*",
+        "Accept-Language": "zh-CN,zh;q=0.9,en;q=0.8",
+        "Connection": "keep-alive",
+        "Cache-Control": "no-cache",
+    }
+
+    def __init__(
+        self,
+        proxy_url: Optional[str] = None,
+        max_workers: int = CONFIG["MAX_CRAWL_WORKERS"],
+        host_request_interval: int = CONFIG["HOST_REQUEST_INTERVAL"],
+    ):
         self.proxy_url = proxy_url
+        self.max_workers = max(1, max_workers)
+        self.rate_limiter = HostRateLimiter(host_request_interval)
+
+    @staticmethod
+    def _split_id_info(id_info: Union[str, Tuple[str, str]]) -> Tuple[str, str]:
+        """拆分 id 或 (id, 名称)"""
+        if isinstance(id_info, tuple):
+            return id_info[0], id_info[1]
+        return id_info, id_info
+
+    @staticmethod
+    def _retry_wait(retries: int, min_retry_wait: int, max_retry_wait: int) -> float:
+        """第 retries 次重试前的等待秒数"""
+        base_wait = random.uniform(min_retry_wait, max_retry_wait)
+        additional_wait = (retries - 1) * random.uniform(1, 2)
+        return base_wait + additional_wait
+
+    def _fetch_once(self, id_value: str, rate_limited: bool = False) -> str:
+        """请求一次指定平台，失败抛出异常"""
+        url = self.API_URL.format(id_value)
+        if rate_limited:
+            self.rate_limiter.acquire(urlparse(url).netloc)
+
+        response = HTTP_POOL.get(
+            url, proxy_url=self.proxy_url, headers=self.HEADERS, timeout=10
+        )
+        response.raise_for_status()
+
+        data_text = response.text
+        data_json = json.loads(data_text)
+
+        status = data_json.get("status", "unknown")
+        if status not in ["success", "cache"]:
+            raise ValueError(f"Response status error: {status}")
+
+        status_info = "latest data" if status == "success" else "cached data"
+        print(f"Fetch {id_value} success（{status_info}）")
+        return data_text
 
     def fetch_data(
         self,
@@ -482,51 +590,17 @@ class DataFetcher:
         max_retry_wait: int = 5,
     ) -> Tuple[Optional[str], str, str]:
         """Fetch data for specified ID, with retry support"""
-        if isinstance(id_info, tuple):
-            id_value, alias = id_info
-        else:
-            id_value = id_info
-            alias = id_value
-
-        url = f"https://newsnow.busiyi.world/api/s?id={id_value}&latest"
-
-        proxies = None
-        if self.proxy_url:
-            proxies = {"http": self.proxy_url, "https": self.proxy_url}
-
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
-            "Accept": "application/json, text/plain, */*",
-            "Accept-Language": "zh-CN,zh;q=0.9,en;q=0.8",
-            "Connection": "keep-alive",
-            "Cache-Control": "no-cache",
-        }
+        id_value, alias = self._split_id_info(id_info)
 
         retries = 0
         while retries <= max_retries:
             try:
-                response = requests.get(
-                    url, proxies=proxies, headers=headers, timeout=10
-                )
-                response.raise_for_status()
-
-                data_text = response.text
-                data_json = json.loads(data_text)
-
-                status = data_json.get("status", "unknown")
-                if status not in ["success", "cache"]:
-                    raise ValueError(f"Response status error: {status}")
-
-                status_info = "latest data" if status == "success" else "cached data"
-                print(f"Fetch {id_value} success（{status_info}）")
-                return data_text, id_value, alias
+                return self._fetch_once(id_value), id_value, alias
 
             except Exception as e:
                 retries += 1
                 if retries <= max_retries:
-                    base_wait = random.uniform(min_retry_wait, max_retry_wait)
-                    additional_wait = (retries - 1) * random.uniform(1, 2)
-                    wait_time = base_wait + additional_wait
+                    wait_time = self._retry_wait(retries, min_retry_wait, max_retry_wait)
                     print(f"Request {id_value} failed: {e}. {wait_time:.2f}seconds, retrying...")
                     time.sleep(wait_time)
                 else:
@@ -534,6 +608,101 @@ class DataFetcher:
                     return None, id_value, alias
         return None, id_value, alias
 
+    @staticmethod
+    def _parse_items(response: str) -> Dict:
+        """解析接口响应为 {title: {ranks, url, mobileUrl}}"""
+        data = json.loads(response)
+        title_data = {}
+        for index, item in enumerate(data.get("items", []), 1):
+            title = item.get("title")
+            # Skip invalid titles (None, float, empty string)
+            if title is None or isinstance(title, float) or not str(title).strip():
+                continue
+            title = str(title).strip()
+            url = item.get("url", "")
+            mobile_url = item.get("mobileUrl", "")
+
+            if title in title_data:
+                title_data[title]["ranks"].append(index)
+            else:
+                title_data[title] = {
+                    "ranks": [index],
+                    "url": url,
+                    "mobileUrl": mobile_url,
+                }
+        return title_data
+
+    def _collect_result(
+        self, id_value: str, response: Optional[str], results: Dict, failed_ids: List
+    ) -> None:
+        """把单个平台的响应写入 results / failed_ids"""
+        if not response:
+            failed_ids.append(id_value)
+            return
+        try:
+            results[id_value] = self._parse_items(response)
+        except json.JSONDecodeError:
+            print(f"Parse {id_value} 响应failed")
+            failed_ids.append(id_value)
+        except Exception as e:
+            print(f"Process {id_value} data error: {e}")
+            failed_ids.append(id_value)
+
+    def _fetch_all_concurrent(
+        self,
+        id_values: List[str],
+        max_retries: int = 2,
+        min_retry_wait: int = 3,
+        max_retry_wait: int = 5,
+    ) -> Dict[str, Optional[str]]:
+        """有界并发抓取；重试退避通过定时重新提交实现，不占用工作线程"""
+        responses: Dict[str, Optional[str]] = {}
+        attempts = {id_value: 0 for id_value in id_values}
+        retry_queue: List[Tuple[float, int, str]] = []
+        sequence = itertools.count()
+
+        workers = min(self.max_workers, len(id_values))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            running = {
+                executor.submit(self._fetch_once, id_value, True): id_value
+                for id_value in id_values
+            }
+
+            while running or retry_queue:
+                now = time.monotonic()
+                while retry_queue and retry_queue[0][0] <= now:
+                    _, _, id_value = heapq.heappop(retry_queue)
+                    running[executor.submit(self._fetch_once, id_value, True)] = id_value
+
+                timeout = None
+                if retry_queue:
+                    timeout = max(0.0, retry_queue[0][0] - time.monotonic())
+                if not running:
+                    time.sleep(timeout)
+                    continue
+
+                done, _ = wait(running, timeout=timeout, return_when=FIRST_COMPLETED)
+                for future in done:
+                    id_value = running.pop(future)
+                    try:
+                        responses[id_value] = future.result()
+                    except Exception as e:
+                        attempts[id_value] += 1
+                        if attempts[id_value] <= max_retries:
+                            wait_time = self._retry_wait(
+                                attempts[id_value], min_retry_wait, max_retry_wait
+                            )
+                            print(f"Request {id_value} failed: {e}. {wait_time:.2f}seconds, retrying...")
+                            heapq.heappush(
+                                retry_queue,
+                                (time.monotonic() + wait_time, next(sequence), id_value),
+                            )
+                        else:
+                            print(f"Request {id_value} failed: {e}")
+                            responses[id_value] = None
+
+        return responses
+
     def crawl_websites(
         self,
         ids_list: List[Union[str, Tuple[str, str]]],
@@ -544,50 +713,25 @@ class DataFetcher:
         id_to_name = {}
         failed_ids = []
 
-        for i, id_info in enumerate(ids_list):
-            if isinstance(id_info, tuple):
-                id_value, name = id_info
-            else:
-                id_value = id_info
-                name = id_value
-
+        entries = [self._split_id_info(id_info) for id_info in ids_list]
+        for id_value, name in entries:
             id_to_name[id_value] = name
-            response, _, _ = self.fetch_data(id_info)
 
-            if response:
-                try:
-                    data = json.loads(response)
-                    results[id_value] = {}
-                    for index, item in enumerate(data.get("items", []), 1):
-                        title = item.get("title")
-                        # Skip invalid titles (None, float, empty string)
-                        if title is None or isinstance(title, float) or not str(title).strip():
-                            continue
-                        title = str(title).strip()
-                        url = item.get("url", "")
-                        mobile_url = item.get("mobileUrl", "")
-
-                        if title in results[id_value]:
-                            results[id_value][title]["ranks"].append(index)
-                        else:
-                            results[id_value][title] = {
-                                "ranks": [index],
-                                "url": url,
-                                "mobileUrl": mobile_url,
-                            }
-                except json.JSONDecodeError:
-                    print(f"Parse {id_value} 响应failed")
-                    failed_ids.append(id_value)
-                except Exception as e:
-                    print(f"Process {id_value} data error: {e}")
-                    failed_ids.append(id_value)
-            else:
-                failed_ids.append(id_value)
+        if self.max_workers > 1 and len(entries) > 1:
+            # 并发模式：按主机限速代替全局 request_interval 间隔
+            responses = self._fetch_all_concurrent([id_value for id_value, _ in entries])
+            for id_value, _ in entries:
+                self._collect_result(id_value, responses.get(id_value), results, failed_ids)
+        else:
+            for i, id_info in enumerate(ids_list):
+                id_value = entries[i][0]
+                response, _, _ = self.fetch_data(id_info)
+                self._collect_result(id_value, response, results, failed_ids)
 
-            if i < len(ids_list) - 1:
-                actual_interval = request_interval + random.randint(-10, 20)
-                actual_interval = max(50, actual_interval)
-                time.sleep(actual_interval / 1000)
+                if i < len(ids_list) - 1:
+                    actual_interval = request_interval + random.randint(-10, 20)
+                    actual_interval = max(50, actual_interval)
+                    time.sleep(actual_interval / 1000)
 
         print(f"success: {list(results.keys())}, failed: {failed_ids}")
         return results, id_to_name, failed_ids
@@ -595,53 +739,40 @@ class DataFetcher:
 
 # === Data Processing ===
 def save_titles_to_file(results: Dict, id_to_name: Dict, failed_ids: List) -> str:
-    """Save titles to file"""
+    """Save titles to file（同时写入结构化快照）"""
     file_path = get_output_path("txt", f"{format_time_filename()}.txt")
+    write_titles_file(Path(file_path), results, id_to_name, failed_ids)
+    return file_path
 
-    with open(file_path, "w", encoding="utf-8") as f:
-        for id_value, title_data in results.items():
-            # id | name 或 id
-            name = id_to_name.get(id_value)
-            if name and name != id_value:
-                f.write(f"{id_value} | {name}\n")
-            else:
-                f.write(f"{id_value}\n")
-
-            # 按排名排序标题
-            sorted_titles = []
-            for title, info in title_data.items():
-                cleaned_title = clean_title(title)
-                if isinstance(info, dict):
-                    ranks = info.get("ranks", [])
-                    url = info.get("url", "")
-                    mobile_url = info.get("mobileUrl", "")
-                else:
-                    ranks = info if isinstance(info, list) else []
-                    url = ""
-                    mobile_url = ""
-
-                rank = ranks[0] if ranks else 1
-                sorted_titles.append((rank, cleaned_title, url, mobile_url))
-
-            sorted_titles.sort(key=lambda x: x[0])
 
-            for rank, cleaned_title, url, mobile_url in sorted_titles:
-                line = f"{rank}. {cleaned_title}"
+# 频率词文件Parse结果：路径 -> ((mtime_ns, size), word_groups, filter_words)
+_FREQUENCY_WORDS_CACHE: Dict[str, Tuple] = {}
 
-                if url:
-                    line += f" [URL:{url}]"
-                if mobile_url:
-                    line += f" [MOBILE:{mobile_url}]"
-                f.write(line + "\n")
+# 最近一次编译的词组匹配器，按 word_groups / filter_words 对象身份复用
+_WORD_MATCHER_CACHE: Dict[str, object] = {"groups": None, "filters": None, "matcher": None}
+_WORD_MATCHER_LOCK = threading.Lock()
 
-            f.write("\n")
 
-        if failed_ids:
-            f.write("==== 以下IDRequestfailed ====\n")
-            for id_value in failed_ids:
-                f.write(f"{id_value}\n")
+def get_word_group_matcher(
+    word_groups: List[Dict], filter_words: List[str]
+) -> WordGroupMatcher:
+    """Fetch（必要时编译）词组匹配器
 
-    return file_path
+    load_frequency_words 在文件不变时返回同一对象，通常只需比较对象身份；
+    调用方自行构造的等值列表按内容比较后同样复用。
+    """
+    cached = _WORD_MATCHER_CACHE
+    if cached["groups"] is word_groups and cached["filters"] is filter_words:
+        return cached["matcher"]
+
+    with _WORD_MATCHER_LOCK:
+        if cached["groups"] == word_groups and cached["filters"] == filter_words:
+            return cached["matcher"]
+        matcher = WordGroupMatcher(word_groups, filter_words)
+        cached.update(
+            {"groups": word_groups, "filters": filter_words, "matcher": matcher}
+        )
+        return matcher
 
 
 def load_frequency_words(
@@ -657,9 +788,25 @@ def load_frequency_words(
     if not frequency_path.exists():
         raise FileNotFoundError(f"Frequency word file {frequency_file} does not exist")
 
+    # 文件未变化时返回同一份结果（同一对象），编译好的匹配器随之复用
+    stat = frequency_path.stat()
+    cache_key = str(frequency_path.resolve())
+    signature = (stat.st_mtime_ns, stat.st_size)
+    cached = _FREQUENCY_WORDS_CACHE.get(cache_key)
+    if cached is not None and cached[0] == signature:
+        return cached[1], cached[2]
+
     with open(frequency_path, "r", encoding="utf-8") as f:
         content = f.read()
 
+    processed_groups, filter_words = _parse_frequency_words(content)
+    _FREQUENCY_WORDS_CACHE[cache_key] = (signature, processed_groups, filter_words)
+    get_word_group_matcher(processed_groups, filter_words)
+    return processed_groups, filter_words
+
+
+def _parse_frequency_words(content: str) -> Tuple[List[Dict], List[str]]:
+    """Parse频率词文件内容"""
     word_groups = [group.strip() for group in content.split("\n\n") if group.strip()]
 
     processed_groups = []
@@ -709,73 +856,255 @@ def load_frequency_words(
 
 
 def parse_file_titles(file_path: Path) -> Tuple[Dict, Dict]:
-    """Parse单个txt文件的标题数据，返回(titles_by_id, id_to_name)"""
-    titles_by_id = {}
-    id_to_name = {}
+    """Parse单个txt文件的标题数据，返回(titles_by_id, id_to_name)
 
-    with open(file_path, "r", encoding="utf-8") as f:
-        content = f.read()
-        sections = content.split("\n\n")
+    优先读取快照；同一文件在进程内只Parse一次（按 mtime/size 缓存）。
+    """
+    return parse_titles_file(file_path)
+
+
+class TitleIndex:
+    """当日标题增量索引（SQLite 旁路文件 output/<日期>/title_index.db）
+
+    每个 txt batch 只Parse一次并合并进 title -> {first_time, last_time, count, ranks, url}，
+    之后的读取只需增量入库新 batch。已入库文件被改写且内容变化、被删除或
+    出现比已入库文件更早的新文件时，整体重建。
+    """
 
-        for section in sections:
-            if not section.strip() or "==== 以下IDRequestfailed ====" in section:
+    SCHEMA_VERSION = "1"
+
+    def __init__(self, txt_dir: Path, db_path: Optional[Path] = None):
+        self.txt_dir = Path(txt_dir)
+        self.db_path = Path(db_path) if db_path else self.txt_dir.parent / "title_index.db"
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(str(self.db_path))
+        conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+            CREATE TABLE IF NOT EXISTS files (
+                name TEXT PRIMARY KEY, mtime_ns INTEGER, size INTEGER, digest TEXT
+            );
+            CREATE TABLE IF NOT EXISTS platforms (
+                seq INTEGER PRIMARY KEY AUTOINCREMENT, id TEXT UNIQUE, name TEXT
+            );
+            CREATE TABLE IF NOT EXISTS titles (
+                seq INTEGER PRIMARY KEY AUTOINCREMENT,
+                source_id TEXT, title TEXT,
+                first_time TEXT, last_time TEXT, count INTEGER,
+                ranks TEXT, url TEXT, mobile_url TEXT,
+                UNIQUE (source_id, title)
+            );
+            """
+        )
+        row = conn.execute("SELECT value FROM meta WHERE key = 'schema'").fetchone()
+        if row is None or row[0] != self.SCHEMA_VERSION:
+            self._clear(conn)
+            conn.execute(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES ('schema', ?)",
+                (self.SCHEMA_VERSION,),
+            )
+            conn.commit()
+        return conn
+
+    @staticmethod
+    def _clear(conn: sqlite3.Connection) -> None:
+        conn.execute("DELETE FROM files")
+        conn.execute("DELETE FROM platforms")
+        conn.execute("DELETE FROM titles")
+
+    @staticmethod
+    def _digest(file_path: Path) -> str:
+        return hashlib.sha1(file_path.read_bytes()).hexdigest()
+
+    def _list_files(self) -> List[Path]:
+        return list_batch_files(self.txt_dir)
+
+    def _needs_rebuild(
+        self, conn: sqlite3.Connection, files: List[Path], known: Dict[str, Tuple]
+    ) -> bool:
+        """检查已入库文件是否仍与磁盘一致"""
+        names = {f.name for f in files}
+        if any(name not in names for name in known):
+            return True
+
+        new_names = [f.name for f in files if f.name not in known]
+        if new_names and known and min(new_names) < max(known):
+            return True
+
+        for file_path in files:
+            if file_path.name not in known:
+                continue
+            mtime_ns, size, digest = known[file_path.name]
+            stat = file_path.stat()
+            if (stat.st_mtime_ns, stat.st_size) == (mtime_ns, size):
                 continue
+            # 同一分钟内重复保存会改写文件，内容不变时只刷新 mtime
+            if self._digest(file_path) != digest:
+                return True
+            conn.execute(
+                "UPDATE files SET mtime_ns = ?, size = ? WHERE name = ?",
+                (stat.st_mtime_ns, stat.st_size, file_path.name),
+            )
+        return False
+
+    def _ingest(self, conn: sqlite3.Connection, file_path: Path) -> None:
+        """把一个 batch 文件合并进索引"""
+        stat = file_path.stat()
+        digest = self._digest(file_path)
+        time_info = file_path.stem
+        titles_by_id, id_to_name = parse_file_titles(file_path)
+
+        for source_id, name in id_to_name.items():
+            updated = conn.execute(
+                "UPDATE platforms SET name = ? WHERE id = ?", (name, source_id)
+            ).rowcount
+            if not updated:
+                conn.execute(
+                    "INSERT INTO platforms (id, name) VALUES (?, ?)", (source_id, name)
+                )
+
+        for source_id, title_data in titles_by_id.items():
+            for title, data in title_data.items():
+                ranks = data.get("ranks", [])
+                url = data.get("url", "")
+                mobile_url = data.get("mobileUrl", "")
+
+                row = conn.execute(
+                    "SELECT ranks, url, mobile_url FROM titles WHERE source_id = ? AND title = ?",
+                    (source_id, title),
+                ).fetchone()
+                if row is None:
+                    conn.execute(
+                        "INSERT INTO titles (source_id, title, first_time, last_time, count, ranks, url, mobile_url)"
+                        " VALUES (?, ?, ?, ?, 1, ?, ?, ?)",
+                        (source_id, title, time_info, time_info, json.dumps(ranks), url, mobile_url),
+                    )
+                    continue
+
+                merged_ranks = json.loads(row[0])
+                for rank in ranks:
+                    if rank not in merged_ranks:
+                        merged_ranks.append(rank)
+                conn.execute(
+                    "UPDATE titles SET last_time = ?, count = count + 1, ranks = ?, url = ?, mobile_url = ?"
+                    " WHERE source_id = ? AND title = ?",
+                    (
+                        time_info,
+                        json.dumps(merged_ranks),
+                        row[1] or url,
+                        row[2] or mobile_url,
+                        source_id,
+                        title,
+                    ),
+                )
+
+        conn.execute(
+            "INSERT OR REPLACE INTO files (name, mtime_ns, size, digest) VALUES (?, ?, ?, ?)",
+            (file_path.name, stat.st_mtime_ns, stat.st_size, digest),
+        )
+
+    def sync(self, conn: sqlite3.Connection) -> List[str]:
+        """增量入库新 batch，返回当前全部 batch 文件名（按时间排序）"""
+        files = self._list_files()
+        known = {
+            name: (mtime_ns, size, digest)
+            for name, mtime_ns, size, digest in conn.execute(
+                "SELECT name, mtime_ns, size, digest FROM files"
+            )
+        }
+
+        with conn:
+            if self._needs_rebuild(conn, files, known):
+                self._clear(conn)
+                known = {}
 
-            lines = section.strip().split("\n")
-            if len(lines) < 2:
+        for file_path in files:
+            if file_path.name in known:
                 continue
+            with conn:
+                self._ingest(conn, file_path)
 
-            # id | name 或 id
-            header_line = lines[0].strip()
-            if " | " in header_line:
-                parts = header_line.split(" | ", 1)
-                source_id = parts[0].strip()
-                name = parts[1].strip()
-                id_to_name[source_id] = name
-            else:
-                source_id = header_line
-                id_to_name[source_id] = source_id
+        return [f.name for f in files]
 
-            titles_by_id[source_id] = {}
+    def load(
+        self, current_platform_ids: Optional[List[str]] = None
+    ) -> Tuple[Dict, Dict, Dict]:
+        """读取当天合并后的标题数据，返回 (all_results, id_to_name, title_info)"""
+        conn = self._connect()
+        try:
+            self.sync(conn)
+            platform_filter = (
+                set(current_platform_ids) if current_platform_ids is not None else None
+            )
 
-            for line in lines[1:]:
-                if line.strip():
-                    try:
-                        title_part = line.strip()
-                        rank = None
-
-                        # 提取排名
-                        if ". " in title_part and title_part.split(". ")[0].isdigit():
-                            rank_str, title_part = title_part.split(". ", 1)
-                            rank = int(rank_str)
-
-                        # 提取 MOBILE URL
-                        mobile_url = ""
-                        if " [MOBILE:" in title_part:
-                            title_part, mobile_part = title_part.rsplit(" [MOBILE:", 1)
-                            if mobile_part.endswith("]"):
-                                mobile_url = mobile_part[:-1]
-
-                        # 提取 URL
-                        url = ""
-                        if " [URL:" in title_part:
-                            title_part, url_part = title_part.rsplit(" [URL:", 1)
-                            if url_part.endswith("]"):
-                                url = url_part[:-1]
-
-                        title = clean_title(title_part.strip())
-                        ranks = [rank] if rank is not None else [1]
-
-                        titles_by_id[source_id][title] = {
-                            "ranks": ranks,
-                            "url": url,
-                            "mobileUrl": mobile_url,
-                        }
+            id_to_name = {}
+            for source_id, name in conn.execute(
+                "SELECT id, name FROM platforms ORDER BY seq"
+            ):
+                if platform_filter is None or source_id in platform_filter:
+                    id_to_name[source_id] = name
+
+            all_results = {}
+            title_info = {}
+            rows = conn.execute(
+                "SELECT t.source_id, t.title, t.first_time, t.last_time, t.count,"
+                " t.ranks, t.url, t.mobile_url"
+                " FROM titles t JOIN platforms p ON p.id = t.source_id"
+                " ORDER BY p.seq, t.seq"
+            )
+            for source_id, title, first_time, last_time, count, ranks, url, mobile_url in rows:
+                if platform_filter is not None and source_id not in platform_filter:
+                    continue
+                ranks = json.loads(ranks)
+                all_results.setdefault(source_id, {})[title] = {
+                    "ranks": ranks,
+                    "url": url,
+                    "mobileUrl": mobile_url,
+                }
+                title_info.setdefault(source_id, {})[title] = {
+                    "first_time": first_time,
+                    "last_time": last_time,
+                    "count": count,
+                    "ranks": ranks,
+                    "url": url,
+                    "mobileUrl": mobile_url,
+                }
+            return all_results, id_to_name, title_info
+        finally:
+            conn.close()
 
-                    except Exception as e:
-                        print(f"Parse标题行出错: {line}, 错误: {e}")
+    def latest_new_titles(self, current_platform_ids: Optional[List[str]] = None) -> Dict:
+        """最新 batch 中首次出现的标题"""
+        conn = self._connect()
+        try:
+            file_names = self.sync(conn)
+            if len(file_names) < 2:
+                return {}
+
+            latest_time = Path(file_names[-1]).stem
+            platform_filter = (
+                set(current_platform_ids) if current_platform_ids is not None else None
+            )
 
-    return titles_by_id, id_to_name
+            new_titles = {}
+            rows = conn.execute(
+                "SELECT t.source_id, t.title, t.ranks, t.url, t.mobile_url"
+                " FROM titles t JOIN platforms p ON p.id = t.source_id"
+                " WHERE t.first_time = ? ORDER BY p.seq, t.seq",
+                (latest_time,),
+            )
+            for source_id, title, ranks, url, mobile_url in rows:
+                if platform_filter is not None and source_id not in platform_filter:
+                    continue
+                new_titles.setdefault(source_id, {})[title] = {
+                    "ranks": json.loads(ranks),
+                    "url": url,
+                    "mobileUrl": mobile_url,
+                }
+            return new_titles
+        finally:
+            conn.close()
 
 
 def read_all_today_titles(
@@ -788,11 +1117,22 @@ def read_all_today_titles(
     if not txt_dir.exists():
         return {}, {}, {}
 
+    try:
+        return TitleIndex(txt_dir).load(current_platform_ids)
+    except sqlite3.Error as e:
+        print(f"标题索引不可用，逐文件Parse: {e}")
+        return _read_titles_from_files(txt_dir, current_platform_ids)
+
+
+def _read_titles_from_files(
+    txt_dir: Path, current_platform_ids: Optional[List[str]] = None
+) -> Tuple[Dict, Dict, Dict]:
+    """逐个Parse txt 文件合并标题（标题索引不可用时的回退路径）"""
     all_results = {}
     final_id_to_name = {}
     title_info = {}
 
-    files = sorted([f for f in txt_dir.iterdir() if f.suffix == ".txt"])
+    files = list_batch_files(txt_dir)
 
     for file_path in files:
         time_info = file_path.stem
@@ -903,7 +1243,18 @@ def detect_latest_new_titles(current_platform_ids: Optional[List[str]] = None) -
     if not txt_dir.exists():
         return {}
 
-    files = sorted([f for f in txt_dir.iterdir() if f.suffix == ".txt"])
+    try:
+        return TitleIndex(txt_dir).latest_new_titles(current_platform_ids)
+    except sqlite3.Error as e:
+        print(f"标题索引不可用，逐文件Parse: {e}")
+        return _detect_new_titles_from_files(txt_dir, current_platform_ids)
+
+
+def _detect_new_titles_from_files(
+    txt_dir: Path, current_platform_ids: Optional[List[str]] = None
+) -> Dict:
+    """逐个Parse txt 文件检测新增标题（标题索引不可用时的回退路径）"""
+    files = list_batch_files(txt_dir)
     if len(files) < 2:
         return {}
 
@@ -994,47 +1345,8 @@ def calculate_news_weight(
 def matches_word_groups(
     title: str, word_groups: List[Dict], filter_words: List[str]
 ) -> bool:
-    """检查标题是否匹配词组规则"""
-    # 防御性类型检查：确保 title 是有效字符串
-    if not isinstance(title, str):
-        title = str(title) if title is not None else ""
-    if not title.strip():
-        return False
-
-    # 如果没有配置词组，则匹配All标题（支持显示All News）
-    if not word_groups:
-        return True
-
-    title_lower = title.lower()
-
-    # 过滤词检查
-    if any(filter_word.lower() in title_lower for filter_word in filter_words):
-        return False
-
-    # 词组匹配检查
-    for group in word_groups:
-        required_words = group["required"]
-        normal_words = group["normal"]
-
-        # 必须词检查
-        if required_words:
-            all_required_present = all(
-                req_word.lower() in title_lower for req_word in required_words
-            )
-            if not all_required_present:
-                continue
-
-        # 普通词检查
-        if normal_words:
-            any_normal_present = any(
-                normal_word.lower() in title_lower for normal_word in normal_words
-            )
-            if not any_normal_present:
-                continue
-
-        return True
-
-    return False
+    """检查标题是否匹配词组规则（过滤词、必须词、普通词一次扫描完成）"""
+    return get_word_group_matcher(word_groups, filter_words).matches(title)
 
 
 def format_time_display(first_time: str, last_time: str) -> str:
@@ -1090,6 +1402,69 @@ def format_rank_display(ranks: List[int], rank_threshold: int, format_type: str)
             return f"[{min_rank} - {max_rank}]"
 
 
+def merge_near_duplicate_titles(
+    titles: List[Dict],
+    rank_threshold: int = CONFIG["RANK_THRESHOLD"],
+    threshold: float = CONFIG["CLUSTER_THRESHOLD"],
+) -> List[Dict]:
+    """合并同一新闻在不同平台的近似重复标题，每个簇输出一条（同一平台的标题不合并）"""
+    if len(titles) < 2:
+        return titles
+
+    clusters = cluster_near_duplicates(
+        [t["title"] for t in titles],
+        threshold,
+        groups=[t["source_name"] for t in titles],
+    )
+    if len(clusters) == len(titles):
+        return titles
+
+    merged_titles = []
+    for members in clusters:
+        if len(members) == 1:
+            merged_titles.append(titles[members[0]])
+            continue
+
+        items = [titles[i] for i in members]
+        # 权重最高的标题作为代表
+        representative = min(
+            items,
+            key=lambda x: (
+                -calculate_news_weight(x, rank_threshold),
+                min(x["ranks"]) if x["ranks"] else 999,
+                -x["count"],
+            ),
+        )
+
+        source_names = []
+        for item in [representative] + items:
+            if item["source_name"] not in source_names:
+                source_names.append(item["source_name"])
+
+        first_times = [x["first_time"] for x in items if x["first_time"]]
+        last_times = [x["last_time"] for x in items if x["last_time"]]
+        first_time = min(first_times) if first_times else ""
+        last_time = max(last_times) if last_times else ""
+
+        merged = dict(representative)
+        merged.update(
+            {
+                "source_name": " / ".join(source_names),
+                "source_names": source_names,
+                "first_time": first_time,
+                "last_time": last_time,
+                "time_display": format_time_display(first_time, last_time),
+                "count": sum(x["count"] for x in items),
+                "ranks": [rank for x in items for rank in x["ranks"]],
+                "is_new": any(x["is_new"] for x in items),
+                "cluster_size": len(items),
+            }
+        )
+        merged_titles.append(merged)
+
+    return merged_titles
+
+
 def count_word_frequency(
     results: Dict,
     word_groups: List[Dict],
@@ -1179,6 +1554,8 @@ def count_word_frequency(
         group_key = group["group_key"]
         word_stats[group_key] = {"count": 0, "titles": {}}
 
+    matcher = get_word_group_matcher(word_groups, filter_words)
+
     for source_id, titles_data in results_to_process.items():
         total_titles += len(titles_data)
 
@@ -1189,12 +1566,10 @@ def count_word_frequency(
             if title in processed_titles.get(source_id, {}):
                 continue
 
-            # 使用统一的匹配逻辑
-            matches_frequency_words = matches_word_groups(
-                title, word_groups, filter_words
-            )
+            # 使用统一的匹配逻辑：一次扫描得到第一个匹配的词组
+            group_index = matcher.first_match(title)
 
-            if not matches_frequency_words:
+            if group_index is None:
                 continue
 
             # 如果是Incremental Mode或 current 模式第一次，统计匹配的新增新闻数量
@@ -1207,115 +1582,84 @@ def count_word_frequency(
             source_url = title_data.get("url", "")
             source_mobile_url = title_data.get("mobileUrl", "")
 
-            # 找到匹配的词组（防御性转换确保类型安全）
-            title_lower = str(title).lower() if not isinstance(title, str) else title.lower()
-            for group in word_groups:
-                required_words = group["required"]
-                normal_words = group["normal"]
-
-                # 如果是"All News"模式，All标题都匹配第一个（唯一的）词组
-                if len(word_groups) == 1 and word_groups[0]["group_key"] == "All News":
-                    group_key = group["group_key"]
-                    word_stats[group_key]["count"] += 1
-                    if source_id not in word_stats[group_key]["titles"]:
-                        word_stats[group_key]["titles"][source_id] = []
-                else:
-                    # 原有的匹配逻辑
-                    if required_words:
-                        all_required_present = all(
-                            req_word.lower() in title_lower
-                            for req_word in required_words
-                        )
-                        if not all_required_present:
-                            continue
-
-                    if normal_words:
-                        any_normal_present = any(
-                            normal_word.lower() in title_lower
-                            for normal_word in normal_words
-                        )
-                        if not any_normal_present:
-                            continue
-
-                    group_key = group["group_key"]
-                    word_stats[group_key]["count"] += 1
-                    if source_id not in word_stats[group_key]["titles"]:
-                        word_stats[group_key]["titles"][source_id] = []
-
-                first_time = ""
-                last_time = ""
-                count_info = 1
-                ranks = source_ranks if source_ranks else []
-                url = source_url
-                mobile_url = source_mobile_url
-
-                # 对于 current 模式，从历史统计信息中Fetch完整数据
-                if (
-                    mode == "current"
-                    and title_info
-                    and source_id in title_info
-                    and title in title_info[source_id]
-                ):
-                    info = title_info[source_id][title]
-                    first_time = info.get("first_time", "")
-                    last_time = info.get("last_time", "")
-                    count_info = info.get("count", 1)
-                    if "ranks" in info and info["ranks"]:
-                        ranks = info["ranks"]
-                    url = info.get("url", source_url)
-                    mobile_url = info.get("mobileUrl", source_mobile_url)
-                elif (
-                    title_info
-                    and source_id in title_info
-                    and title in title_info[source_id]
-                ):
-                    info = title_info[source_id][title]
-                    first_time = info.get("first_time", "")
-                    last_time = info.get("last_time", "")
-                    count_info = info.get("count", 1)
-                    if "ranks" in info and info["ranks"]:
-                        ranks = info["ranks"]
-                    url = info.get("url", source_url)
-                    mobile_url = info.get("mobileUrl", source_mobile_url)
-
-                if not ranks:
-                    ranks = [99]
-
-                time_display = format_time_display(first_time, last_time)
-
-                source_name = id_to_name.get(source_id, source_id)
+            # 记录到匹配的词组（All News 模式下唯一的词组匹配所有标题）
+            group_key = word_groups[group_index]["group_key"]
+            word_stats[group_key]["count"] += 1
+            if source_id not in word_stats[group_key]["titles"]:
+                word_stats[group_key]["titles"][source_id] = []
 
-                # 判断是否为新增
-                is_new = False
-                if all_news_are_new:
-                    # Incremental Mode下AllProcess的新闻都是新增，或者当天第一次的All新闻都是新增
-                    is_new = True
-                elif new_titles and source_id in new_titles:
-                    # 检查是否在新增列表中
-                    new_titles_for_source = new_titles[source_id]
-                    is_new = title in new_titles_for_source
-
-                word_stats[group_key]["titles"][source_id].append(
-                    {
-                        "title": title,
-                        "source_name": source_name,
-                        "first_time": first_time,
-                        "last_time": last_time,
-                        "time_display": time_display,
-                        "count": count_info,
-                        "ranks": ranks,
-                        "rank_threshold": rank_threshold,
-                        "url": url,
-                        "mobileUrl": mobile_url,
-                        "is_new": is_new,
-                    }
-                )
+            first_time = ""
+            last_time = ""
+            count_info = 1
+            ranks = source_ranks if source_ranks else []
+            url = source_url
+            mobile_url = source_mobile_url
 
-                if source_id not in processed_titles:
-                    processed_titles[source_id] = {}
-                processed_titles[source_id][title] = True
+            # 对于 current 模式，从历史统计信息中Fetch完整数据
+            if (
+                mode == "current"
+                and title_info
+                and source_id in title_info
+                and title in title_info[source_id]
+            ):
+                info = title_info[source_id][title]
+                first_time = info.get("first_time", "")
+                last_time = info.get("last_time", "")
+                count_info = info.get("count", 1)
+                if "ranks" in info and info["ranks"]:
+                    ranks = info["ranks"]
+                url = info.get("url", source_url)
+                mobile_url = info.get("mobileUrl", source_mobile_url)
+            elif (
+                title_info
+                and source_id in title_info
+                and title in title_info[source_id]
+            ):
+                info = title_info[source_id][title]
+                first_time = info.get("first_time", "")
+                last_time = info.get("last_time", "")
+                count_info = info.get("count", 1)
+                if "ranks" in info and info["ranks"]:
+                    ranks = info["ranks"]
+                url = info.get("url", source_url)
+                mobile_url = info.get("mobileUrl", source_mobile_url)
+
+            if not ranks:
+                ranks = [99]
+
+            time_display = format_time_display(first_time, last_time)
+
+            source_name = id_to_name.get(source_id, source_id)
+
+            # 判断是否为新增
+            is_new = False
+            if all_news_are_new:
+                # Incremental Mode下AllProcess的新闻都是新增，或者当天第一次的All新闻都是新增
+                is_new = True
+            elif new_titles and source_id in new_titles:
+                # 检查是否在新增列表中
+                new_titles_for_source = new_titles[source_id]
+                is_new = title in new_titles_for_source
+
+            word_stats[group_key]["titles"][source_id].append(
+                {
+                    "title": title,
+                    "source_name": source_name,
+                    "first_time": first_time,
+                    "last_time": last_time,
+                    "time_display": time_display,
+                    "count": count_info,
+                    "ranks": ranks,
+                    "rank_threshold": rank_threshold,
+                    "url": url,
+                    "mobileUrl": mobile_url,
+                    "is_new": is_new,
+                }
+            )
 
-                break
+            if source_id not in processed_titles:
+                processed_titles[source_id] = {}
+            processed_titles[source_id][title] = True
 
     # 最后统一打印汇总信息
     if mode == "incremental":
@@ -1381,6 +1725,11 @@ def count_word_frequency(
         for source_id, title_list in data["titles"].items():
             all_titles.extend(title_list)
 
+        # 同一新闻在多个平台的近似标题合并为一条，计数按合并后的条数
+        if CONFIG["CLUSTER_SIMILAR_TITLES"]:
+            all_titles = merge_near_duplicate_titles(all_titles, rank_threshold)
+            data["count"] -= sum(t.get("cluster_size", 1) - 1 for t in all_titles)
+
         # 按权重排序
         sorted_titles = sorted(
             all_titles,
@@ -1709,55 +2058,8 @@ def format_title_for_platform(
         return cleaned_title
 
 
-def generate_html_report(
-    stats: List[Dict],
-    total_titles: int,
-    failed_ids: Optional[List] = None,
-    new_titles: Optional[Dict] = None,
-    id_to_name: Optional[Dict] = None,
-    mode: str = "daily",
-    is_daily_summary: bool = False,
-    update_info: Optional[Dict] = None,
-) -> str:
-    """GeneratedHTML报告"""
-    if is_daily_summary:
-        if mode == "current":
-            filename = "current-summary.html"
-        elif mode == "incremental":
-            filename = "daily-incremental.html"
-        else:
-            filename = "daily-summary.html"
-    else:
-        filename = f"{format_time_filename()}.html"
-
-    file_path = get_output_path("html", filename)
-
-    report_data = prepare_report_data(stats, failed_ids, new_titles, id_to_name, mode)
-
-    html_content = render_html_content(
-        report_data, total_titles, is_daily_summary, mode, update_info
-    )
-
-    with open(file_path, "w", encoding="utf-8") as f:
-        f.write(html_content)
-
-    if is_daily_summary:
-        root_file_path = Path("index.html")
-        with open(root_file_path, "w", encoding="utf-8") as f:
-            f.write(html_content)
-
-    return file_path
-
-
-def render_html_content(
-    report_data: Dict,
-    total_titles: int,
-    is_daily_summary: bool = False,
-    mode: str = "daily",
-    update_info: Optional[Dict] = None,
-) -> str:
-    """渲染HTML内容"""
-    html = """
+# HTML 报告的静态部分（样式、页头和脚本），只在模块加载时构建一次
+_HTML_REPORT_HEAD = """
     <!DOCTYPE html>
     <html>
     <head>
@@ -2201,245 +2503,8 @@ def render_html_content(
                         <span class="info-label">Report Type</span>
                         <span class="info-value">"""
 
-    # ProcessReport Type显示
-    if is_daily_summary:
-        if mode == "current":
-            html += "Current Ranking"
-        elif mode == "incremental":
-            html += "Incremental Mode"
-        else:
-            html += "Daily Summary"
-    else:
-        html += "Real-time Analysis"
-
-    html += """</span>
-                    </div>
-                    <div class="info-item">
-                        <span class="info-label">Total News</span>
-                        <span class="info-value">"""
-
-    html += f"{total_titles} items"
 
-    # 计算筛选后的Hot News数量
-    hot_news_count = sum(len(stat["titles"]) for stat in report_data["stats"])
-
-    html += """</span>
-                    </div>
-                    <div class="info-item">
-                        <span class="info-label">Hot News</span>
-                        <span class="info-value">"""
-
-    html += f"{hot_news_count} items"
-
-    html += """</span>
-                    </div>
-                    <div class="info-item">
-                        <span class="info-label">Generation Time</span>
-                        <span class="info-value">"""
-
-    now = get_beijing_time()
-    html += now.strftime("%m-%d %H:%M")
-
-    html += """</span>
-                    </div>
-                </div>
-            </div>
-            
-            <div class="content">"""
-
-    # ProcessfailedID错误信息
-    if report_data["failed_ids"]:
-        html += """
-                <div class="error-section">
-                    <div class="error-title">⚠️ Requestfailed的平台</div>
-                    <ul class="error-list">"""
-        for id_value in report_data["failed_ids"]:
-            html += f'<li class="error-item">{html_escape(id_value)}</li>'
-        html += """
-                    </ul>
-                </div>"""
-
-    # Process主要统计数据
-    if report_data["stats"]:
-        total_count = len(report_data["stats"])
-
-        for i, stat in enumerate(report_data["stats"], 1):
-            count = stat["count"]
-
-            # 确定热度等级
-            if count >= 10:
-                count_class = "hot"
-            elif count >= 5:
-                count_class = "warm"
-            else:
-                count_class = ""
-
-            escaped_word = html_escape(stat["word"])
-
-            html += f"""
-                <div class="word-group">
-                    <div class="word-header">
-                        <div class="word-info">
-                            <div class="word-name">{escaped_word}</div>
-                            <div class="word-count {count_class}">{count} items</div>
-                        </div>
-                        <div class="word-index">{i}/{total_count}</div>
-                    </div>"""
-
-            # Process每个词组下的新闻标题，给每items新闻标上序号
-            for j, title_data in enumerate(stat["titles"], 1):
-                is_new = title_data.get("is_new", False)
-                new_class = "new" if is_new else ""
-
-                html += f"""
-                    <div class="news-item {new_class}">
-                        <div class="news-number">{j}</div>
-                        <div class="news-content">
-                            <div class="news-header">
-                                <span class="source-name">{html_escape(title_data["source_name"])}</span>"""
-
-                # Process排名显示
-                ranks = title_data.get("ranks", [])
-                if ranks:
-                    min_rank = min(ranks)
-                    max_rank = max(ranks)
-                    rank_threshold = title_data.get("rank_threshold", 10)
-
-                    # 确定排名等级
-                    if min_rank <= 3:
-                        rank_class = "top"
-                    elif min_rank <= rank_threshold:
-                        rank_class = "high"
-                    else:
-                        rank_class = ""
-
-                    if min_rank == max_rank:
-                        rank_text = str(min_rank)
-                    else:
-                        rank_text = f"{min_rank}-{max_rank}"
-
-                    html += f'<span class="rank-num {rank_class}">{rank_text}</span>'
-
-                # Process时间显示
-                time_display = title_data.get("time_display", "")
-                if time_display:
-                    # 简化时间显示格式，将波浪线替换为~
-                    simplified_time = (
-                        time_display.replace(" ~ ", "~")
-                        .replace("[", "")
-                        .replace("]", "")
-                    )
-                    html += (
-                        f'<span class="time-info">{html_escape(simplified_time)}</span>'
-                    )
-
-                # Process出现次数
-                count_info = title_data.get("count", 1)
-                if count_info > 1:
-                    html += f'<span class="count-info">{count_info}次</span>'
-
-                html += """
-                            </div>
-                            <div class="news-title">"""
-
-                # Process标题和链接
-                escaped_title = html_escape(title_data["title"])
-                link_url = title_data.get("mobile_url") or title_data.get("url", "")
-
-                if link_url:
-                    escaped_url = html_escape(link_url)
-                    html += f'<a href="{escaped_url}" target="_blank" class="news-link">{escaped_title}</a>'
-                else:
-                    html += escaped_title
-
-                html += """
-                            </div>
-                        </div>
-                    </div>"""
-
-            html += """
-                </div>"""
-
-    # Process新增新闻区域
-    if report_data["new_titles"]:
-        html += f"""
-                <div class="new-section">
-                    <div class="new-section-title">本次新增热点 (共 {report_data['total_new_count']} items)</div>"""
-
-        for source_data in report_data["new_titles"]:
-            escaped_source = html_escape(source_data["source_name"])
-            titles_count = len(source_data["titles"])
-
-            html += f"""
-                    <div class="new-source-group">
-                        <div class="new-source-title">{escaped_source} · {titles_count}items</div>"""
-
-            # 为新增新闻也添加序号
-            for idx, title_data in enumerate(source_data["titles"], 1):
-                ranks = title_data.get("ranks", [])
-
-                # Process新增新闻的排名显示
-                rank_class = ""
-                if ranks:
-                    min_rank = min(ranks)
-                    if min_rank <= 3:
-                        rank_class = "top"
-                    elif min_rank <= title_data.get("rank_threshold", 10):
-                        rank_class = "high"
-
-                    if len(ranks) == 1:
-                        rank_text = str(ranks[0])
-                    else:
-                        rank_text = f"{min(ranks)}-{max(ranks)}"
-                else:
-                    rank_text = "?"
-
-                html += f"""
-                        <div class="new-item">
-                            <div class="new-item-number">{idx}</div>
-                            <div class="new-item-rank {rank_class}">{rank_text}</div>
-                            <div class="new-item-content">
-                                <div class="new-item-title">"""
-
-                # Process新增新闻的链接
-                escaped_title = html_escape(title_data["title"])
-                link_url = title_data.get("mobile_url") or title_data.get("url", "")
-
-                if link_url:
-                    escaped_url = html_escape(link_url)
-                    html += f'<a href="{escaped_url}" target="_blank" class="news-link">{escaped_title}</a>'
-                else:
-                    html += escaped_title
-
-                html += """
-                                </div>
-                            </div>
-                        </div>"""
-
-            html += """
-                    </div>"""
-
-        html += """
-                </div>"""
-
-    html += """
-            </div>
-            
-            <div class="footer">
-                <div class="footer-content">
-                    Generated by <span class="project-name">TrendRadar</span> Generated · 
-                    <a href="https://github.com/sansan0/TrendRadar" target="_blank" class="footer-link">
-                        GitHub Open Source Project
-                    </a>"""
-
-    if update_info:
-        html += f"""
-                    <br>
-                    <span style="color: #ea580c; font-weight: 500;">
-                        New version found {update_info['remote_version']}，Current version {update_info['current_version']}
-                    </span>"""
-
-    html += """
+_HTML_REPORT_TAIL = """
                 </div>
             </div>
         </div>
@@ -2755,7 +2820,330 @@ def render_html_content(
     </html>
     """
 
-    return html
+
+def generate_html_report(
+    stats: List[Dict],
+    total_titles: int,
+    failed_ids: Optional[List] = None,
+    new_titles: Optional[Dict] = None,
+    id_to_name: Optional[Dict] = None,
+    mode: str = "daily",
+    is_daily_summary: bool = False,
+    update_info: Optional[Dict] = None,
+) -> str:
+    """GeneratedHTML报告"""
+    if is_daily_summary:
+        if mode == "current":
+            filename = "current-summary.html"
+        elif mode == "incremental":
+            filename = "daily-incremental.html"
+        else:
+            filename = "daily-summary.html"
+    else:
+        filename = f"{format_time_filename()}.html"
+
+    file_path = get_output_path("html", filename)
+
+    report_data = prepare_report_data(stats, failed_ids, new_titles, id_to_name, mode)
+
+    # 边渲染边写入临时文件，完成后原子替换，避免读者看到写了一半的报告
+    tmp_path = f"{file_path}.tmp"
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.writelines(
+                iter_html_content(report_data, total_titles, is_daily_summary, mode, update_info)
+            )
+        os.replace(tmp_path, file_path)
+    finally:
+        # 渲染或写入失败时不留下半成品临时文件（替换成功后临时文件已不存在）
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+    if is_daily_summary:
+        publish_file(file_path, Path("index.html"))
+
+    return file_path
+
+
+def publish_file(source_path, target_path) -> None:
+    """把已Generated的文件原子地发布到 target_path（优先硬链接，跨设备时复制）"""
+    target_path = Path(target_path)
+    tmp_path = target_path.with_name(f".{target_path.name}.tmp")
+    if tmp_path.exists():
+        tmp_path.unlink()
+    try:
+        try:
+            os.link(source_path, tmp_path)
+        except OSError:
+            shutil.copyfile(source_path, tmp_path)
+        os.replace(tmp_path, target_path)
+    finally:
+        if tmp_path.exists():
+            tmp_path.unlink()
+
+
+def render_html_content(
+    report_data: Dict,
+    total_titles: int,
+    is_daily_summary: bool = False,
+    mode: str = "daily",
+    update_info: Optional[Dict] = None,
+) -> str:
+    """渲染HTML内容"""
+    return "".join(
+        iter_html_content(report_data, total_titles, is_daily_summary, mode, update_info)
+    )
+
+
+def iter_html_content(
+    report_data: Dict,
+    total_titles: int,
+    is_daily_summary: bool = False,
+    mode: str = "daily",
+    update_info: Optional[Dict] = None,
+) -> Iterator[str]:
+    """逐段Generated HTML 报告内容（静态头尾为预编译常量，动态部分按条目产出）"""
+    yield _HTML_REPORT_HEAD
+
+    # ProcessReport Type显示
+    if is_daily_summary:
+        if mode == "current":
+            yield "Current Ranking"
+        elif mode == "incremental":
+            yield "Incremental Mode"
+        else:
+            yield "Daily Summary"
+    else:
+        yield "Real-time Analysis"
+
+    yield """</span>
+                    </div>
+                    <div class="info-item">
+                        <span class="info-label">Total News</span>
+                        <span class="info-value">"""
+
+    yield f"{total_titles} items"
+
+    # 计算筛选后的Hot News数量
+    hot_news_count = sum(len(stat["titles"]) for stat in report_data["stats"])
+
+    yield """</span>
+                    </div>
+                    <div class="info-item">
+                        <span class="info-label">Hot News</span>
+                        <span class="info-value">"""
+
+    yield f"{hot_news_count} items"
+
+    yield """</span>
+                    </div>
+                    <div class="info-item">
+                        <span class="info-label">Generation Time</span>
+                        <span class="info-value">"""
+
+    now = get_beijing_time()
+    yield now.strftime("%m-%d %H:%M")
+
+    yield """</span>
+                    </div>
+                </div>
+            </div>
+            
+            <div class="content">"""
+
+    # ProcessfailedID错误信息
+    if report_data["failed_ids"]:
+        yield """
+                <div class="error-section">
+                    <div class="error-title">⚠️ Requestfailed的平台</div>
+                    <ul class="error-list">"""
+        for id_value in report_data["failed_ids"]:
+            yield f'<li class="error-item">{html_escape(id_value)}</li>'
+        yield """
+                    </ul>
+                </div>"""
+
+    # Process主要统计数据
+    if report_data["stats"]:
+        total_count = len(report_data["stats"])
+
+        for i, stat in enumerate(report_data["stats"], 1):
+            count = stat["count"]
+
+            # 确定热度等级
+            if count >= 10:
+                count_class = "hot"
+            elif count >= 5:
+                count_class = "warm"
+            else:
+                count_class = ""
+
+            escaped_word = html_escape(stat["word"])
+
+            yield f"""
+                <div class="word-group">
+                    <div class="word-header">
+                        <div class="word-info">
+                            <div class="word-name">{escaped_word}</div>
+                            <div class="word-count {count_class}">{count} items</div>
+                        </div>
+                        <div class="word-index">{i}/{total_count}</div>
+                    </div>"""
+
+            # Process每个词组下的新闻标题，给每items新闻标上序号
+            for j, title_data in enumerate(stat["titles"], 1):
+                is_new = title_data.get("is_new", False)
+                new_class = "new" if is_new else ""
+
+                yield f"""
+                    <div class="news-item {new_class}">
+                        <div class="news-number">{j}</div>
+                        <div class="news-content">
+                            <div class="news-header">
+                                <span class="source-name">{html_escape(title_data["source_name"])}</span>"""
+
+                # Process排名显示
+                ranks = title_data.get("ranks", [])
+                if ranks:
+                    min_rank = min(ranks)
+                    max_rank = max(ranks)
+                    rank_threshold = title_data.get("rank_threshold", 10)
+
+                    # 确定排名等级
+                    if min_rank <= 3:
+                        rank_class = "top"
+                    elif min_rank <= rank_threshold:
+                        rank_class = "high"
+                    else:
+                        rank_class = ""
+
+                    if min_rank == max_rank:
+                        rank_text = str(min_rank)
+                    else:
+                        rank_text = f"{min_rank}-{max_rank}"
+
+                    yield f'<span class="rank-num {rank_class}">{rank_text}</span>'
+
+                # Process时间显示
+                time_display = title_data.get("time_display", "")
+                if time_display:
+                    # 简化时间显示格式，将波浪线替换为~
+                    simplified_time = (
+                        time_display.replace(" ~ ", "~")
+                        .replace("[", "")
+                        .replace("]", "")
+                    )
+                    yield (
+                        f'<span class="time-info">{html_escape(simplified_time)}</span>'
+                    )
+
+                # Process出现次数
+                count_info = title_data.get("count", 1)
+                if count_info > 1:
+                    yield f'<span class="count-info">{count_info}次</span>'
+
+                yield """
+                            </div>
+                            <div class="news-title">"""
+
+                # Process标题和链接
+                escaped_title = html_escape(title_data["title"])
+                link_url = title_data.get("mobile_url") or title_data.get("url", "")
+
+                if link_url:
+                    escaped_url = html_escape(link_url)
+                    yield f'<a href="{escaped_url}" target="_blank" class="news-link">{escaped_title}</a>'
+                else:
+                    yield escaped_title
+
+                yield """
+                            </div>
+                        </div>
+                    </div>"""
+
+            yield """
+                </div>"""
+
+    # Process新增新闻区域
+    if report_data["new_titles"]:
+        yield f"""
+                <div class="new-section">
+                    <div class="new-section-title">本次新增热点 (共 {report_data['total_new_count']} items)</div>"""
+
+        for source_data in report_data["new_titles"]:
+            escaped_source = html_escape(source_data["source_name"])
+            titles_count = len(source_data["titles"])
+
+            yield f"""
+                    <div class="new-source-group">
+                        <div class="new-source-title">{escaped_source} · {titles_count}items</div>"""
+
+            # 为新增新闻也添加序号
+            for idx, title_data in enumerate(source_data["titles"], 1):
+                ranks = title_data.get("ranks", [])
+
+                # Process新增新闻的排名显示
+                rank_class = ""
+                if ranks:
+                    min_rank = min(ranks)
+                    if min_rank <= 3:
+                        rank_class = "top"
+                    elif min_rank <= title_data.get("rank_threshold", 10):
+                        rank_class = "high"
+
+                    if len(ranks) == 1:
+                        rank_text = str(ranks[0])
+                    else:
+                        rank_text = f"{min(ranks)}-{max(ranks)}"
+                else:
+                    rank_text = "?"
+
+                yield f"""
+                        <div class="new-item">
+                            <div class="new-item-number">{idx}</div>
+                            <div class="new-item-rank {rank_class}">{rank_text}</div>
+                            <div class="new-item-content">
+                                <div class="new-item-title">"""
+
+                # Process新增新闻的链接
+                escaped_title = html_escape(title_data["title"])
+                link_url = title_data.get("mobile_url") or title_data.get("url", "")
+
+                if link_url:
+                    escaped_url = html_escape(link_url)
+                    yield f'<a href="{escaped_url}" target="_blank" class="news-link">{escaped_title}</a>'
+                else:
+                    yield escaped_title
+
+                yield """
+                                </div>
+                            </div>
+                        </div>"""
+
+            yield """
+                    </div>"""
+
+        yield """
+                </div>"""
+
+    yield """
+            </div>
+            
+            <div class="footer">
+                <div class="footer-content">
+                    Generated by <span class="project-name">TrendRadar</span> Generated · 
+                    <a href="https://github.com/sansan0/TrendRadar" target="_blank" class="footer-link">
+                        GitHub Open Source Project
+                    </a>"""
+
+    if update_info:
+        yield f"""
+                    <br>
+                    <span style="color: #ea580c; font-weight: 500;">
+                        New version found {update_info['remote_version']}，Current version {update_info['current_version']}
+                    </span>"""
+
+    yield _HTML_REPORT_TAIL
 
 
 def render_feishu_content(
@@ -3022,31 +3410,49 @@ def add_batch_headers(
     return result
 
 
-def split_content_into_batches(
-    report_data: Dict,
-    format_type: str,
-    update_info: Optional[Dict] = None,
-    max_bytes: int = None,
-    mode: str = "daily",
-) -> List[str]:
-    """分批Process消息内容，确保词组标题+至少第一items新闻的完整性"""
-    if max_bytes is None:
-        if format_type == "dingtalk":
-            max_bytes = CONFIG.get("DINGTALK_BATCH_SIZE", 20000)
-        elif format_type == "feishu":
-            max_bytes = CONFIG.get("FEISHU_BATCH_SIZE", 29000)
-        elif format_type == "ntfy":
-            max_bytes = 3800
-        else:
-            max_bytes = CONFIG.get("MESSAGE_BATCH_SIZE", 4000)
+def _default_batch_size(format_type: str) -> int:
+    """各推送格式的默认batch大小（bytes）"""
+    if format_type == "dingtalk":
+        return CONFIG.get("DINGTALK_BATCH_SIZE", 20000)
+    elif format_type == "feishu":
+        return CONFIG.get("FEISHU_BATCH_SIZE", 29000)
+    elif format_type == "ntfy":
+        return 3800
+    return CONFIG.get("MESSAGE_BATCH_SIZE", 4000)
 
-    batches = []
 
-    total_titles = sum(
-        len(stat["titles"]) for stat in report_data["stats"] if stat["count"] > 0
-    )
-    now = get_beijing_time()
+def _get_channel_split_bytes(format_type: str) -> int:
+    """各渠道分批时的内容bytes上限（渠道batch大小减去batch头部预留）"""
+    header_format_type = format_type
+    if format_type == "feishu":
+        batch_size = CONFIG.get("FEISHU_BATCH_SIZE", 29000)
+    elif format_type == "dingtalk":
+        batch_size = CONFIG.get("DINGTALK_BATCH_SIZE", 20000)
+    elif format_type == "wework":
+        batch_size = CONFIG.get("MESSAGE_BATCH_SIZE", 4000)
+        if CONFIG.get("WEWORK_MSG_TYPE", "markdown").lower() == "text":
+            header_format_type = "wework_text"
+    elif format_type == "telegram":
+        batch_size = CONFIG.get("MESSAGE_BATCH_SIZE", 4000)
+    elif format_type == "ntfy":
+        batch_size = 3800
+    elif format_type == "bark":
+        batch_size = CONFIG["BARK_BATCH_SIZE"]
+    elif format_type == "slack":
+        batch_size = CONFIG["SLACK_BATCH_SIZE"]
+    else:
+        batch_size = _default_batch_size(format_type)
+    return batch_size - _get_max_batch_header_size(header_format_type)
+
+
+def _utf8_len(text: str) -> int:
+    return len(text) if text.isascii() else len(text.encode("utf-8"))
 
+
+def _batch_header_footer(
+    format_type: str, total_titles: int, now: datetime, update_info: Optional[Dict]
+) -> Tuple[str, str]:
+    """每batch的公共头部和尾部"""
     base_header = ""
     if format_type in ("wework", "bark"):
         base_header = f"**总新闻数：** {total_titles}\n\n\n\n"
@@ -3090,23 +3496,224 @@ def split_content_into_batches(
         if update_info:
             base_footer += f"\n_TrendRadar New version found *{update_info['remote_version']}*，当前 *{update_info['current_version']}_"
 
-    stats_header = ""
-    if report_data["stats"]:
-        if format_type in ("wework", "bark"):
-            stats_header = f"📊 **Hot Word Statistics**\n\n"
-        elif format_type == "telegram":
-            stats_header = f"📊 Hot Word Statistics\n\n"
-        elif format_type == "ntfy":
-            stats_header = f"📊 **Hot Word Statistics**\n\n"
-        elif format_type == "feishu":
-            stats_header = f"📊 **Hot Word Statistics**\n\n"
-        elif format_type == "dingtalk":
-            stats_header = f"📊 **Hot Word Statistics**\n\n"
-        elif format_type == "slack":
-            stats_header = f"📊 *Hot Word Statistics*\n\n"
-
-    current_batch = base_header
-    current_batch_has_content = False
+    return base_header, base_footer
+
+
+def _stats_header(format_type: str) -> str:
+    if format_type in ("wework", "bark", "ntfy", "feishu", "dingtalk"):
+        return "📊 **Hot Word Statistics**\n\n"
+    elif format_type == "telegram":
+        return "📊 Hot Word Statistics\n\n"
+    elif format_type == "slack":
+        return "📊 *Hot Word Statistics*\n\n"
+    return ""
+
+
+def _word_header(format_type: str, sequence_display: str, word: str, count: int) -> str:
+    icon = "🔥" if count >= 10 else "📈" if count >= 5 else "📌"
+    if format_type in ("wework", "bark", "ntfy", "dingtalk"):
+        if count >= 5:
+            return f"{icon} {sequence_display} **{word}** : **{count}** items\n\n"
+        return f"{icon} {sequence_display} **{word}** : {count} items\n\n"
+    elif format_type == "telegram":
+        return f"{icon} {sequence_display} {word} : {count} items\n\n"
+    elif format_type == "feishu":
+        if count >= 10:
+            count_display = f"<font color='red'>{count}</font>"
+        elif count >= 5:
+            count_display = f"<font color='orange'>{count}</font>"
+        else:
+            count_display = f"{count}"
+        return f"{icon} <font color='grey'>{sequence_display}</font> **{word}** : {count_display} items\n\n"
+    elif format_type == "slack":
+        if count >= 5:
+            return f"{icon} {sequence_display} *{word}* : *{count}* items\n\n"
+        return f"{icon} {sequence_display} *{word}* : {count} items\n\n"
+    return ""
+
+
+def _stats_separator(format_type: str) -> str:
+    if format_type in ("wework", "bark"):
+        return "\n\n\n\n"
+    elif format_type in ("telegram", "ntfy", "slack"):
+        return "\n\n"
+    elif format_type == "feishu":
+        return f"\n{CONFIG['FEISHU_MESSAGE_SEPARATOR']}\n\n"
+    elif format_type == "dingtalk":
+        return "\n---\n\n"
+    return ""
+
+
+def _new_titles_header(format_type: str, total_new_count: int) -> str:
+    if format_type in ("wework", "bark"):
+        return f"\n\n\n\n🆕 **本次新增Hot News** (共 {total_new_count} items)\n\n"
+    elif format_type == "telegram":
+        return f"\n\n🆕 本次新增Hot News (共 {total_new_count} items)\n\n"
+    elif format_type == "ntfy":
+        return f"\n\n🆕 **本次新增Hot News** (共 {total_new_count} items)\n\n"
+    elif format_type == "feishu":
+        return f"\n{CONFIG['FEISHU_MESSAGE_SEPARATOR']}\n\n🆕 **本次新增Hot News** (共 {total_new_count} items)\n\n"
+    elif format_type == "dingtalk":
+        return f"\n---\n\n🆕 **本次新增Hot News** (共 {total_new_count} items)\n\n"
+    elif format_type == "slack":
+        return f"\n\n🆕 *本次新增Hot News* (共 {total_new_count} items)\n\n"
+    return ""
+
+
+def _new_source_header(format_type: str, source_name: str, title_count: int) -> str:
+    if format_type in ("wework", "bark", "ntfy", "feishu", "dingtalk"):
+        return f"**{source_name}** ({title_count} items):\n\n"
+    elif format_type == "telegram":
+        return f"{source_name} ({title_count} items):\n\n"
+    elif format_type == "slack":
+        return f"*{source_name}* ({title_count} items):\n\n"
+    return ""
+
+
+def _failed_header(format_type: str) -> str:
+    if format_type == "wework":
+        return "\n\n\n\n⚠️ **Data Fetchingfailed的平台：**\n\n"
+    elif format_type == "telegram":
+        return "\n\n⚠️ Data Fetchingfailed的平台：\n\n"
+    elif format_type == "ntfy":
+        return "\n\n⚠️ **Data Fetchingfailed的平台：**\n\n"
+    elif format_type == "feishu":
+        return f"\n{CONFIG['FEISHU_MESSAGE_SEPARATOR']}\n\n⚠️ **Data Fetchingfailed的平台：**\n\n"
+    elif format_type == "dingtalk":
+        return "\n---\n\n⚠️ **Data Fetchingfailed的平台：**\n\n"
+    return ""
+
+
+def _failed_line(format_type: str, id_value) -> str:
+    if format_type == "feishu":
+        return f"  • <font color='red'>{id_value}</font>\n"
+    elif format_type == "dingtalk":
+        return f"  • **{id_value}**\n"
+    return f"  • {id_value}\n"
+
+
+# 标题行使用的格式化方式（format_title_for_platform 的 platform 参数，None 为纯标题）
+_STATS_TITLE_FORMATTERS = {
+    "wework": "wework",
+    "bark": "wework",
+    "telegram": "telegram",
+    "ntfy": "ntfy",
+    "feishu": "feishu",
+    "dingtalk": "dingtalk",
+    "slack": "slack",
+}
+_NEW_FIRST_TITLE_FORMATTERS = {
+    "wework": "wework",
+    "bark": "wework",
+    "telegram": "telegram",
+    "feishu": "feishu",
+    "dingtalk": "dingtalk",
+    "slack": "slack",
+}
+_NEW_TITLE_FORMATTERS = {
+    "wework": "wework",
+    "telegram": "telegram",
+    "feishu": "feishu",
+    "dingtalk": "dingtalk",
+    "slack": "slack",
+}
+
+
+class _TitleFormatter:
+    """标题格式化缓存：同一标题在同一格式下只格式化一次（多个渠道共用）"""
+
+    def __init__(self):
+        self._cache: Dict[Tuple, str] = {}
+
+    def format(self, formatter: Optional[str], title_data: Dict, is_new_section: bool) -> str:
+        key = (formatter, id(title_data), is_new_section)
+        formatted = self._cache.get(key)
+        if formatted is None:
+            if is_new_section:
+                title_data_copy = title_data.copy()
+                title_data_copy["is_new"] = False
+                title_data = title_data_copy
+            if formatter is None:
+                formatted = f"{title_data['title']}"
+            else:
+                formatted = format_title_for_platform(
+                    formatter, title_data, show_source=not is_new_section
+                )
+            self._cache[key] = formatted
+        return formatted
+
+
+class _BatchBuilder:
+    """单个推送格式的分批状态
+
+    当前batch保存为片段列表，bytes数增量累计，不再反复拼接和编码整个batch。
+    """
+
+    def __init__(self, format_type: str, max_bytes: int, base_header: str, base_footer: str):
+        self.format_type = format_type
+        self.base_header = base_header
+        self.base_footer = base_footer
+        # 片段 + 尾部 >= max_bytes 时需要换batch
+        self.limit = max_bytes - _utf8_len(base_footer)
+        self.batches: List[str] = []
+        self.parts: List[str] = [base_header]
+        self.size = _utf8_len(base_header)
+        self.has_content = False
+
+    def fits(self, piece: str) -> bool:
+        return self.size + _utf8_len(piece) < self.limit
+
+    def append(self, piece: str) -> None:
+        self.parts.append(piece)
+        self.size += _utf8_len(piece)
+
+    def add(self, piece: str, *restart: str) -> None:
+        """追加片段；放不下时结束当前batch，以 base_header + restart 开启新batch"""
+        if self.fits(piece):
+            self.append(piece)
+        else:
+            if self.has_content:
+                self.batches.append("".join(self.parts) + self.base_footer)
+            self.parts = [self.base_header, *restart]
+            self.size = sum(_utf8_len(part) for part in self.parts)
+        self.has_content = True
+
+    def finish(self) -> List[str]:
+        if self.has_content:
+            self.batches.append("".join(self.parts) + self.base_footer)
+        return self.batches
+
+
+def split_content_for_formats(
+    report_data: Dict,
+    max_bytes_by_format: Dict[str, int],
+    update_info: Optional[Dict] = None,
+    mode: str = "daily",
+) -> Dict[str, List[str]]:
+    """一次遍历 report_data，同时为多个推送格式分批
+
+    Args:
+        report_data: prepare_report_data 的结果
+        max_bytes_by_format: {format_type: 每batch最大bytes数}
+        update_info: 版本更新信息
+        mode: 报告模式
+
+    Returns:
+        {format_type: batch列表}
+    """
+    total_titles = sum(
+        len(stat["titles"]) for stat in report_data["stats"] if stat["count"] > 0
+    )
+    now = get_beijing_time()
+
+    builders = []
+    for format_type, max_bytes in max_bytes_by_format.items():
+        if max_bytes is None:
+            max_bytes = _default_batch_size(format_type)
+        base_header, base_footer = _batch_header_footer(
+            format_type, total_titles, now, update_info
+        )
+        builders.append(_BatchBuilder(format_type, max_bytes, base_header, base_footer))
 
     if (
         not report_data["stats"]
@@ -3120,414 +3727,197 @@ def split_content_into_batches(
         else:
             mode_text = "暂无匹配的热点词汇"
         simple_content = f"📭 {mode_text}\n\n"
-        final_content = base_header + simple_content + base_footer
-        batches.append(final_content)
-        return batches
+        return {
+            b.format_type: [b.base_header + simple_content + b.base_footer]
+            for b in builders
+        }
 
-    # ProcessHot Word Statistics
-    if report_data["stats"]:
-        total_count = len(report_data["stats"])
+    formatter = _TitleFormatter()
 
-        # 添加统计标题
-        test_content = current_batch + stats_header
-        if (
-            len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8"))
-            < max_bytes
-        ):
-            current_batch = test_content
-            current_batch_has_content = True
-        else:
-            if current_batch_has_content:
-                batches.append(current_batch + base_footer)
-            current_batch = base_header + stats_header
-            current_batch_has_content = True
+    # ProcessHot Word Statistics（确保词组标题+第一items新闻的原子性）
+    if report_data["stats"]:
+        stats_headers = {b.format_type: _stats_header(b.format_type) for b in builders}
+        for b in builders:
+            stats_header = stats_headers[b.format_type]
+            b.add(stats_header, stats_header)
 
-        # 逐个Process词组（确保词组标题+第一items新闻的原子性）
+        total_count = len(report_data["stats"])
         for i, stat in enumerate(report_data["stats"]):
-            word = stat["word"]
-            count = stat["count"]
             sequence_display = f"[{i + 1}/{total_count}]"
+            titles = stat["titles"]
+
+            for b in builders:
+                format_type = b.format_type
+                title_formatter = _STATS_TITLE_FORMATTERS.get(format_type)
+                stats_header = stats_headers[format_type]
+                word_header = _word_header(
+                    format_type, sequence_display, stat["word"], stat["count"]
+                )
 
-            # 构建词组标题
-            word_header = ""
-            if format_type in ("wework", "bark"):
-                if count >= 10:
-                    word_header = (
-                        f"🔥 {sequence_display} **{word}** : **{count}** items\n\n"
-                    )
-                elif count >= 5:
-                    word_header = (
-                        f"📈 {sequence_display} **{word}** : **{count}** items\n\n"
-                    )
-                else:
-                    word_header = f"📌 {sequence_display} **{word}** : {count} items\n\n"
-            elif format_type == "telegram":
-                if count >= 10:
-                    word_header = f"🔥 {sequence_display} {word} : {count} items\n\n"
-                elif count >= 5:
-                    word_header = f"📈 {sequence_display} {word} : {count} items\n\n"
-                else:
-                    word_header = f"📌 {sequence_display} {word} : {count} items\n\n"
-            elif format_type == "ntfy":
-                if count >= 10:
-                    word_header = (
-                        f"🔥 {sequence_display} **{word}** : **{count}** items\n\n"
-                    )
-                elif count >= 5:
-                    word_header = (
-                        f"📈 {sequence_display} **{word}** : **{count}** items\n\n"
-                    )
-                else:
-                    word_header = f"📌 {sequence_display} **{word}** : {count} items\n\n"
-            elif format_type == "feishu":
-                if count >= 10:
-                    word_header = f"🔥 <font color='grey'>{sequence_display}</font> **{word}** : <font color='red'>{count}</font> items\n\n"
-                elif count >= 5:
-                    word_header = f"📈 <font color='grey'>{sequence_display}</font> **{word}** : <font color='orange'>{count}</font> items\n\n"
-                else:
-                    word_header = f"📌 <font color='grey'>{sequence_display}</font> **{word}** : {count} items\n\n"
-            elif format_type == "dingtalk":
-                if count >= 10:
-                    word_header = (
-                        f"🔥 {sequence_display} **{word}** : **{count}** items\n\n"
-                    )
-                elif count >= 5:
-                    word_header = (
-                        f"📈 {sequence_display} **{word}** : **{count}** items\n\n"
-                    )
-                else:
-                    word_header = f"📌 {sequence_display} **{word}** : {count} items\n\n"
-            elif format_type == "slack":
-                if count >= 10:
-                    word_header = (
-                        f"🔥 {sequence_display} *{word}* : *{count}* items\n\n"
-                    )
-                elif count >= 5:
-                    word_header = (
-                        f"📈 {sequence_display} *{word}* : *{count}* items\n\n"
-                    )
-                else:
-                    word_header = f"📌 {sequence_display} *{word}* : {count} items\n\n"
-
-            # 构建第一items新闻
-            first_news_line = ""
-            if stat["titles"]:
-                first_title_data = stat["titles"][0]
-                if format_type in ("wework", "bark"):
-                    formatted_title = format_title_for_platform(
-                        "wework", first_title_data, show_source=True
-                    )
-                elif format_type == "telegram":
-                    formatted_title = format_title_for_platform(
-                        "telegram", first_title_data, show_source=True
-                    )
-                elif format_type == "ntfy":
-                    formatted_title = format_title_for_platform(
-                        "ntfy", first_title_data, show_source=True
-                    )
-                elif format_type == "feishu":
-                    formatted_title = format_title_for_platform(
-                        "feishu", first_title_data, show_source=True
-                    )
-                elif format_type == "dingtalk":
-                    formatted_title = format_title_for_platform(
-                        "dingtalk", first_title_data, show_source=True
-                    )
-                elif format_type == "slack":
-                    formatted_title = format_title_for_platform(
-                        "slack", first_title_data, show_source=True
-                    )
-                else:
-                    formatted_title = f"{first_title_data['title']}"
+                first_news_line = ""
+                if titles:
+                    formatted_title = formatter.format(title_formatter, titles[0], False)
+                    first_news_line = f"  1. {formatted_title}\n"
+                    if len(titles) > 1:
+                        first_news_line += "\n"
+
+                word_with_first_news = word_header + first_news_line
+                b.add(word_with_first_news, stats_header, word_with_first_news)
+
+                for j in range(1, len(titles)):
+                    formatted_title = formatter.format(title_formatter, titles[j], False)
+                    news_line = f"  {j + 1}. {formatted_title}\n"
+                    if j < len(titles) - 1:
+                        news_line += "\n"
+                    b.add(news_line, stats_header, word_header, news_line)
+
+                # 词组间分隔符（放不下时省略）
+                if i < total_count - 1:
+                    separator = _stats_separator(format_type)
+                    if b.fits(separator):
+                        b.append(separator)
 
-                first_news_line = f"  1. {formatted_title}\n"
-                if len(stat["titles"]) > 1:
-                    first_news_line += "\n"
+    # Process新增新闻（同样确保来源标题+第一items新闻的原子性）
+    if report_data["new_titles"]:
+        new_headers = {
+            b.format_type: _new_titles_header(b.format_type, report_data["total_new_count"])
+            for b in builders
+        }
+        for b in builders:
+            new_header = new_headers[b.format_type]
+            b.add(new_header, new_header)
 
-            # 原子性检查：词组标题+第一items新闻必须一起Process
-            word_with_first_news = word_header + first_news_line
-            test_content = current_batch + word_with_first_news
+        for source_data in report_data["new_titles"]:
+            titles = source_data["titles"]
+            for b in builders:
+                format_type = b.format_type
+                new_header = new_headers[format_type]
+                source_header = _new_source_header(
+                    format_type, source_data["source_name"], len(titles)
+                )
 
-            if (
-                len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8"))
-                >= max_bytes
-            ):
-                # 当前batch容纳不下，开启新batch
-                if current_batch_has_content:
-                    batches.append(current_batch + base_footer)
-                current_batch = base_header + stats_header + word_with_first_news
-                current_batch_has_content = True
-                start_index = 1
-            else:
-                current_batch = test_content
-                current_batch_has_content = True
-                start_index = 1
-
-            # Process剩余新闻items目
-            for j in range(start_index, len(stat["titles"])):
-                title_data = stat["titles"][j]
-                if format_type in ("wework", "bark"):
-                    formatted_title = format_title_for_platform(
-                        "wework", title_data, show_source=True
-                    )
-                elif format_type == "telegram":
-                    formatted_title = format_title_for_platform(
-                        "telegram", title_data, show_source=True
-                    )
-                elif format_type == "ntfy":
-                    formatted_title = format_title_for_platform(
-                        "ntfy", title_data, show_source=True
+                first_news_line = ""
+                if titles:
+                    formatted_title = formatter.format(
+                        _NEW_FIRST_TITLE_FORMATTERS.get(format_type), titles[0], True
                     )
-                elif format_type == "feishu":
-                    formatted_title = format_title_for_platform(
-                        "feishu", title_data, show_source=True
-                    )
-                elif format_type == "dingtalk":
-                    formatted_title = format_title_for_platform(
-                        "dingtalk", title_data, show_source=True
-                    )
-                elif format_type == "slack":
-                    formatted_title = format_title_for_platform(
-                        "slack", title_data, show_source=True
-                    )
-                else:
-                    formatted_title = f"{title_data['title']}"
-
-                news_line = f"  {j + 1}. {formatted_title}\n"
-                if j < len(stat["titles"]) - 1:
-                    news_line += "\n"
-
-                test_content = current_batch + news_line
-                if (
-                    len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8"))
-                    >= max_bytes
-                ):
-                    if current_batch_has_content:
-                        batches.append(current_batch + base_footer)
-                    current_batch = base_header + stats_header + word_header + news_line
-                    current_batch_has_content = True
-                else:
-                    current_batch = test_content
-                    current_batch_has_content = True
+                    first_news_line = f"  1. {formatted_title}\n"
 
-            # 词组间分隔符
-            if i < len(report_data["stats"]) - 1:
-                separator = ""
-                if format_type in ("wework", "bark"):
-                    separator = f"\n\n\n\n"
-                elif format_type == "telegram":
-                    separator = f"\n\n"
-                elif format_type == "ntfy":
-                    separator = f"\n\n"
-                elif format_type == "feishu":
-                    separator = f"\n{CONFIG['FEISHU_MESSAGE_SEPARATOR']}\n\n"
-                elif format_type == "dingtalk":
-                    separator = f"\n---\n\n"
-                elif format_type == "slack":
-                    separator = f"\n\n"
-
-                test_content = current_batch + separator
-                if (
-                    len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8"))
-                    < max_bytes
-                ):
-                    current_batch = test_content
+                source_with_first_news = source_header + first_news_line
+                b.add(source_with_first_news, new_header, source_with_first_news)
 
-    # Process新增新闻（同样确保来源标题+第一items新闻的原子性）
-    if report_data["new_titles"]:
-        new_header = ""
-        if format_type in ("wework", "bark"):
-            new_header = f"\n\n\n\n🆕 **本次新增Hot News** (共 {report_data['total_new_count']} items)\n\n"
-        elif format_type == "telegram":
-            new_header = (
-                f"\n\n🆕 本次新增Hot News (共 {report_data['total_new_count']} items)\n\n"
-            )
-        elif format_type == "ntfy":
-            new_header = f"\n\n🆕 **本次新增Hot News** (共 {report_data['total_new_count']} items)\n\n"
-        elif format_type == "feishu":
-            new_header = f"\n{CONFIG['FEISHU_MESSAGE_SEPARATOR']}\n\n🆕 **本次新增Hot News** (共 {report_data['total_new_count']} items)\n\n"
-        elif format_type == "dingtalk":
-            new_header = f"\n---\n\n🆕 **本次新增Hot News** (共 {report_data['total_new_count']} items)\n\n"
-        elif format_type == "slack":
-            new_header = f"\n\n🆕 *本次新增Hot News* (共 {report_data['total_new_count']} items)\n\n"
-
-        test_content = current_batch + new_header
-        if (
-            len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8"))
-            >= max_bytes
-        ):
-            if current_batch_has_content:
-                batches.append(current_batch + base_footer)
-            current_batch = base_header + new_header
-            current_batch_has_content = True
-        else:
-            current_batch = test_content
-            current_batch_has_content = True
+                title_formatter = _NEW_TITLE_FORMATTERS.get(format_type)
+                for j in range(1, len(titles)):
+                    formatted_title = formatter.format(title_formatter, titles[j], True)
+                    news_line = f"  {j + 1}. {formatted_title}\n"
+                    b.add(news_line, new_header, source_header, news_line)
 
-        # 逐个Process新增新闻来源
-        for source_data in report_data["new_titles"]:
-            source_header = ""
-            if format_type in ("wework", "bark"):
-                source_header = f"**{source_data['source_name']}** ({len(source_data['titles'])} items):\n\n"
-            elif format_type == "telegram":
-                source_header = f"{source_data['source_name']} ({len(source_data['titles'])} items):\n\n"
-            elif format_type == "ntfy":
-                source_header = f"**{source_data['source_name']}** ({len(source_data['titles'])} items):\n\n"
-            elif format_type == "feishu":
-                source_header = f"**{source_data['source_name']}** ({len(source_data['titles'])} items):\n\n"
-            elif format_type == "dingtalk":
-                source_header = f"**{source_data['source_name']}** ({len(source_data['titles'])} items):\n\n"
-            elif format_type == "slack":
-                source_header = f"*{source_data['source_name']}* ({len(source_data['titles'])} items):\n\n"
-
-            # 构建第一items新增新闻
-            first_news_line = ""
-            if source_data["titles"]:
-                first_title_data = source_data["titles"][0]
-                title_data_copy = first_title_data.copy()
-                title_data_copy["is_new"] = False
+                b.append("\n")
 
-                if format_type in ("wework", "bark"):
-                    formatted_title = format_title_for_platform(
-                        "wework", title_data_copy, show_source=False
-                    )
-                elif format_type == "telegram":
-                    formatted_title = format_title_for_platform(
-                        "telegram", title_data_copy, show_source=False
-                    )
-                elif format_type == "feishu":
-                    formatted_title = format_title_for_platform(
-                        "feishu", title_data_copy, show_source=False
-                    )
-                elif format_type == "dingtalk":
-                    formatted_title = format_title_for_platform(
-                        "dingtalk", title_data_copy, show_source=False
-                    )
-                elif format_type == "slack":
-                    formatted_title = format_title_for_platform(
-                        "slack", title_data_copy, show_source=False
-                    )
-                else:
-                    formatted_title = f"{title_data_copy['title']}"
+    if report_data["failed_ids"]:
+        for b in builders:
+            failed_header = _failed_header(b.format_type)
+            b.add(failed_header, failed_header)
+            for id_value in report_data["failed_ids"]:
+                failed_line = _failed_line(b.format_type, id_value)
+                b.add(failed_line, failed_header, failed_line)
 
-                first_news_line = f"  1. {formatted_title}\n"
+    return {b.format_type: b.finish() for b in builders}
 
-            # 原子性检查：来源标题+第一items新闻
-            source_with_first_news = source_header + first_news_line
-            test_content = current_batch + source_with_first_news
 
-            if (
-                len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8"))
-                >= max_bytes
-            ):
-                if current_batch_has_content:
-                    batches.append(current_batch + base_footer)
-                current_batch = base_header + new_header + source_with_first_news
-                current_batch_has_content = True
-                start_index = 1
-            else:
-                current_batch = test_content
-                current_batch_has_content = True
-                start_index = 1
+def split_content_into_batches(
+    report_data: Dict,
+    format_type: str,
+    update_info: Optional[Dict] = None,
+    max_bytes: int = None,
+    mode: str = "daily",
+) -> List[str]:
+    """分批Process消息内容，确保词组标题+至少第一items新闻的完整性"""
+    if max_bytes is None:
+        max_bytes = _default_batch_size(format_type)
+    return split_content_for_formats(
+        report_data, {format_type: max_bytes}, update_info, mode
+    )[format_type]
 
-            # Process剩余新增新闻
-            for j in range(start_index, len(source_data["titles"])):
-                title_data = source_data["titles"][j]
-                title_data_copy = title_data.copy()
-                title_data_copy["is_new"] = False
 
-                if format_type == "wework":
-                    formatted_title = format_title_for_platform(
-                        "wework", title_data_copy, show_source=False
-                    )
-                elif format_type == "telegram":
-                    formatted_title = format_title_for_platform(
-                        "telegram", title_data_copy, show_source=False
-                    )
-                elif format_type == "feishu":
-                    formatted_title = format_title_for_platform(
-                        "feishu", title_data_copy, show_source=False
-                    )
-                elif format_type == "dingtalk":
-                    formatted_title = format_title_for_platform(
-                        "dingtalk", title_data_copy, show_source=False
-                    )
-                elif format_type == "slack":
-                    formatted_title = format_title_for_platform(
-                        "slack", title_data_copy, show_source=False
-                    )
-                else:
-                    formatted_title = f"{title_data_copy['title']}"
-
-                news_line = f"  {j + 1}. {formatted_title}\n"
-
-                test_content = current_batch + news_line
-                if (
-                    len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8"))
-                    >= max_bytes
-                ):
-                    if current_batch_has_content:
-                        batches.append(current_batch + base_footer)
-                    current_batch = base_header + new_header + source_header + news_line
-                    current_batch_has_content = True
-                else:
-                    current_batch = test_content
-                    current_batch_has_content = True
+class ChannelRateLimiter:
+    """按通知渠道限速：同一渠道相邻两次Sending至少间隔指定秒数（线程安全）"""
 
-            current_batch += "\n"
+    def __init__(self, default_interval: float, intervals: Optional[Dict] = None):
+        self.default_interval = max(0, default_interval)
+        self.intervals = {k: max(0, v) for k, v in (intervals or {}).items()}
+        self._lock = threading.Lock()
+        self._next_slot: Dict[str, float] = {}
 
-    if report_data["failed_ids"]:
-        failed_header = ""
-        if format_type == "wework":
-            failed_header = f"\n\n\n\n⚠️ **Data Fetchingfailed的平台：**\n\n"
-        elif format_type == "telegram":
-            failed_header = f"\n\n⚠️ Data Fetchingfailed的平台：\n\n"
-        elif format_type == "ntfy":
-            failed_header = f"\n\n⚠️ **Data Fetchingfailed的平台：**\n\n"
-        elif format_type == "feishu":
-            failed_header = f"\n{CONFIG['FEISHU_MESSAGE_SEPARATOR']}\n\n⚠️ **Data Fetchingfailed的平台：**\n\n"
-        elif format_type == "dingtalk":
-            failed_header = f"\n---\n\n⚠️ **Data Fetchingfailed的平台：**\n\n"
-
-        test_content = current_batch + failed_header
-        if (
-            len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8"))
-            >= max_bytes
-        ):
-            if current_batch_has_content:
-                batches.append(current_batch + base_footer)
-            current_batch = base_header + failed_header
-            current_batch_has_content = True
+    def acquire(self, channel: str, default_interval: Optional[float] = None) -> None:
+        """预约该渠道的下一个Sending时间片，并等待到达
+
+        default_interval 为渠道自身的建议间隔，配置文件中的渠道间隔优先
+        """
+        if channel in self.intervals:
+            interval = self.intervals[channel]
+        elif default_interval is not None:
+            interval = default_interval
         else:
-            current_batch = test_content
-            current_batch_has_content = True
+            interval = self.default_interval
 
-        for i, id_value in enumerate(report_data["failed_ids"], 1):
-            if format_type == "feishu":
-                failed_line = f"  • <font color='red'>{id_value}</font>\n"
-            elif format_type == "dingtalk":
-                failed_line = f"  • **{id_value}**\n"
-            else:
-                failed_line = f"  • {id_value}\n"
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot.get(channel, now))
+            self._next_slot[channel] = slot + interval
 
-            test_content = current_batch + failed_line
-            if (
-                len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8"))
-                >= max_bytes
-            ):
-                if current_batch_has_content:
-                    batches.append(current_batch + base_footer)
-                current_batch = base_header + failed_header + failed_line
-                current_batch_has_content = True
-            else:
-                current_batch = test_content
-                current_batch_has_content = True
+        delay = slot - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+
+
+NOTIFICATION_RATE_LIMITER = ChannelRateLimiter(
+    CONFIG["BATCH_SEND_INTERVAL"], CONFIG["CHANNEL_SEND_INTERVALS"]
+)
+
+
+class NotificationDispatcher:
+    """通知并发分发：每个渠道一个Sending队列和工作线程
 
-    # 完成最后batch
-    if current_batch_has_content:
-        batches.append(current_batch + base_footer)
+    渠道内的任务按提交顺序串行执行（批次间隔由 NOTIFICATION_RATE_LIMITER 控制），
+    渠道之间并行，一个慢渠道不会阻塞其他渠道。
+    """
+
+    def __init__(self):
+        self._queues: Dict[str, queue.Queue] = {}
+
+    def submit(self, channel: str, sender, *args) -> None:
+        """把Sending任务加入渠道队列，sender 返回 bool"""
+        self._queues.setdefault(channel, queue.Queue()).put((sender, args))
 
-    return batches
+    @staticmethod
+    def _drain(channel: str, jobs: queue.Queue) -> bool:
+        success = True
+        while True:
+            try:
+                sender, args = jobs.get_nowait()
+            except queue.Empty:
+                return success
+            try:
+                ok = bool(sender(*args))
+            except Exception as e:
+                print(f"{channel} 通知Sending出错：{e}")
+                ok = False
+            success = success and ok
+
+    def run(self) -> Dict[str, bool]:
+        """执行All渠道队列，返回 {渠道: 是否全部success}（按提交顺序）"""
+        if not self._queues:
+            return {}
+
+        with ThreadPoolExecutor(
+            max_workers=len(self._queues), thread_name_prefix="notify"
+        ) as executor:
+            futures = {
+                channel: executor.submit(self._drain, channel, jobs)
+                for channel, jobs in self._queues.items()
+            }
+        return {channel: future.result() for channel, future in futures.items()}
 
 
 def send_to_notifications(
@@ -3583,27 +3973,65 @@ def send_to_notifications(
 
     update_info_to_send = update_info if CONFIG["SHOW_VERSION_UPDATE"] else None
 
+    # 一次遍历为所有启用的渠道分批，各渠道不再各自重新格式化整份报告
+    enabled_formats = [
+        format_type
+        for format_type, enabled in (
+            ("feishu", feishu_url),
+            ("dingtalk", dingtalk_url),
+            ("wework", wework_url),
+            ("telegram", telegram_token and telegram_chat_id),
+            ("ntfy", ntfy_server_url and ntfy_topic),
+            ("bark", bark_url),
+            ("slack", slack_webhook_url),
+        )
+        if enabled
+    ]
+    channel_batches = split_content_for_formats(
+        report_data,
+        {
+            format_type: _get_channel_split_bytes(format_type)
+            for format_type in enabled_formats
+        },
+        update_info_to_send,
+        mode,
+    )
+
+    # 各渠道并发Sending，总耗时取决于最慢的渠道
+    dispatcher = NotificationDispatcher()
+
     # Sending到Feishu
     if feishu_url:
-        results["feishu"] = send_to_feishu(
-            feishu_url, report_data, report_type, update_info_to_send, proxy_url, mode
+        dispatcher.submit(
+            "feishu",
+            send_to_feishu,
+            feishu_url, report_data, report_type, update_info_to_send, proxy_url, mode,
+            channel_batches.get("feishu"),
         )
 
     # Sending到DingTalk
     if dingtalk_url:
-        results["dingtalk"] = send_to_dingtalk(
-            dingtalk_url, report_data, report_type, update_info_to_send, proxy_url, mode
+        dispatcher.submit(
+            "dingtalk",
+            send_to_dingtalk,
+            dingtalk_url, report_data, report_type, update_info_to_send, proxy_url, mode,
+            channel_batches.get("dingtalk"),
         )
 
     # Sending到WeCom
     if wework_url:
-        results["wework"] = send_to_wework(
-            wework_url, report_data, report_type, update_info_to_send, proxy_url, mode
+        dispatcher.submit(
+            "wework",
+            send_to_wework,
+            wework_url, report_data, report_type, update_info_to_send, proxy_url, mode,
+            channel_batches.get("wework"),
         )
 
     # Sending到 Telegram
     if telegram_token and telegram_chat_id:
-        results["telegram"] = send_to_telegram(
+        dispatcher.submit(
+            "telegram",
+            send_to_telegram,
             telegram_token,
             telegram_chat_id,
             report_data,
@@ -3611,11 +4039,14 @@ def send_to_notifications(
             update_info_to_send,
             proxy_url,
             mode,
+            channel_batches.get("telegram"),
         )
 
     # Sending到 ntfy
     if ntfy_server_url and ntfy_topic:
-        results["ntfy"] = send_to_ntfy(
+        dispatcher.submit(
+            "ntfy",
+            send_to_ntfy,
             ntfy_server_url,
             ntfy_topic,
             ntfy_token,
@@ -3624,33 +4055,42 @@ def send_to_notifications(
             update_info_to_send,
             proxy_url,
             mode,
+            channel_batches.get("ntfy"),
         )
 
     # Sending到 Bark
     if bark_url:
-        results["bark"] = send_to_bark(
+        dispatcher.submit(
+            "bark",
+            send_to_bark,
             bark_url,
             report_data,
             report_type,
             update_info_to_send,
             proxy_url,
             mode,
+            channel_batches.get("bark"),
         )
 
     # Sending到 Slack
     if slack_webhook_url:
-        results["slack"] = send_to_slack(
+        dispatcher.submit(
+            "slack",
+            send_to_slack,
             slack_webhook_url,
             report_data,
             report_type,
             update_info_to_send,
             proxy_url,
             mode,
+            channel_batches.get("slack"),
         )
 
     # Sending邮件
     if email_from and email_password and email_to:
-        results["email"] = send_to_email(
+        dispatcher.submit(
+            "email",
+            send_to_email,
             email_from,
             email_password,
             email_to,
@@ -3660,6 +4100,8 @@ def send_to_notifications(
             email_smtp_port,
         )
 
+    results = dispatcher.run()
+
     if not results:
         print("未配置任何通知渠道，跳过通知Sending")
 
@@ -3682,24 +4124,23 @@ def send_to_feishu(
     update_info: Optional[Dict] = None,
     proxy_url: Optional[str] = None,
     mode: str = "daily",
+    batches: Optional[List[str]] = None,
 ) -> bool:
     """Sending到Feishu（支持分批Sending）"""
     headers = {"Content-Type": "application/json"}
-    proxies = None
-    if proxy_url:
-        proxies = {"http": proxy_url, "https": proxy_url}
 
     # Fetch分批内容，使用Feishu专用的batch大小
     feishu_batch_size = CONFIG.get("FEISHU_BATCH_SIZE", 29000)
     # 预留batch头部空间，避免添加头部后超限
     header_reserve = _get_max_batch_header_size("feishu")
-    batches = split_content_into_batches(
-        report_data,
-        "feishu",
-        update_info,
-        max_bytes=feishu_batch_size - header_reserve,
-        mode=mode,
-    )
+    if batches is None:
+        batches = split_content_into_batches(
+            report_data,
+            "feishu",
+            update_info,
+            max_bytes=feishu_batch_size - header_reserve,
+            mode=mode,
+        )
 
     # 统一添加batch头部（已预留空间，不会超限）
     batches = add_batch_headers(batches, "feishu", feishu_batch_size)
@@ -3728,18 +4169,18 @@ def send_to_feishu(
             },
         }
 
+        # 渠道内按速率限制逐批Sending
+        NOTIFICATION_RATE_LIMITER.acquire("feishu")
+
         try:
-            response = requests.post(
-                webhook_url, headers=headers, json=payload, proxies=proxies, timeout=30
+            response = HTTP_POOL.post(
+                webhook_url, headers=headers, json=payload, proxy_url=proxy_url, timeout=30
             )
             if response.status_code == 200:
                 result = response.json()
                 # 检查Feishu的响应状态
                 if result.get("StatusCode") == 0 or result.get("code") == 0:
                     print(f"Feishu第 {i}/{len(batches)} batchessuccess [{report_type}]")
-                    # batch间间隔
-                    if i < len(batches):
-                        time.sleep(CONFIG["BATCH_SEND_INTERVAL"])
                 else:
                     error_msg = result.get("msg") or result.get("StatusMessage", "unknown错误")
                     print(
@@ -3766,24 +4207,23 @@ def send_to_dingtalk(
     update_info: Optional[Dict] = None,
     proxy_url: Optional[str] = None,
     mode: str = "daily",
+    batches: Optional[List[str]] = None,
 ) -> bool:
     """Sending到DingTalk（支持分批Sending）"""
     headers = {"Content-Type": "application/json"}
-    proxies = None
-    if proxy_url:
-        proxies = {"http": proxy_url, "https": proxy_url}
 
     # Fetch分批内容，使用DingTalk专用的batch大小
     dingtalk_batch_size = CONFIG.get("DINGTALK_BATCH_SIZE", 20000)
     # 预留batch头部空间，避免添加头部后超限
     header_reserve = _get_max_batch_header_size("dingtalk")
-    batches = split_content_into_batches(
-        report_data,
-        "dingtalk",
-        update_info,
-        max_bytes=dingtalk_batch_size - header_reserve,
-        mode=mode,
-    )
+    if batches is None:
+        batches = split_content_into_batches(
+            report_data,
+            "dingtalk",
+            update_info,
+            max_bytes=dingtalk_batch_size - header_reserve,
+            mode=mode,
+        )
 
     # 统一添加batch头部（已预留空间，不会超限）
     batches = add_batch_headers(batches, "dingtalk", dingtalk_batch_size)
@@ -3805,17 +4245,17 @@ def send_to_dingtalk(
             },
         }
 
+        # 渠道内按速率限制逐批Sending
+        NOTIFICATION_RATE_LIMITER.acquire("dingtalk")
+
         try:
-            response = requests.post(
-                webhook_url, headers=headers, json=payload, proxies=proxies, timeout=30
+            response = HTTP_POOL.post(
+                webhook_url, headers=headers, json=payload, proxy_url=proxy_url, timeout=30
             )
             if response.status_code == 200:
                 result = response.json()
                 if result.get("errcode") == 0:
                     print(f"DingTalk第 {i}/{len(batches)} batchessuccess [{report_type}]")
-                    # batch间间隔
-                    if i < len(batches):
-                        time.sleep(CONFIG["BATCH_SEND_INTERVAL"])
                 else:
                     print(
                         f"DingTalk第 {i}/{len(batches)} batchesfailed [{report_type}]，错误：{result.get('errmsg')}"
@@ -3885,12 +4325,10 @@ def send_to_wework(
     update_info: Optional[Dict] = None,
     proxy_url: Optional[str] = None,
     mode: str = "daily",
+    batches: Optional[List[str]] = None,
 ) -> bool:
     """Sending到WeCom（支持分批Sending，支持 markdown 和 text 两种格式）"""
     headers = {"Content-Type": "application/json"}
-    proxies = None
-    if proxy_url:
-        proxies = {"http": proxy_url, "https": proxy_url}
 
     # Fetch消息类型配置（markdown 或 text）
     msg_type = CONFIG.get("WEWORK_MSG_TYPE", "markdown").lower()
@@ -3907,9 +4345,10 @@ def send_to_wework(
     # Fetch分批内容，预留batch头部空间
     wework_batch_size = CONFIG.get("MESSAGE_BATCH_SIZE", 4000)
     header_reserve = _get_max_batch_header_size(header_format_type)
-    batches = split_content_into_batches(
-        report_data, "wework", update_info, max_bytes=wework_batch_size - header_reserve, mode=mode
-    )
+    if batches is None:
+        batches = split_content_into_batches(
+            report_data, "wework", update_info, max_bytes=wework_batch_size - header_reserve, mode=mode
+        )
 
     # 统一添加batch头部（已预留空间，不会超限）
     batches = add_batch_headers(batches, header_format_type, wework_batch_size)
@@ -3933,17 +4372,17 @@ def send_to_wework(
             f"SendingWeCom第 {i}/{len(batches)} batch，size:{batch_size} bytes [{report_type}]"
         )
 
+        # 渠道内按速率限制逐批Sending
+        NOTIFICATION_RATE_LIMITER.acquire("wework")
+
         try:
-            response = requests.post(
-                webhook_url, headers=headers, json=payload, proxies=proxies, timeout=30
+            response = HTTP_POOL.post(
+                webhook_url, headers=headers, json=payload, proxy_url=proxy_url, timeout=30
             )
             if response.status_code == 200:
                 result = response.json()
                 if result.get("errcode") == 0:
                     print(f"WeCom第 {i}/{len(batches)} batchessuccess [{report_type}]")
-                    # batch间间隔
-                    if i < len(batches):
-                        time.sleep(CONFIG["BATCH_SEND_INTERVAL"])
                 else:
                     print(
                         f"WeCom第 {i}/{len(batches)} batchesfailed [{report_type}]，错误：{result.get('errmsg')}"
@@ -3970,21 +4409,19 @@ def send_to_telegram(
     update_info: Optional[Dict] = None,
     proxy_url: Optional[str] = None,
     mode: str = "daily",
+    batches: Optional[List[str]] = None,
 ) -> bool:
     """Sending到Telegram（支持分批Sending）"""
     headers = {"Content-Type": "application/json"}
     url = f"https://api.telegram.org/bot{bot_token}/sendMessage"
 
-    proxies = None
-    if proxy_url:
-        proxies = {"http": proxy_url, "https": proxy_url}
-
     # Fetch分批内容，预留batch头部空间
     telegram_batch_size = CONFIG.get("MESSAGE_BATCH_SIZE", 4000)
     header_reserve = _get_max_batch_header_size("telegram")
-    batches = split_content_into_batches(
-        report_data, "telegram", update_info, max_bytes=telegram_batch_size - header_reserve, mode=mode
-    )
+    if batches is None:
+        batches = split_content_into_batches(
+            report_data, "telegram", update_info, max_bytes=telegram_batch_size - header_reserve, mode=mode
+        )
 
     # 统一添加batch头部（已预留空间，不会超限）
     batches = add_batch_headers(batches, "telegram", telegram_batch_size)
@@ -4005,17 +4442,17 @@ def send_to_telegram(
             "disable_web_page_preview": True,
         }
 
+        # 渠道内按速率限制逐批Sending
+        NOTIFICATION_RATE_LIMITER.acquire("telegram")
+
         try:
-            response = requests.post(
-                url, headers=headers, json=payload, proxies=proxies, timeout=30
+            response = HTTP_POOL.post(
+                url, headers=headers, json=payload, proxy_url=proxy_url, timeout=30
             )
             if response.status_code == 200:
                 result = response.json()
                 if result.get("ok"):
                     print(f"Telegram第 {i}/{len(batches)} batchessuccess [{report_type}]")
-                    # batch间间隔
-                    if i < len(batches):
-                        time.sleep(CONFIG["BATCH_SEND_INTERVAL"])
                 else:
                     print(
                         f"Telegram第 {i}/{len(batches)} batchesfailed [{report_type}]，错误：{result.get('description')}"
@@ -4183,6 +4620,7 @@ def send_to_ntfy(
     update_info: Optional[Dict] = None,
     proxy_url: Optional[str] = None,
     mode: str = "daily",
+    batches: Optional[List[str]] = None,
 ) -> bool:
     """Sending到ntfy（支持分批Sending，严格遵守4KB限制）"""
     # 避免 HTTP header 编码问题
@@ -4212,16 +4650,13 @@ def send_to_ntfy(
         base_url = f"https://{base_url}"
     url = f"{base_url}/{topic}"
 
-    proxies = None
-    if proxy_url:
-        proxies = {"http": proxy_url, "https": proxy_url}
-
     # Fetch分批内容，使用ntfy专用的4KB限制，预留batch头部空间
     ntfy_batch_size = 3800
     header_reserve = _get_max_batch_header_size("ntfy")
-    batches = split_content_into_batches(
-        report_data, "ntfy", update_info, max_bytes=ntfy_batch_size - header_reserve, mode=mode
-    )
+    if batches is None:
+        batches = split_content_into_batches(
+            report_data, "ntfy", update_info, max_bytes=ntfy_batch_size - header_reserve, mode=mode
+        )
 
     # 统一添加batch头部（已预留空间，不会超限）
     batches = add_batch_headers(batches, "ntfy", ntfy_batch_size)
@@ -4257,33 +4692,34 @@ def send_to_ntfy(
                 f"{report_type_en} ({actual_batch_num}/{total_batches})"
             )
 
+        # 公共服务器建议 2-3 秒，自托管可以更短
+        NOTIFICATION_RATE_LIMITER.acquire(
+            "ntfy", default_interval=2 if "ntfy.sh" in server_url else 1
+        )
+
         try:
-            response = requests.post(
+            response = HTTP_POOL.post(
                 url,
                 headers=current_headers,
                 data=batch_content.encode("utf-8"),
-                proxies=proxies,
+                proxy_url=proxy_url,
                 timeout=30,
             )
 
             if response.status_code == 200:
                 print(f"ntfy第 {actual_batch_num}/{total_batches} batchessuccess [{report_type}]")
                 success_count += 1
-                if idx < total_batches:
-                    # 公共服务器建议 2-3 秒，自托管可以更短
-                    interval = 2 if "ntfy.sh" in server_url else 1
-                    time.sleep(interval)
             elif response.status_code == 429:
                 print(
                     f"ntfy第 {actual_batch_num}/{total_batches} batchrate limited [{report_type}]，waiting to retry"
                 )
                 time.sleep(10)  # 等待10秒后重试
                 # 重试一次
-                retry_response = requests.post(
+                retry_response = HTTP_POOL.post(
                     url,
                     headers=current_headers,
                     data=batch_content.encode("utf-8"),
-                    proxies=proxies,
+                    proxy_url=proxy_url,
                     timeout=30,
                 )
                 if retry_response.status_code == 200:
@@ -4334,11 +4770,9 @@ def send_to_bark(
     update_info: Optional[Dict] = None,
     proxy_url: Optional[str] = None,
     mode: str = "daily",
+    batches: Optional[List[str]] = None,
 ) -> bool:
     """Send to Bark (supports batch sending, using markdown format)"""
-    proxies = None
-    if proxy_url:
-        proxies = {"http": proxy_url, "https": proxy_url}
 
     # Parse Bark URL，提取 device_key 和 API 端点
     # Bark URL 格式: https://api.day.app/device_key 或 https://bark.day.app/device_key
@@ -4357,9 +4791,10 @@ def send_to_bark(
     # Fetch分批内容（Bark 限制为 3600 bytes以避免 413 错误），预留batch头部空间
     bark_batch_size = CONFIG["BARK_BATCH_SIZE"]
     header_reserve = _get_max_batch_header_size("bark")
-    batches = split_content_into_batches(
-        report_data, "bark", update_info, max_bytes=bark_batch_size - header_reserve, mode=mode
-    )
+    if batches is None:
+        batches = split_content_into_batches(
+            report_data, "bark", update_info, max_bytes=bark_batch_size - header_reserve, mode=mode
+        )
 
     # 统一添加batch头部（已预留空间，不会超限）
     batches = add_batch_headers(batches, "bark", bark_batch_size)
@@ -4400,11 +4835,14 @@ def send_to_bark(
             "action": "none",  # 点击推送跳到 APP 不弹出弹框,方便阅读
         }
 
+        # 渠道内按速率限制逐批Sending
+        NOTIFICATION_RATE_LIMITER.acquire("bark")
+
         try:
-            response = requests.post(
+            response = HTTP_POOL.post(
                 api_endpoint,
                 json=payload,
-                proxies=proxies,
+                proxy_url=proxy_url,
                 timeout=30,
             )
 
@@ -4413,9 +4851,6 @@ def send_to_bark(
                 if result.get("code") == 200:
                     print(f"Bark第 {actual_batch_num}/{total_batches} batchessuccess [{report_type}]")
                     success_count += 1
-                    # batch间间隔
-                    if idx < total_batches:
-                        time.sleep(CONFIG["BATCH_SEND_INTERVAL"])
                 else:
                     print(
                         f"Bark第 {actual_batch_num}/{total_batches} batchesfailed [{report_type}]，错误：{result.get('message', 'unknown错误')}"
@@ -4475,19 +4910,18 @@ def send_to_slack(
     update_info: Optional[Dict] = None,
     proxy_url: Optional[str] = None,
     mode: str = "daily",
+    batches: Optional[List[str]] = None,
 ) -> bool:
     """Sending到Slack（支持分批Sending，使用 mrkdwn 格式）"""
     headers = {"Content-Type": "application/json"}
-    proxies = None
-    if proxy_url:
-        proxies = {"http": proxy_url, "https": proxy_url}
 
     # Fetch分批内容（使用 Slack batch大小），预留batch头部空间
     slack_batch_size = CONFIG["SLACK_BATCH_SIZE"]
     header_reserve = _get_max_batch_header_size("slack")
-    batches = split_content_into_batches(
-        report_data, "slack", update_info, max_bytes=slack_batch_size - header_reserve, mode=mode
-    )
+    if batches is None:
+        batches = split_content_into_batches(
+            report_data, "slack", update_info, max_bytes=slack_batch_size - header_reserve, mode=mode
+        )
 
     # 统一添加batch头部（已预留空间，不会超限）
     batches = add_batch_headers(batches, "slack", slack_batch_size)
@@ -4509,17 +4943,17 @@ def send_to_slack(
             "text": mrkdwn_content
         }
 
+        # 渠道内按速率限制逐批Sending
+        NOTIFICATION_RATE_LIMITER.acquire("slack")
+
         try:
-            response = requests.post(
-                webhook_url, headers=headers, json=payload, proxies=proxies, timeout=30
+            response = HTTP_POOL.post(
+                webhook_url, headers=headers, json=payload, proxy_url=proxy_url, timeout=30
             )
 
             # Slack Incoming Webhooks success时返回 "ok" 文本
             if response.status_code == 200 and response.text == "ok":
                 print(f"Slack第 {i}/{len(batches)} batchessuccess [{report_type}]")
-                # batch间间隔
-                if i < len(batches):
-                    time.sleep(CONFIG["BATCH_SEND_INTERVAL"])
             else:
                 error_msg = response.text if response.text else f"状态码：{response.status_code}"
                 print(
@@ -4920,7 +5354,13 @@ class NewsAnalyzer:
         print(
             f"配置的监控平台: {[p.get('name', p['id']) for p in CONFIG['PLATFORMS']]}"
         )
-        print(f"开始爬取数据，Request间隔 {self.request_interval} 毫秒")
+        if self.data_fetcher.max_workers > 1:
+            print(
+                f"开始爬取数据，并发数 {self.data_fetcher.max_workers}，"
+                f"同一主机Request间隔 {CONFIG['HOST_REQUEST_INTERVAL']} 毫秒"
+            )
+        else:
+            print(f"开始爬取数据，Request间隔 {self.request_interval} 毫秒")
         ensure_directory_exists("output")
 
         results, id_to_name, failed_ids = self.data_fetcher.crawl_websites(
@@ -5062,6 +5502,12 @@ class NewsAnalyzer:
         except Exception as e:
             print(f"Analysis process execution error: {e}")
             raise
+        finally:
+            metrics = HTTP_POOL.metrics.format_summary()
+            if metrics:
+                print("HTTP 请求统计:")
+                for line in metrics:
+                    print(f"  {line}")
 
 
 def main():
@@ -254,9 +254,13 @@ async def analyze_topic_trend(
                     - **格式**: {"start": "YYYY-MM-DD", "end": "YYYY-MM-DD"}
                     - **获取方式**: 调用 resolve_date_range 工具解析自然语言日期
                     - **默认**: 不指定时默认分析最近7天
-        granularity: 时间粒度（trend模式），默认"day"（仅支持 day，因为底层数据按天聚合）
+        granularity: 时间粒度（trend模式），默认"day"
+                    - 可选值: "hour"（按小时）、"day"（按天）、"week"（按周，从周一开始）
+                    - 按批次文件名中的爬取时间聚合，每个时间段统计出现过的不同标题数
         threshold: 热度突增倍数阈值（viral模式），默认3.0
-        time_window: 检测时间窗口小时数（viral模式），默认24
+                  - 窗口内平均在榜标题数 / 窗口开始前的 EWMA 基线
+        time_window: 检测时间窗口小时数（viral模式），默认24，最长72
+                    - 截至最新一次爬取批次，可跨越多天
         lookahead_hours: 预测未来小时数（predict模式），默认6
         confidence_threshold: 置信度阈值（predict模式），默认0.7
 
@@ -309,6 +313,7 @@ async def analyze_data_insights(
                     - **格式**: {"start": "YYYY-MM-DD", "end": "YYYY-MM-DD"}
                     - **示例**: {"start": "2025-01-01", "end": "2025-01-07"}
                     - **重要**: 必须是对象格式，不能传递整数
+                    - keyword_cooccur模式不指定时分析今天，指定时统计整个范围内的共现
         min_frequency: 最小共现频次（keyword_cooccur模式），默认3
         top_n: 返回TOP N结果（keyword_cooccur模式），默认20
 
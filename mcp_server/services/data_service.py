@@ -11,6 +11,8 @@ from typing import Dict, List, Optional, Tuple
 
 from .cache_service import get_cache
 from .parser_service import ParserService
+from .keyword_stats import KeywordStatsService
+from .search_index import SearchIndexService
 from ..utils.errors import DataNotFoundError
 
 
@@ -25,6 +27,8 @@ class DataService:
             project_root: 项目根目录
         """
         self.parser = ParserService(project_root)
+        self.search_index = SearchIndexService(self.parser)
+        self.keyword_stats = KeywordStatsService(self.parser)
         self.cache = get_cache()
 
     def get_latest_news(
@@ -214,45 +218,40 @@ class DataService:
         results = []
         platform_distribution = Counter()
 
-        # 遍历日期范围
+        # 遍历日期范围（需要建索引的日期由解析服务并行读取，没有数据的日期被跳过）
+        search_dates = []
         current_date = start_date
         while current_date <= end_date:
-            try:
-                all_titles, id_to_name, _ = self.parser.read_all_titles_for_date(
-                    date=current_date,
-                    platform_ids=platforms
-                )
-
-                # 搜索包含关键词的标题
-                for platform_id, titles in all_titles.items():
-                    platform_name = id_to_name.get(platform_id, platform_id)
-
-                    for title, info in titles.items():
-                        if keyword.lower() in title.lower():
-                            # 计算平均排名
-                            avg_rank = sum(info["ranks"]) / len(info["ranks"]) if info["ranks"] else 0
-
-                            results.append({
-                                "title": title,
-                                "platform": platform_id,
-                                "platform_name": platform_name,
-                                "ranks": info["ranks"],
-                                "count": len(info["ranks"]),
-                                "avg_rank": round(avg_rank, 2),
-                                "url": info.get("url", ""),
-                                "mobileUrl": info.get("mobileUrl", ""),
-                                "date": current_date.strftime("%Y-%m-%d")
-                            })
-
-                            platform_distribution[platform_id] += 1
-
-            except DataNotFoundError:
-                # 该日期没有数据,继续下一天
-                pass
-
-            # 下一天
+            search_dates.append(current_date)
             current_date += timedelta(days=1)
 
+        for current_date, index in self.search_index.iter_indexes(search_dates):
+            # 倒排索引只返回包含关键词的标题
+            matched_titles = index.titles_for(index.search_ids(keyword, platforms))
+            id_to_name = index.id_to_name
+
+            for platform_id, titles in matched_titles.items():
+                platform_name = id_to_name.get(platform_id, platform_id)
+
+                for title, info in titles.items():
+                    if keyword.lower() in title.lower():
+                        # 计算平均排名
+                        avg_rank = sum(info["ranks"]) / len(info["ranks"]) if info["ranks"] else 0
+
+                        results.append({
+                            "title": title,
+                            "platform": platform_id,
+                            "platform_name": platform_name,
+                            "ranks": info["ranks"],
+                            "count": len(info["ranks"]),
+                            "avg_rank": round(avg_rank, 2),
+                            "url": info.get("url", ""),
+                            "mobileUrl": info.get("mobileUrl", ""),
+                            "date": current_date.strftime("%Y-%m-%d")
+                        })
+
+                        platform_distribution[platform_id] += 1
+
         if not results:
             raise DataNotFoundError(
                 f"未找到包含关键词 '{keyword}' 的新闻",
@@ -0,0 +1,658 @@
+"""
+关键词统计服务
+
+为每天的新闻标题预先计算关键词统计，分析类工具只需做聚合：
+- 关键词出现次数与关键词 -> 标题倒排表
+- 各平台的关键词计数
+- 标题 x 关键词的稀疏计数矩阵（CSR），共现对由 newshawk.cooccurrence 按需计算
+- 每个批次（按爬取时间）在榜的标题及排名，供 newshawk.timeseries 做分时序列
+
+已结束的日期统计一次后持久化到 output/<日期>/keyword_stats.json；
+当天的统计保存在内存中，有新批次文件时只处理新增的标题。
+"""
+
+import json
+import os
+import re
+import threading
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from newshawk.anomaly import EwmaDetector, KeywordBurst
+from newshawk.cooccurrence import KeywordMatrix
+from newshawk.parser import merge_titles_files, parse_titles_file
+from newshawk.timeseries import DayBatches, batch_minute
+
+from ..utils.errors import DataNotFoundError
+from .parser_service import ParserService, iter_day_jobs
+
+
+STATS_VERSION = 3
+STATS_FILENAME = "keyword_stats.json"
+
+# 内存中最多保留的日期统计数
+MAX_CACHED_DAYS = 64
+
+# 热度检测器并入的历史天数（time_window 最长 72 小时，另留一天建立基线）
+DETECTOR_HISTORY_DAYS = 4
+
+_URL_PATTERN = re.compile(r'http[s]?://\S+')
+_NON_WORD_PATTERN = re.compile(r'[^\w\s]')
+_WORD_SEPARATORS = re.compile(r'[\s，。！？、]+')
+
+STOPWORDS = frozenset({
+    '的', '了', '在', '是', '我', '有', '和', '就', '不', '人', '都', '一', '一个',
+    '上', '也', '很', '到', '说', '要', '去', '你', '会', '着', '没有', '看', '好',
+    '自己', '这'
+})
+
+
+def extract_keywords(title: str, min_length: int = 2) -> List[str]:
+    """
+    从标题中提取关键词（简单实现）
+
+    Args:
+        title: 标题文本
+        min_length: 最小关键词长度
+
+    Returns:
+        关键词列表（按出现顺序，可能重复）
+    """
+    # 移除URL和特殊字符
+    title = _URL_PATTERN.sub('', title)
+    title = _NON_WORD_PATTERN.sub(' ', title)
+
+    # 按空格和常见分隔符切分，过滤停用词和短词
+    keywords = []
+    for word in _WORD_SEPARATORS.split(title):
+        word = word.strip()
+        if word and len(word) >= min_length and word not in STOPWORDS:
+            keywords.append(word)
+    return keywords
+
+
+class DayKeywordStats:
+    """单日关键词统计"""
+
+    def __init__(
+        self,
+        docs: List[List[str]],
+        id_to_name: Dict[str, str],
+        counts: Dict[str, int],
+        postings: Dict[str, List[int]],
+        platform_counts: Dict[str, Dict[str, int]],
+        indptr: List[int],
+        indices: List[int],
+        data: List[int],
+        batches: Dict[str, List],
+        signature: List,
+    ):
+        """
+        Args:
+            docs: 文档列表，每项为 [platform_id, title]，按首次出现的批次顺序
+            id_to_name: 平台ID到名称映射
+            counts: 关键词 -> 出现次数（同一标题内重复出现计多次），
+                    键的顺序即关键词ID（首次出现的顺序）
+            postings: 关键词 -> 升序文档ID列表
+            platform_counts: 平台ID -> {关键词: 出现次数}
+            indptr: 每个文档在 indices/data 中的起始位置（长度为文档数+1）
+            indices: 文档内各关键词的ID
+            data: 文档内各关键词的出现次数
+            batches: 各批次在榜的标题，{"names": 文件名列表, "indptr": 每个批次在
+                     docs/ranks 中的起始位置, "docs": 文档ID, "ranks": 该批次中的最高排名}
+            signature: 统计时的批次文件签名
+        """
+        self.docs = docs
+        self.id_to_name = id_to_name
+        self.counts = counts
+        self.postings = postings
+        self.platform_counts = platform_counts
+        self.indptr = indptr
+        self.indices = indices
+        self.data = data
+        self.batches = batches
+        self.signature = signature
+        self._day_batches: Optional[DayBatches] = None
+        # (platform_id, title) -> 文档ID，增量更新时去重
+        self._doc_ids = {(doc[0], doc[1]): i for i, doc in enumerate(docs)}
+        self.vocabulary = list(counts)
+        self._keyword_ids = {keyword: i for i, keyword in enumerate(self.vocabulary)}
+
+    @classmethod
+    def empty(cls) -> "DayKeywordStats":
+        return cls([], {}, {}, {}, {}, [0], [], [],
+                   {"names": [], "indptr": [0], "docs": [], "ranks": []}, [])
+
+    def copy(self) -> "DayKeywordStats":
+        """可独立更新的副本（缓存中的统计可能正被其它线程读取）"""
+        return DayKeywordStats(
+            list(self.docs),
+            dict(self.id_to_name),
+            dict(self.counts),
+            {keyword: list(doc_ids) for keyword, doc_ids in self.postings.items()},
+            {platform_id: dict(counts) for platform_id, counts in self.platform_counts.items()},
+            list(self.indptr),
+            list(self.indices),
+            list(self.data),
+            {name: list(column) for name, column in self.batches.items()},
+            list(self.signature),
+        )
+
+    def add_batch(self, name: str, titles_by_id: Dict, id_to_name: Dict) -> None:
+        """
+        合并一个批次文件的标题（已统计过的标题只会出现一次）
+
+        Args:
+            name: 批次文件名（含爬取时间）
+            titles_by_id: {platform_id: {title: {ranks, ...}}}
+            id_to_name: 平台ID到名称映射
+        """
+        self.id_to_name.update(id_to_name)
+        batch_docs = self.batches["docs"]
+        batch_ranks = self.batches["ranks"]
+        for platform_id, titles in titles_by_id.items():
+            platform_counts = self.platform_counts.setdefault(platform_id, {})
+            for title, info in titles.items():
+                key = (platform_id, title)
+                doc_id = self._doc_ids.get(key)
+                batch_docs.append(len(self.docs) if doc_id is None else doc_id)
+                batch_ranks.append(min(info.get("ranks") or [1]))
+                if doc_id is not None:
+                    continue
+                doc_id = len(self.docs)
+                self._doc_ids[key] = doc_id
+                self.docs.append([platform_id, title])
+
+                title_counts: Dict[str, int] = {}
+                for keyword in extract_keywords(title):
+                    title_counts[keyword] = title_counts.get(keyword, 0) + 1
+
+                for keyword, count in title_counts.items():
+                    keyword_id = self._keyword_ids.get(keyword)
+                    if keyword_id is None:
+                        keyword_id = self._keyword_ids[keyword] = len(self.vocabulary)
+                        self.vocabulary.append(keyword)
+                    self.counts[keyword] = self.counts.get(keyword, 0) + count
+                    platform_counts[keyword] = platform_counts.get(keyword, 0) + count
+                    self.postings.setdefault(keyword, []).append(doc_id)
+                    self.indices.append(keyword_id)
+                    self.data.append(count)
+                self.indptr.append(len(self.indices))
+
+        self.batches["names"].append(name)
+        self.batches["indptr"].append(len(batch_docs))
+        self._day_batches = None
+
+    def titles(self, doc_ids: Iterable[int]) -> List[str]:
+        return [self.docs[doc_id][1] for doc_id in doc_ids]
+
+    def keyword_titles(self, keyword: str, limit: Optional[int] = None) -> List[str]:
+        """
+        包含关键词的标题（按文档顺序）
+
+        Args:
+            keyword: 关键词
+            limit: 最多返回条数
+
+        Returns:
+            标题列表
+        """
+        return self.titles(self.postings.get(keyword, [])[:limit])
+
+    def pair_titles(self, keyword1: str, keyword2: str, limit: Optional[int] = None) -> List[str]:
+        """同时包含两个关键词的标题（按文档顺序）"""
+        other = set(self.postings.get(keyword2, []))
+        doc_ids = [doc_id for doc_id in self.postings.get(keyword1, []) if doc_id in other]
+        return self.titles(doc_ids[:limit])
+
+    def day_batches(self, date: datetime) -> DayBatches:
+        """当天各批次的在榜数据（NumPy 列，首次使用时建立）"""
+        day_batches = self._day_batches
+        if day_batches is None:
+            day_batches = self._day_batches = DayBatches(
+                date.date(),
+                [batch_minute(name) for name in self.batches["names"]],
+                self.batches["indptr"],
+                self.batches["docs"],
+                self.batches["ranks"],
+            )
+        return day_batches
+
+    def keyword_series(
+        self, date: datetime, keyword: str
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        关键词在各批次的在榜标题数与最高排名
+
+        Args:
+            date: 统计所属的日期
+            keyword: 关键词
+
+        Returns:
+            (batch_times, counts, best_ranks) 三个等长 NumPy 数组，
+            best_ranks 为 0 表示该批次没有相关标题
+        """
+        day_batches = self.day_batches(date)
+        counts, best_ranks = day_batches.series(self.postings.get(keyword, []))
+        return day_batches.times, counts, best_ranks
+
+    def doc_ids_for(self, docs: Iterable[List]) -> List[int]:
+        """把 [platform_id, title, ...] 形式的文档（如倒排索引的命中）转换为统计中的文档ID"""
+        doc_ids = (self._doc_ids.get((doc[0], doc[1])) for doc in docs)
+        return [doc_id for doc_id in doc_ids if doc_id is not None]
+
+    def _doc_keywords(self, doc_ids: np.ndarray) -> np.ndarray:
+        """一组文档包含的关键词ID（每个文档内不重复）"""
+        indptr = np.asarray(self.indptr, dtype=np.int64)
+        starts = indptr[doc_ids]
+        lengths = indptr[doc_ids + 1] - starts
+        offsets = np.cumsum(lengths) - lengths
+        positions = np.repeat(starts - offsets, lengths) + np.arange(int(lengths.sum()))
+        return np.asarray(self.indices, dtype=np.int64)[positions]
+
+    def keyword_doc_counts(self, doc_ids) -> Dict[str, int]:
+        """
+        一组文档中包含各关键词的文档数
+
+        Args:
+            doc_ids: 文档ID（不重复）
+
+        Returns:
+            {关键词: 文档数}，只包含出现过的关键词
+        """
+        keyword_ids = self._doc_keywords(np.asarray(doc_ids, dtype=np.int64))
+        counts = np.bincount(keyword_ids)
+        vocabulary = self.vocabulary
+        return {vocabulary[i]: int(counts[i]) for i in np.flatnonzero(counts)}
+
+    def batch_keyword_counts(self, start: int = 0) -> Iterator[Tuple[str, Dict[str, int]]]:
+        """
+        逐个批次给出在榜标题中各关键词的标题数
+
+        Args:
+            start: 从第几个批次开始
+
+        Yields:
+            (批次文件名, {关键词: 标题数})，按批次顺序
+        """
+        indptr = self.batches["indptr"]
+        docs = self.batches["docs"]
+        for i in range(start, len(self.batches["names"])):
+            yield self.batches["names"][i], self.keyword_doc_counts(docs[indptr[i]:indptr[i + 1]])
+
+    def docs_after(self, date: datetime, after: datetime) -> np.ndarray:
+        """在 after 之后的批次中出现过的文档ID（升序）"""
+        day_batches = self.day_batches(date)
+        recent = day_batches.times > np.datetime64(after, "m")
+        return np.unique(day_batches.docs[recent[day_batches.batch_of]])
+
+    def keyword_titles_in(self, keyword: str, doc_ids: np.ndarray, limit: Optional[int] = None) -> List[str]:
+        """关键词倒排表中属于 doc_ids 的标题（按文档顺序）"""
+        postings = np.asarray(self.postings.get(keyword, []), dtype=np.int64)
+        matched = postings[np.isin(postings, doc_ids)]
+        return self.titles(matched[:limit].tolist())
+
+    def add_to_matrix(self, matrix: KeywordMatrix) -> None:
+        """把当天的标题行并入（可能跨多天的）关键词矩阵"""
+        matrix.add_rows(self.vocabulary, self.indptr, self.indices, self.data)
+
+    def to_dict(self) -> Dict:
+        return {
+            "version": STATS_VERSION,
+            "signature": self.signature,
+            "id_to_name": self.id_to_name,
+            "docs": self.docs,
+            "counts": self.counts,
+            "postings": self.postings,
+            "platform_counts": self.platform_counts,
+            "indptr": self.indptr,
+            "indices": self.indices,
+            "data": self.data,
+            "batches": self.batches,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> Optional["DayKeywordStats"]:
+        if data.get("version") != STATS_VERSION:
+            return None
+        return cls(
+            data["docs"],
+            data["id_to_name"],
+            data["counts"],
+            data["postings"],
+            data["platform_counts"],
+            data["indptr"],
+            data["indices"],
+            data["data"],
+            data["batches"],
+            data["signature"],
+        )
+
+
+def _add_batches(stats: DayKeywordStats, txt_dir: Path, entries: List) -> None:
+    """把签名中列出的批次文件并入统计"""
+    for name, _, _ in entries:
+        txt_file = txt_dir / name
+        try:
+            titles_by_id, id_to_name = parse_titles_file(txt_file)
+        except Exception as e:
+            # 与 read_all_titles_for_date 一致：跳过无法解析的文件
+            print(f"Warning: 解析文件 {txt_file} 失败: {e}")
+            continue
+        stats.add_batch(name, titles_by_id, id_to_name)
+
+
+def build_day_stats(
+    txt_dir: str, signature: List, with_titles: bool = False
+) -> Tuple[DayKeywordStats, Optional[Tuple[Dict, Dict, Dict]]]:
+    """
+    从头统计一天的批次文件（在进程池中运行）
+
+    Args:
+        txt_dir: 当天的 txt 目录
+        signature: 批次文件签名
+        with_titles: 是否同时返回合并后的标题（同一进程内复用解析缓存，批次只解析一次）
+
+    Returns:
+        (stats, titles)：titles 与 merge_titles_files 的结果相同，
+        with_titles 为 False 时为 None
+    """
+    txt_dir = Path(txt_dir)
+    stats = DayKeywordStats.empty()
+    _add_batches(stats, txt_dir, signature)
+    stats.signature = signature
+    titles = None
+    if with_titles:
+        titles = merge_titles_files([txt_dir / name for name, _, _ in signature])
+    return stats, titles
+
+
+class KeywordStatsService:
+    """按日期管理关键词统计（进程内共享）"""
+
+    _stats: "OrderedDict[str, DayKeywordStats]" = OrderedDict()
+    _lock = threading.Lock()
+
+    # 项目根目录 -> (检测器, 已并入的 [(日期目录, [批次文件名...])])
+    _detectors: Dict[str, Tuple[EwmaDetector, List[Tuple[str, List[str]]]]] = {}
+    _detector_lock = threading.Lock()
+
+    def __init__(self, parser: ParserService):
+        """
+        初始化关键词统计服务
+
+        Args:
+            parser: 文件解析服务
+        """
+        self.parser = parser
+
+    def _day_dir(self, date: datetime) -> Path:
+        return self.parser.project_root / "output" / self.parser.get_date_folder_name(date)
+
+    @staticmethod
+    def _signature(txt_dir: Path) -> List:
+        signature = []
+        for txt_file in sorted(txt_dir.glob("*.txt")):
+            stat = txt_file.stat()
+            signature.append([txt_file.name, stat.st_size, stat.st_mtime_ns])
+        return signature
+
+    @staticmethod
+    def _load_persisted(stats_path: Path, signature: List) -> Optional[DayKeywordStats]:
+        try:
+            with open(stats_path, "r", encoding="utf-8") as f:
+                stats = DayKeywordStats.from_dict(json.load(f))
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+        if stats is None or stats.signature != signature:
+            return None
+        return stats
+
+    @staticmethod
+    def _persist(stats_path: Path, stats: DayKeywordStats) -> None:
+        tmp_path = stats_path.with_name(stats_path.name + ".tmp")
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(stats.to_dict(), f, ensure_ascii=False, separators=(",", ":"))
+            os.replace(tmp_path, stats_path)
+        except OSError as e:
+            print(f"Warning: 写入关键词统计失败 {stats_path}: {e}")
+
+    def _day_signature(self, date: datetime) -> Tuple[Path, List]:
+        """
+        某天的数据目录及批次文件签名
+
+        Raises:
+            DataNotFoundError: 数据目录不存在或没有数据文件
+        """
+        day_dir = self._day_dir(date)
+        txt_dir = day_dir / "txt"
+        if not txt_dir.exists():
+            raise DataNotFoundError(
+                f"未找到 {day_dir.name} 的数据目录",
+                suggestion="请先运行爬虫或检查日期是否正确"
+            )
+        signature = self._signature(txt_dir)
+        if not signature:
+            raise DataNotFoundError(
+                f"{day_dir.name} 没有数据文件",
+                suggestion="请等待爬虫任务完成"
+            )
+        return day_dir, signature
+
+    def _ready_stats(self, date: datetime, day_dir: Path, signature: List) -> Optional[DayKeywordStats]:
+        """内存中或已持久化的最新统计，没有则返回 None"""
+        key = str(day_dir)
+        with self._lock:
+            cached = self._stats.get(key)
+            if cached is not None and cached.signature == signature:
+                self._stats.move_to_end(key)
+                return cached
+
+        if date.date() < datetime.now().date():
+            stats = self._load_persisted(day_dir / STATS_FILENAME, signature)
+            if stats is not None:
+                self._remember(day_dir, stats)
+                return stats
+        return None
+
+    def _remember(self, day_dir: Path, stats: DayKeywordStats) -> None:
+        key = str(day_dir)
+        with self._lock:
+            self._stats[key] = stats
+            self._stats.move_to_end(key)
+            while len(self._stats) > MAX_CACHED_DAYS:
+                self._stats.popitem(last=False)
+
+    def _cached_prefix(self, day_dir: Path, signature: List) -> Optional[DayKeywordStats]:
+        """内存中只缺少新增批次的统计（可增量更新），没有则返回 None"""
+        with self._lock:
+            cached = self._stats.get(str(day_dir))
+        known = len(cached.signature) if cached is not None else 0
+        if known and cached.signature == signature[:known]:
+            return cached
+        return None
+
+    def _store(self, date: datetime, day_dir: Path, stats: DayKeywordStats) -> None:
+        """保存新算出的统计，已结束的日期同时持久化"""
+        if date.date() < datetime.now().date():
+            self._persist(day_dir / STATS_FILENAME, stats)
+        self._remember(day_dir, stats)
+
+    def get_stats(self, date: Optional[datetime] = None) -> DayKeywordStats:
+        """
+        获取指定日期的关键词统计（必要时计算）
+
+        Args:
+            date: 日期对象，默认为今天
+
+        Returns:
+            DayKeywordStats 实例
+
+        Raises:
+            DataNotFoundError: 数据不存在
+        """
+        if date is None:
+            date = datetime.now()
+        day_dir, signature = self._day_signature(date)
+
+        stats = self._ready_stats(date, day_dir, signature)
+        if stats is None:
+            cached = self._cached_prefix(day_dir, signature)
+            if cached is not None:
+                # 已统计的批次没有变化：只并入新增的批次
+                stats = cached.copy()
+                _add_batches(stats, day_dir / "txt", signature[len(cached.signature):])
+                stats.signature = signature
+            else:
+                stats, _ = build_day_stats(str(day_dir / "txt"), signature)
+            self._store(date, day_dir, stats)
+        return self._checked(stats, day_dir.name)
+
+    def iter_stats(
+        self,
+        dates: Iterable[datetime],
+        titles_for: Optional[Callable[[datetime], bool]] = None
+    ) -> Iterator[Tuple[datetime, DayKeywordStats, Optional[Tuple[Dict, Dict, Dict]]]]:
+        """
+        按日期顺序获取多天的统计
+
+        需要从头统计的日期交给共享进程池并行计算（见 iter_day_jobs），
+        当天的增量更新仍在当前线程中完成。titles_for 判断某天是否还需要
+        合并后的标题（例如该天的搜索索引尚未建立），这些标题与统计在同一个
+        任务中得到，批次文件只解析一次。
+
+        Args:
+            dates: 日期列表
+            titles_for: 可选，date -> 是否需要该天的标题
+
+        Yields:
+            (date, stats, titles)：titles 与 merge_titles_files 的结果相同，
+            不需要时为 None；没有有效数据的日期被跳过
+        """
+        plan = []
+        jobs = []
+        for date in dates:
+            try:
+                day_dir, signature = self._day_signature(date)
+            except DataNotFoundError:
+                continue
+            need_titles = bool(titles_for and titles_for(date))
+            stats = self._ready_stats(date, day_dir, signature)
+            if stats is None and self._cached_prefix(day_dir, signature) is not None:
+                # 当天的新批次：增量更新比重新统计便宜
+                try:
+                    stats = self.get_stats(date)
+                except DataNotFoundError:
+                    continue
+            if stats is None:
+                jobs.append((build_day_stats, (str(day_dir / "txt"), signature, need_titles)))
+            elif need_titles:
+                txt_files = [day_dir / "txt" / name for name, _, _ in signature]
+                jobs.append((merge_titles_files, (txt_files,)))
+            plan.append((date, day_dir, stats, stats is None or need_titles))
+
+        results = iter_day_jobs(jobs)
+        try:
+            for date, day_dir, stats, has_job in plan:
+                titles = None
+                if has_job:
+                    result = next(results)
+                    if stats is None:
+                        stats, titles = result
+                        self._store(date, day_dir, stats)
+                    else:
+                        titles = result
+                if stats.docs:
+                    yield date, stats, titles
+        finally:
+            results.close()
+
+    @staticmethod
+    def _checked(stats: DayKeywordStats, date_folder: str) -> DayKeywordStats:
+        if not stats.docs:
+            raise DataNotFoundError(
+                f"{date_folder} 没有有效的数据",
+                suggestion="请检查数据文件格式或重新运行爬虫"
+            )
+        return stats
+
+    @staticmethod
+    def _continues(fed: List[Tuple[str, List[str]]], days: List[Tuple[str, DayKeywordStats]]) -> bool:
+        """已并入的批次是否仍是当前数据的前缀（否则需要重建检测器）"""
+        if len(fed) > len(days):
+            return False
+        for position, (folder, names) in enumerate(fed):
+            day_folder, stats = days[position]
+            current = stats.batches["names"]
+            if day_folder != folder or current[:len(names)] != names:
+                return False
+            # 只有最后一天可以追加批次
+            if position < len(fed) - 1 and len(current) != len(names):
+                return False
+        return True
+
+    def update_detector(self) -> Tuple[EwmaDetector, List[Tuple[datetime, DayKeywordStats]]]:
+        """
+        把最近几天尚未处理的批次按时间顺序并入热度检测器
+
+        Returns:
+            (detector, days)：检测器，以及参与检测的 (日期, 统计) 列表（按日期升序）
+        """
+        today = datetime.now()
+        days = []
+        for offset in range(DETECTOR_HISTORY_DAYS, -1, -1):
+            date = today - timedelta(days=offset)
+            try:
+                days.append((date, self.get_stats(date)))
+            except DataNotFoundError:
+                continue
+        folders = [(self.parser.get_date_folder_name(date), stats) for date, stats in days]
+
+        root = str(self.parser.project_root)
+        with self._detector_lock:
+            detector, fed = self._detectors.get(root, (None, []))
+            if detector is None or not self._continues(fed, folders):
+                detector, fed = EwmaDetector(), []
+
+            for position, (date, stats) in enumerate(days):
+                if position == len(fed):
+                    fed.append((folders[position][0], []))
+                names = fed[position][1]
+                midnight = datetime(date.year, date.month, date.day)
+                for name, counts in stats.batch_keyword_counts(start=len(names)):
+                    batch_time = midnight + timedelta(minutes=batch_minute(name))
+                    if detector.last_time is not None:
+                        # 文件名中没有时间的批次排在前一批次之后
+                        batch_time = max(batch_time, datetime.fromtimestamp(detector.last_time * 60))
+                    detector.update(batch_time, counts)
+                    names.append(name)
+
+            self._detectors[root] = (detector, fed)
+        return detector, days
+
+    def keyword_bursts(
+        self, window_hours: float
+    ) -> Tuple[List[KeywordBurst], Optional[datetime], List[Tuple[datetime, DayKeywordStats]]]:
+        """
+        最近 window_hours 小时（截至最新批次）内出现过的关键词及其相对基线的热度
+
+        Args:
+            window_hours: 时间窗口（小时）
+
+        Returns:
+            (bursts, window_start, days)：各关键词的窗口热度、窗口起点（无数据时为 None）、
+            参与检测的 (日期, 统计) 列表
+        """
+        detector, days = self.update_detector()
+        with self._detector_lock:
+            bursts = detector.bursts(window_hours)
+            last_time = detector.last_time
+        if last_time is None:
+            return [], None, days
+        window_start = datetime.fromtimestamp(last_time * 60) - timedelta(hours=window_hours)
+        return bursts, window_start, days
@@ -4,17 +4,102 @@
 提供txt格式新闻数据和YAML配置文件的解析功能。
 """
 
+import os
 import re
+import threading
+from concurrent.futures import CancelledError, Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional
+from typing import Callable, Dict, Iterable, Iterator, List, Tuple, Optional
 from datetime import datetime
 
 import yaml
 
+from newshawk.parser import merge_titles_files, parse_titles_file
+
 from ..utils.errors import FileParseError, DataNotFoundError
 from .cache_service import get_cache
 
 
+def _available_cpus() -> int:
+    """当前进程可用的 CPU 数（考虑 CPU 亲和性 / 容器限制）"""
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0)) or 1
+    return os.cpu_count() or 1
+
+
+# 并行读取多天数据时的工作进程数
+RANGE_LOAD_WORKERS = _available_cpus()
+
+# 进程池在第一次多天读取时创建，整个进程共享
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_lock = threading.Lock()
+
+
+def _get_pool() -> Optional[ProcessPoolExecutor]:
+    """共享进程池（当前环境无法创建子进程时返回 None）"""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            try:
+                _pool = ProcessPoolExecutor(max_workers=RANGE_LOAD_WORKERS)
+            except (OSError, NotImplementedError) as e:
+                print(f"Warning: 无法创建进程池，按顺序执行: {e}")
+                return None
+        return _pool
+
+
+def _reset_pool() -> None:
+    """丢弃已损坏的进程池，下次使用时重新创建"""
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown(wait=False, cancel_futures=True)
+            _pool = None
+
+
+def iter_day_jobs(jobs: List[Tuple[Callable, tuple]]) -> Iterator:
+    """
+    按顺序产出各天任务的结果；两个及以上任务时提交到共享进程池并行执行
+
+    任务函数与参数必须可以 pickle（模块级函数、普通数据）。前面的结果
+    可以在后面的任务仍在执行时先被处理；进程池不可用或中途损坏时，
+    其余任务在调用方线程中执行。调用方提前结束遍历时，尚未开始的任务被取消。
+
+    Args:
+        jobs: [(函数, 参数元组)]
+
+    Yields:
+        各任务的返回值（与 jobs 顺序相同）
+    """
+    futures: Dict[int, Future] = {}
+    pool = _get_pool() if len(jobs) >= 2 and RANGE_LOAD_WORKERS >= 2 else None
+    if pool is not None:
+        try:
+            for position, (function, args) in enumerate(jobs):
+                futures[position] = pool.submit(function, *args)
+        except (BrokenProcessPool, RuntimeError):
+            # 已提交的任务照常使用，其余任务在调用方线程中执行
+            _reset_pool()
+
+    try:
+        for position, (function, args) in enumerate(jobs):
+            future = futures.get(position)
+            if future is not None:
+                try:
+                    yield future.result()
+                    continue
+                except BrokenProcessPool:
+                    _reset_pool()
+                except CancelledError:
+                    # 进程池已被重建
+                    pass
+            yield function(*args)
+    finally:
+        for future in futures.values():
+            future.cancel()
+
+
 class ParserService:
     """文件解析服务类"""
 
@@ -70,79 +155,12 @@ class ParserService:
         if not file_path.exists():
             raise FileParseError(str(file_path), "文件不存在")
 
-        titles_by_id = {}
-        id_to_name = {}
-
+        # 共享解析模块：优先读取 .snap 快照，同一文件在进程内只解析一次
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                content = f.read()
-                sections = content.split("\n\n")
-
-                for section in sections:
-                    if not section.strip() or "==== 以下ID请求失败 ====" in section:
-                        continue
-
-                    lines = section.strip().split("\n")
-                    if len(lines) < 2:
-                        continue
-
-                    # 解析header: id | name 或 id
-                    header_line = lines[0].strip()
-                    if " | " in header_line:
-                        parts = header_line.split(" | ", 1)
-                        source_id = parts[0].strip()
-                        name = parts[1].strip()
-                        id_to_name[source_id] = name
-                    else:
-                        source_id = header_line
-                        id_to_name[source_id] = source_id
-
-                    titles_by_id[source_id] = {}
-
-                    # 解析标题行
-                    for line in lines[1:]:
-                        if line.strip():
-                            try:
-                                title_part = line.strip()
-                                rank = None
-
-                                # 提取排名
-                                if ". " in title_part and title_part.split(". ")[0].isdigit():
-                                    rank_str, title_part = title_part.split(". ", 1)
-                                    rank = int(rank_str)
-
-                                # 提取 MOBILE URL
-                                mobile_url = ""
-                                if " [MOBILE:" in title_part:
-                                    title_part, mobile_part = title_part.rsplit(" [MOBILE:", 1)
-                                    if mobile_part.endswith("]"):
-                                        mobile_url = mobile_part[:-1]
-
-                                # 提取 URL
-                                url = ""
-                                if " [URL:" in title_part:
-                                    title_part, url_part = title_part.rsplit(" [URL:", 1)
-                                    if url_part.endswith("]"):
-                                        url = url_part[:-1]
-
-                                title = self.clean_title(title_part.strip())
-                                ranks = [rank] if rank is not None else [1]
-
-                                titles_by_id[source_id][title] = {
-                                    "ranks": ranks,
-                                    "url": url,
-                                    "mobileUrl": mobile_url,
-                                }
-
-                            except Exception as e:
-                                # 忽略单行解析错误
-                                continue
-
+            return parse_titles_file(file_path)
         except Exception as e:
             raise FileParseError(str(file_path), str(e))
 
-        return titles_by_id, id_to_name
-
     def get_date_folder_name(self, date: datetime = None) -> str:
         """
         获取日期文件夹名称
@@ -157,43 +175,25 @@ class ParserService:
             date = datetime.now()
         return date.strftime("%Y年%m月%d日")
 
-    def read_all_titles_for_date(
-        self,
-        date: datetime = None,
-        platform_ids: Optional[List[str]] = None
-    ) -> Tuple[Dict, Dict, Dict]:
-        """
-        读取指定日期的所有标题文件（带缓存）
-
-        Args:
-            date: 日期对象，默认为今天
-            platform_ids: 平台ID列表，None表示所有平台
-
-        Returns:
-            (all_titles, id_to_name, all_timestamps) 元组
-            - all_titles: {platform_id: {title: {ranks, url, mobileUrl, ...}}}
-            - id_to_name: {platform_id: platform_name}
-            - all_timestamps: {filename: timestamp}
-
-        Raises:
-            DataNotFoundError: 数据不存在
-        """
-        # 生成缓存键
+    def _titles_cache_key(self, date: Optional[datetime], platform_ids: Optional[List[str]]) -> str:
         date_str = self.get_date_folder_name(date)
         platform_key = ','.join(sorted(platform_ids)) if platform_ids else 'all'
-        cache_key = f"read_all_titles:{date_str}:{platform_key}"
+        return f"read_all_titles:{date_str}:{platform_key}"
 
-        # 尝试从缓存获取
+    def _cached_titles(self, date: Optional[datetime], cache_key: str) -> Optional[Tuple[Dict, Dict, Dict]]:
         # 对于历史数据（非今天），使用更长的缓存时间（1小时）
         # 对于今天的数据，使用较短的缓存时间（15分钟），因为可能有新数据
         is_today = (date is None) or (date.date() == datetime.now().date())
         ttl = 900 if is_today else 3600  # 15分钟 vs 1小时
+        return self.cache.get(cache_key, ttl=ttl)
 
-        cached = self.cache.get(cache_key, ttl=ttl)
-        if cached:
-            return cached
+    def _day_txt_files(self, date: Optional[datetime]) -> Tuple[str, List[Path]]:
+        """
+        某天的批次文件（按时间顺序）
 
-        # 缓存未命中，读取文件
+        Raises:
+            DataNotFoundError: 数据目录或数据文件不存在
+        """
         date_folder = self.get_date_folder_name(date)
         txt_dir = self.project_root / "output" / date_folder / "txt"
 
@@ -203,10 +203,6 @@ class ParserService:
                 suggestion="请先运行爬虫或检查日期是否正确"
             )
 
-        all_titles = {}
-        id_to_name = {}
-        all_timestamps = {}
-
         # 读取所有txt文件
         txt_files = sorted(txt_dir.glob("*.txt"))
 
@@ -215,50 +211,110 @@ class ParserService:
                 f"{date_folder} 没有数据文件",
                 suggestion="请等待爬虫任务完成"
             )
+        return date_folder, txt_files
 
-        for txt_file in txt_files:
-            try:
-                titles_by_id, file_id_to_name = self.parse_txt_file(txt_file)
-
-                # 更新id_to_name
-                id_to_name.update(file_id_to_name)
-
-                # 合并标题数据
-                for platform_id, titles in titles_by_id.items():
-                    # 如果指定了平台过滤
-                    if platform_ids and platform_id not in platform_ids:
-                        continue
+    def read_all_titles_for_date(
+        self,
+        date: datetime = None,
+        platform_ids: Optional[List[str]] = None,
+        use_cache: bool = True
+    ) -> Tuple[Dict, Dict, Dict]:
+        """
+        读取指定日期的所有标题文件（带缓存）
 
-                    if platform_id not in all_titles:
-                        all_titles[platform_id] = {}
+        Args:
+            date: 日期对象，默认为今天
+            platform_ids: 平台ID列表，None表示所有平台
+            use_cache: 是否读取结果缓存（为 False 时直接读取磁盘上的最新批次）
 
-                    for title, info in titles.items():
-                        if title in all_titles[platform_id]:
-                            # 合并排名
-                            all_titles[platform_id][title]["ranks"].extend(info["ranks"])
-                        else:
-                            all_titles[platform_id][title] = info.copy()
+        Returns:
+            (all_titles, id_to_name, all_timestamps) 元组
+            - all_titles: {platform_id: {title: {ranks, url, mobileUrl, ...}}}
+            - id_to_name: {platform_id: platform_name}
+            - all_timestamps: {filename: timestamp}
 
-                # 记录文件时间戳
-                all_timestamps[txt_file.name] = txt_file.stat().st_mtime
+        Raises:
+            DataNotFoundError: 数据不存在
+        """
+        # 尝试从缓存获取
+        cache_key = self._titles_cache_key(date, platform_ids)
+        cached = self._cached_titles(date, cache_key) if use_cache else None
+        if cached:
+            return cached
 
-            except Exception as e:
-                # 忽略单个文件的解析错误，继续处理其他文件
-                print(f"Warning: 解析文件 {txt_file} 失败: {e}")
-                continue
+        # 缓存未命中，读取文件
+        date_folder, txt_files = self._day_txt_files(date)
+        result = merge_titles_files(txt_files, platform_ids)
 
-        if not all_titles:
+        if not result[0]:
             raise DataNotFoundError(
                 f"{date_folder} 没有有效的数据",
                 suggestion="请检查数据文件格式或重新运行爬虫"
             )
 
         # 缓存结果
-        result = (all_titles, id_to_name, all_timestamps)
         self.cache.set(cache_key, result)
 
         return result
 
+    def iter_titles_for_dates(
+        self,
+        dates: Iterable[datetime],
+        platform_ids: Optional[List[str]] = None,
+        use_cache: bool = True
+    ) -> Iterator[Tuple[datetime, Tuple[Dict, Dict, Dict]]]:
+        """
+        按日期顺序逐天读取多天的标题文件
+
+        未命中缓存的日期提交到进程池并行解析，结果按日期顺序依次产出，
+        前面的日期可以在后面的日期仍在解析时先被处理；解析结果写入与
+        read_all_titles_for_date 相同的缓存。
+
+        Args:
+            dates: 日期列表
+            platform_ids: 平台ID列表，None表示所有平台
+            use_cache: 是否读取结果缓存
+
+        Yields:
+            (date, (all_titles, id_to_name, all_timestamps))，结构与
+            read_all_titles_for_date 相同；没有数据的日期被跳过
+        """
+        dates = list(dates)
+        cached: Dict[int, Tuple[Dict, Dict, Dict]] = {}
+        pending: Dict[int, str] = {}
+        jobs = []
+
+        for position, date in enumerate(dates):
+            cache_key = self._titles_cache_key(date, platform_ids)
+            result = self._cached_titles(date, cache_key) if use_cache else None
+            if result:
+                cached[position] = result
+                continue
+            try:
+                _, txt_files = self._day_txt_files(date)
+            except DataNotFoundError:
+                continue
+            pending[position] = cache_key
+            jobs.append((merge_titles_files, (txt_files, platform_ids)))
+
+        loaded = iter_day_jobs(jobs)
+        try:
+            for position, date in enumerate(dates):
+                if position in cached:
+                    yield date, cached[position]
+                    continue
+                if position not in pending:
+                    continue
+
+                result = next(loaded)
+                if not result[0]:
+                    # 与 read_all_titles_for_date 一致：没有有效数据的日期视为无数据
+                    continue
+                self.cache.set(pending[position], result)
+                yield date, result
+        finally:
+            loaded.close()
+
     def parse_yaml_config(self, config_path: str = None) -> dict:
         """
         解析YAML配置文件
@@ -0,0 +1,429 @@
+"""
+倒排索引服务
+
+为每天的新闻标题建立倒排索引，关键词搜索变为倒排表求交集。
+所有语言都按字符 unigram + bigram 建索引，候选集合总是包含全部
+子串命中的标题，再逐条复核 query in title。
+
+已结束的日期建索引一次后持久化到 output/<日期>/search_index.json；
+当天的索引只保存在内存中，批次文件变化时重建。
+"""
+
+import json
+import os
+import threading
+from collections import OrderedDict
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from newshawk.similarity import ShingleIndex
+
+from .parser_service import ParserService
+
+
+INDEX_VERSION = 2
+INDEX_FILENAME = "search_index.json"
+
+# 内存中最多保留的日期索引数
+MAX_CACHED_DAYS = 64
+
+# 相似度预筛：shingle Dice 达到 阈值×该比例 的标题进入精确比对，
+# 另外总是保留 Dice 最高的若干条
+SIMILARITY_PREFILTER_RATIO = 0.5
+SIMILARITY_SHORTLIST_SIZE = 200
+
+def tokenize(text: str) -> List[str]:
+    """
+    切分文本为索引词：小写后的全部单字与相邻两字（不分语言，空格与标点也计入）
+
+    任何子串的两字片段都是标题两字片段的子集，因此按两字片段求交得到的
+    候选一定包含所有子串命中的标题。
+
+    Args:
+        text: 标题文本
+
+    Returns:
+        词列表（可能重复）
+    """
+    text = text.lower()
+    tokens = list(text)
+    tokens.extend(text[i:i + 2] for i in range(len(text) - 1))
+    return tokens
+
+
+def _query_terms(query: str) -> List[str]:
+    """查询的两字片段（单字查询取单字）"""
+    query = query.lower()
+    if len(query) == 1:
+        return [query]
+    return [query[i:i + 2] for i in range(len(query) - 1)]
+
+
+class DayIndex:
+    """单日倒排索引"""
+
+    def __init__(
+        self,
+        docs: List[List],
+        id_to_name: Dict[str, str],
+        postings: Dict[str, List[int]],
+        signature: List,
+    ):
+        """
+        Args:
+            docs: 文档列表，每项为 [platform_id, title, ranks, url, mobileUrl]
+            id_to_name: 平台ID到名称映射
+            postings: 词 -> 升序文档ID列表
+            signature: 建索引时的批次文件签名
+        """
+        self.docs = docs
+        self.id_to_name = id_to_name
+        self.postings = postings
+        self.signature = signature
+        self._shingle_index: Optional[ShingleIndex] = None
+        self._shingle_lock = threading.Lock()
+
+    @property
+    def shingle_index(self) -> ShingleIndex:
+        """标题的 shingle 相似度矩阵（首次使用时建立，随索引一起缓存）"""
+        if self._shingle_index is None:
+            with self._shingle_lock:
+                if self._shingle_index is None:
+                    self._shingle_index = ShingleIndex(doc[1] for doc in self.docs)
+        return self._shingle_index
+
+    @classmethod
+    def build(cls, all_titles: Dict, id_to_name: Dict, signature: List) -> "DayIndex":
+        """
+        从 read_all_titles_for_date 的结果建立索引
+
+        Args:
+            all_titles: {platform_id: {title: {ranks, url, mobileUrl}}}
+            id_to_name: 平台ID到名称映射
+            signature: 批次文件签名
+
+        Returns:
+            DayIndex 实例
+        """
+        docs = []
+        postings: Dict[str, List[int]] = {}
+        for platform_id, titles in all_titles.items():
+            for title, info in titles.items():
+                doc_id = len(docs)
+                docs.append([
+                    platform_id,
+                    title,
+                    list(info.get("ranks", [])),
+                    info.get("url", ""),
+                    info.get("mobileUrl", ""),
+                ])
+                for token in set(tokenize(title)):
+                    postings.setdefault(token, []).append(doc_id)
+        return cls(docs, dict(id_to_name), postings, signature)
+
+    def candidates(self, query: str) -> Optional[List[int]]:
+        """
+        倒排表求交得到候选文档（包含所有子串命中的标题）
+
+        Args:
+            query: 查询文本
+
+        Returns:
+            升序候选文档ID；空查询返回 None（需全量扫描）
+        """
+        terms = _query_terms(query)
+        if not terms:
+            return None
+
+        # 从最短的倒排表起步
+        posting_lists = sorted((self.postings.get(term, []) for term in set(terms)), key=len)
+        result = set(posting_lists[0])
+        for posting in posting_lists[1:]:
+            if not result:
+                return []
+            result.intersection_update(posting)
+        return sorted(result)
+
+    def search_ids(
+        self,
+        query: str,
+        platforms: Optional[List[str]] = None,
+        case_sensitive: bool = False,
+    ) -> List[int]:
+        """
+        搜索包含 query 的标题
+
+        Args:
+            query: 查询文本
+            platforms: 平台过滤列表
+            case_sensitive: 是否区分大小写
+
+        Returns:
+            命中的升序文档ID
+        """
+        doc_ids = self.candidates(query)
+        if doc_ids is None:
+            doc_ids = range(len(self.docs))
+
+        platform_set = set(platforms) if platforms else None
+        needle = query if case_sensitive else query.lower()
+
+        matched = []
+        for doc_id in doc_ids:
+            doc = self.docs[doc_id]
+            if platform_set is not None and doc[0] not in platform_set:
+                continue
+            title = doc[1] if case_sensitive else doc[1].lower()
+            if needle in title:
+                matched.append(doc_id)
+        return matched
+
+    def search(
+        self,
+        query: str,
+        platforms: Optional[List[str]] = None,
+        case_sensitive: bool = False,
+    ) -> List[List]:
+        """
+        搜索包含 query 的标题
+
+        Returns:
+            命中的文档（按文档顺序）
+        """
+        return [self.docs[i] for i in self.search_ids(query, platforms, case_sensitive)]
+
+    def similar_ids(
+        self,
+        text: str,
+        min_score: float = 0.0,
+        top_k: Optional[int] = None,
+        platforms: Optional[List[str]] = None,
+    ) -> List[int]:
+        """
+        按 shingle 相似度筛选候选文档（供精确相似度复核）
+
+        Args:
+            text: 参考文本
+            min_score: 最低 Dice 相似度，达到即入选
+            top_k: 另外保留得分最高的 top_k 篇
+            platforms: 平台过滤列表
+
+        Returns:
+            升序候选文档ID
+        """
+        doc_ids = self.shingle_index.shortlist(text, min_score=min_score, top_k=top_k)
+        if platforms:
+            platform_set = set(platforms)
+            doc_ids = [i for i in doc_ids if self.docs[i][0] in platform_set]
+        return doc_ids
+
+    def titles_for(self, doc_ids: List[int]) -> Dict[str, Dict]:
+        """
+        把文档ID转换为 read_all_titles_for_date 的标题结构
+
+        Args:
+            doc_ids: 文档ID列表
+
+        Returns:
+            {platform_id: {title: {ranks, url, mobileUrl}}}
+        """
+        titles: Dict[str, Dict] = {}
+        for doc_id in doc_ids:
+            platform_id, title, ranks, url, mobile_url = self.docs[doc_id]
+            titles.setdefault(platform_id, {})[title] = {
+                "ranks": list(ranks),
+                "url": url,
+                "mobileUrl": mobile_url,
+            }
+        return titles
+
+    def to_dict(self) -> Dict:
+        return {
+            "version": INDEX_VERSION,
+            "signature": self.signature,
+            "id_to_name": self.id_to_name,
+            "docs": self.docs,
+            "postings": self.postings,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> Optional["DayIndex"]:
+        if data.get("version") != INDEX_VERSION:
+            return None
+        return cls(data["docs"], data["id_to_name"], data["postings"], data["signature"])
+
+
+class SearchIndexService:
+    """按日期管理倒排索引（进程内共享）"""
+
+    _indexes: "OrderedDict[str, DayIndex]" = OrderedDict()
+    _lock = threading.Lock()
+
+    def __init__(self, parser: ParserService):
+        """
+        初始化倒排索引服务
+
+        Args:
+            parser: 文件解析服务
+        """
+        self.parser = parser
+
+    def _day_dir(self, date: datetime) -> Path:
+        return self.parser.project_root / "output" / self.parser.get_date_folder_name(date)
+
+    @staticmethod
+    def _signature(txt_dir: Path) -> List:
+        if not txt_dir.exists():
+            return []
+        signature = []
+        for txt_file in sorted(txt_dir.glob("*.txt")):
+            stat = txt_file.stat()
+            signature.append([txt_file.name, stat.st_size, stat.st_mtime_ns])
+        return signature
+
+    @staticmethod
+    def _load_persisted(index_path: Path, signature: List) -> Optional[DayIndex]:
+        try:
+            with open(index_path, "r", encoding="utf-8") as f:
+                index = DayIndex.from_dict(json.load(f))
+        except (OSError, ValueError, KeyError):
+            return None
+        if index is None or index.signature != signature:
+            return None
+        return index
+
+    @staticmethod
+    def _persist(index_path: Path, index: DayIndex) -> None:
+        tmp_path = index_path.with_name(index_path.name + ".tmp")
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(index.to_dict(), f, ensure_ascii=False, separators=(",", ":"))
+            os.replace(tmp_path, index_path)
+        except OSError as e:
+            print(f"Warning: 写入搜索索引失败 {index_path}: {e}")
+
+    def get_index(self, date: Optional[datetime] = None, titles: Optional[Tuple[Dict, Dict, Dict]] = None) -> DayIndex:
+        """
+        获取指定日期的索引（必要时建立）
+
+        Args:
+            date: 日期对象，默认为今天
+            titles: 可选，调用方已读取的当天标题（read_all_titles_for_date 的结果），
+                    需要建立索引时直接使用
+
+        Returns:
+            DayIndex 实例
+
+        Raises:
+            DataNotFoundError: 数据不存在
+        """
+        if date is None:
+            date = datetime.now()
+        index, signature = self._available_index(date)
+        if index is None:
+            if titles is None or not titles[0]:
+                titles = self.parser.read_all_titles_for_date(date=date, use_cache=False)
+            all_titles, id_to_name, _ = titles
+            index = self._built_index(date, signature, all_titles, id_to_name)
+        return index
+
+    def needs_build(self, date: datetime) -> bool:
+        """指定日期是否还没有可用的索引"""
+        return self._available_index(date)[0] is None
+
+    def iter_indexes(self, dates: Iterable[datetime]) -> Iterator[Tuple[datetime, DayIndex]]:
+        """
+        按日期顺序获取多天的索引
+
+        需要重建索引的日期通过 ParserService.iter_titles_for_dates 并行读取，
+        已建好的索引直接产出，不必等待后面的日期。
+
+        Args:
+            dates: 日期列表
+
+        Yields:
+            (date, DayIndex)；没有数据的日期被跳过
+        """
+        dates = list(dates)
+        ready: Dict[int, DayIndex] = {}
+        signatures: Dict[int, List] = {}
+        for position, date in enumerate(dates):
+            index, signature = self._available_index(date)
+            if index is not None:
+                ready[position] = index
+            elif signature:
+                signatures[position] = signature
+
+        loaded = self.parser.iter_titles_for_dates(
+            [dates[position] for position in sorted(signatures)], use_cache=False
+        )
+        next_loaded = next(loaded, None)
+        for position, date in enumerate(dates):
+            if position in ready:
+                yield date, ready[position]
+            elif next_loaded is not None and next_loaded[0] is date:
+                all_titles, id_to_name, _ = next_loaded[1]
+                yield date, self._built_index(date, signatures[position], all_titles, id_to_name)
+                next_loaded = next(loaded, None)
+
+    def _available_index(self, date: datetime) -> Tuple[Optional[DayIndex], List]:
+        """内存中或已持久化的最新索引，以及当天批次文件的签名"""
+        day_dir = self._day_dir(date)
+        signature = self._signature(day_dir / "txt")
+        key = str(day_dir)
+
+        with self._lock:
+            index = self._indexes.get(key)
+            if index is not None and index.signature == signature:
+                self._indexes.move_to_end(key)
+                return index, signature
+
+        finalized = date.date() < datetime.now().date()
+        index = self._load_persisted(day_dir / INDEX_FILENAME, signature) if finalized else None
+        if index is not None:
+            self._remember(key, index)
+        return index, signature
+
+    def _built_index(self, date: datetime, signature: List, all_titles: Dict, id_to_name: Dict) -> DayIndex:
+        """从标题数据建立索引，已结束的日期同时持久化"""
+        day_dir = self._day_dir(date)
+        index = DayIndex.build(all_titles, id_to_name, signature)
+        if date.date() < datetime.now().date():
+            self._persist(day_dir / INDEX_FILENAME, index)
+        self._remember(str(day_dir), index)
+        return index
+
+    def _remember(self, key: str, index: DayIndex) -> None:
+        with self._lock:
+            self._indexes[key] = index
+            self._indexes.move_to_end(key)
+            while len(self._indexes) > MAX_CACHED_DAYS:
+                self._indexes.popitem(last=False)
+
+    def matching_titles(
+        self,
+        date: Optional[datetime],
+        query: str,
+        platforms: Optional[List[str]] = None,
+        case_sensitive: bool = False,
+    ) -> Tuple[Dict, Dict]:
+        """
+        查询某天包含 query 的标题
+
+        Args:
+            date: 日期对象，默认为今天
+            query: 查询文本
+            platforms: 平台过滤列表
+            case_sensitive: 是否区分大小写
+
+        Returns:
+            (titles, id_to_name)，titles 结构与 read_all_titles_for_date 相同，
+            只包含命中的标题
+
+        Raises:
+            DataNotFoundError: 数据不存在
+        """
+        index = self.get_index(date)
+        titles = index.titles_for(index.search_ids(query, platforms, case_sensitive))
+        return titles, dict(index.id_to_name)
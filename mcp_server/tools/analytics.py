@@ -4,13 +4,19 @@
 提供热度趋势分析、平台对比、关键词共现、情感分析等高级分析功能。
 """
 
+import math
 import re
 from collections import Counter, defaultdict
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional
 from difflib import SequenceMatcher
 
+from newshawk.cooccurrence import KeywordMatrix
+from newshawk.timeseries import GRANULARITIES, growth_rates, moving_average, rollup, window_growth
+
 from ..services.data_service import DataService
+from ..services.keyword_stats import extract_keywords
+from ..services.search_index import SIMILARITY_PREFILTER_RATIO, SIMILARITY_SHORTLIST_SIZE
 from ..utils.validators import (
     validate_platforms,
     validate_limit,
@@ -21,6 +27,19 @@ from ..utils.validators import (
 from ..utils.errors import MCPError, InvalidParameterError, DataNotFoundError
 
 
+# 趋势分析中移动平均的窗口（时间段个数）
+TREND_MOVING_AVERAGE_WINDOW = 3
+
+# 基线低于该值（平均每批次在榜标题数）的关键词视为新话题
+VIRAL_NEW_TOPIC_BASELINE = 0.05
+
+# 爆火话题在窗口内至少出现的标题数
+VIRAL_MIN_COUNT = 5
+
+# 突增话题的窗口水平至少高出基线的标准差倍数
+VIRAL_MIN_Z_SCORE = 2.0
+
+
 def calculate_news_weight(news_data: Dict, rank_threshold: int = 5) -> float:
     """
     计算新闻权重（用于排序）
@@ -104,6 +123,7 @@ class AnalyticsTools:
                 - "keyword_cooccur": 关键词共现分析（分析关键词同时出现的模式）
             topic: 话题关键词（可选，platform_compare模式适用）
             date_range: 日期范围，格式: {"start": "YYYY-MM-DD", "end": "YYYY-MM-DD"}
+                       （keyword_cooccur模式不指定时分析今天）
             min_frequency: 最小共现频次（keyword_cooccur模式），默认3
             top_n: 返回TOP N结果（keyword_cooccur模式），默认20
 
@@ -136,7 +156,8 @@ class AnalyticsTools:
             else:  # keyword_cooccur
                 return self.analyze_keyword_cooccurrence(
                     min_frequency=min_frequency,
-                    top_n=top_n
+                    top_n=top_n,
+                    date_range=date_range
                 )
 
         except MCPError as e:
@@ -177,9 +198,9 @@ class AnalyticsTools:
             date_range: 日期范围（trend和lifecycle模式），可选
                        - **格式**: {"start": "YYYY-MM-DD", "end": "YYYY-MM-DD"}
                        - **默认**: 不指定时默认分析最近7天
-            granularity: 时间粒度（trend模式），默认"day"（hour/day）
+            granularity: 时间粒度（trend模式），默认"day"（hour/day/week）
             threshold: 热度突增倍数阈值（viral模式），默认3.0
-            time_window: 检测时间窗口小时数（viral模式），默认24
+            time_window: 检测时间窗口小时数（viral模式），默认24（截至最新批次，最长72）
             lookahead_hours: 预测未来小时数（predict模式），默认6
             confidence_threshold: 置信度阈值（predict模式），默认0.7
 
@@ -255,7 +276,8 @@ class AnalyticsTools:
             date_range: 日期范围（可选）
                        - **格式**: {"start": "YYYY-MM-DD", "end": "YYYY-MM-DD"}
                        - **默认**: 不指定时默认分析最近7天
-            granularity: 时间粒度，仅支持 day（天）
+            granularity: 时间粒度，支持 hour（小时）、day（天）、week（周，从周一开始），
+                         按批次文件名中的爬取时间聚合
 
         Returns:
             趋势分析结果字典
@@ -282,23 +304,27 @@ class AnalyticsTools:
             ...     date_range={"start": "2024-12-01", "end": "2024-12-31"},
             ...     granularity="day"
             ... )
+            >>> # 按小时查看今天的走势
+            >>> result = tools.get_topic_trend_analysis(
+            ...     topic="人工智能",
+            ...     date_range={"start": "2025-11-17", "end": "2025-11-17"},
+            ...     granularity="hour"
+            ... )
             >>> print(result['trend_data'])
         """
         try:
             # 验证参数
             topic = validate_keyword(topic)
 
-            # 验证粒度参数（只支持day）
-            if granularity != "day":
-                from ..utils.errors import InvalidParameterError
+            # 验证粒度参数
+            if granularity not in GRANULARITIES:
                 raise InvalidParameterError(
                     f"不支持的粒度参数: {granularity}",
-                    suggestion="当前仅支持 'day' 粒度，因为底层数据按天聚合"
+                    suggestion="支持的粒度: hour（小时）、day（天）、week（周）"
                 )
 
             # 处理日期范围（不指定时默认最近7天）
             if date_range:
-                from ..utils.validators import validate_date_range
                 date_range_tuple = validate_date_range(date_range)
                 start_date, end_date = date_range_tuple
             else:
@@ -306,41 +332,54 @@ class AnalyticsTools:
                 end_date = datetime.now()
                 start_date = end_date - timedelta(days=6)
 
-            # 收集趋势数据
-            trend_data = []
+            # 每天包含话题子串的标题（倒排索引候选 + 子串复核，与逐条 in 判断等价）
+            # 及其在各批次的在榜记录；
+            # 需要重新统计的日期在进程池中并行计算，缺少索引的日期顺带取回标题
+            trend_dates = []
             current_date = start_date
-
             while current_date <= end_date:
-                try:
-                    all_titles, _, _ = self.data_service.parser.read_all_titles_for_date(
-                        date=current_date
-                    )
-
-                    # 统计该时间点的话题出现次数
-                    count = 0
-                    matched_titles = []
-
-                    for _, titles in all_titles.items():
-                        for title in titles.keys():
-                            if topic.lower() in title.lower():
-                                count += 1
-                                matched_titles.append(title)
-
-                    trend_data.append({
-                        "date": current_date.strftime("%Y-%m-%d"),
-                        "count": count,
-                        "sample_titles": matched_titles[:3]  # 只保留前3个样本
-                    })
+                trend_dates.append(current_date)
+                current_date += timedelta(days=1)
 
+            day_series = []
+            day_stats = []
+            search_index = self.data_service.search_index
+            day_stream = self.data_service.keyword_stats.iter_stats(
+                trend_dates, titles_for=search_index.needs_build
+            )
+            for current_date, stats, titles in day_stream:
+                try:
+                    day_index = search_index.get_index(current_date, titles=titles)
                 except DataNotFoundError:
-                    trend_data.append({
-                        "date": current_date.strftime("%Y-%m-%d"),
-                        "count": 0,
-                        "sample_titles": []
-                    })
+                    continue
+                matched_docs = [day_index.docs[i] for i in day_index.search_ids(topic)]
+                day_series.append((stats.day_batches(current_date), stats.doc_ids_for(matched_docs)))
+                day_stats.append(stats)
 
-                # 按天增加时间
-                current_date += timedelta(days=1)
+            # 按粒度聚合：每个时间段内出现过的不同标题数、最高排名
+            series = rollup(day_series, granularity, start_date.date(), end_date.date())
+            moving_averages = moving_average(series.counts, TREND_MOVING_AVERAGE_WINDOW)
+            point_growth = growth_rates(series.counts)
+            label_format = "%Y-%m-%d %H:00" if granularity == "hour" else "%Y-%m-%d"
+
+            trend_data = []
+            now = datetime.now()
+            for i, bucket_start in enumerate(series.starts.tolist()):
+                if granularity == "hour" and bucket_start > now:
+                    # 今天尚未到来的小时
+                    break
+                growth = float(point_growth[i])
+                trend_data.append({
+                    "date": bucket_start.strftime(label_format),
+                    "count": int(series.counts[i]),
+                    "best_rank": int(series.best_ranks[i]) or None,
+                    "moving_average": round(float(moving_averages[i]), 2),
+                    "growth_rate": None if math.isnan(growth) else round(growth * 100, 2),
+                    "sample_titles": [  # 只保留前3个样本
+                        day_stats[position].docs[doc_id][1]
+                        for position, doc_id in series.members[i][:3]
+                    ]
+                })
 
             # 计算趋势指标
             counts = [item["count"] for item in trend_data]
@@ -374,6 +413,7 @@ class AnalyticsTools:
                     "total_days": total_days
                 },
                 "granularity": granularity,
+                "moving_average_window": TREND_MOVING_AVERAGE_WINDOW,
                 "trend_data": trend_data,
                 "statistics": {
                     "total_mentions": sum(counts),
@@ -452,24 +492,23 @@ class AnalyticsTools:
             current_date = start_date
             while current_date <= end_date:
                 try:
-                    all_titles, id_to_name, _ = self.data_service.parser.read_all_titles_for_date(
-                        date=current_date
-                    )
+                    stats = self.data_service.keyword_stats.get_stats(current_date)
+                    id_to_name = stats.id_to_name
 
-                    for platform_id, titles in all_titles.items():
+                    for platform_id, title in stats.docs:
                         platform_name = id_to_name.get(platform_id, platform_id)
+                        platform_stats[platform_name]["total_news"] += 1
+                        platform_stats[platform_name]["unique_titles"].add(title)
 
-                        for title in titles.keys():
-                            platform_stats[platform_name]["total_news"] += 1
-                            platform_stats[platform_name]["unique_titles"].add(title)
-
-                            # 如果指定了话题，统计包含话题的新闻
-                            if topic and topic.lower() in title.lower():
-                                platform_stats[platform_name]["topic_mentions"] += 1
+                        # 如果指定了话题，统计包含话题的新闻
+                        if topic and topic.lower() in title.lower():
+                            platform_stats[platform_name]["topic_mentions"] += 1
 
-                            # 提取关键词（简单分词）
-                            keywords = self._extract_keywords(title)
-                            platform_stats[platform_name]["top_keywords"].update(keywords)
+                    # 各平台的关键词计数（已预先统计）
+                    for platform_id, keyword_counts in stats.platform_counts.items():
+                        if keyword_counts:
+                            platform_name = id_to_name.get(platform_id, platform_id)
+                            platform_stats[platform_name]["top_keywords"].update(keyword_counts)
 
                 except DataNotFoundError:
                     pass
@@ -526,7 +565,8 @@ class AnalyticsTools:
     def analyze_keyword_cooccurrence(
         self,
         min_frequency: int = 3,
-        top_n: int = 20
+        top_n: int = 20,
+        date_range: Optional[Dict[str, str]] = None
     ) -> Dict:
         """
         关键词共现分析 - 分析哪些关键词经常同时出现
@@ -534,6 +574,8 @@ class AnalyticsTools:
         Args:
             min_frequency: 最小共现频次
             top_n: 返回TOP N关键词对
+            date_range: 日期范围（可选），格式: {"start": "YYYY-MM-DD", "end": "YYYY-MM-DD"}
+                       不指定则分析今天的数据
 
         Returns:
             关键词共现分析结果
@@ -550,6 +592,10 @@ class AnalyticsTools:
             ...     min_frequency=5,
             ...     top_n=15
             ... )
+            >>> # 分析一周内的共现（假设今天是 2025-11-17）
+            >>> result = tools.analyze_keyword_cooccurrence(
+            ...     date_range={"start": "2025-11-11", "end": "2025-11-17"}
+            ... )
             >>> print(result['cooccurrence_pairs'])
         """
         try:
@@ -557,53 +603,53 @@ class AnalyticsTools:
             min_frequency = validate_limit(min_frequency, default=3, max_limit=100)
             top_n = validate_top_n(top_n, default=20)
 
-            # 读取今天的数据
-            all_titles, _, _ = self.data_service.parser.read_all_titles_for_date()
+            # 处理日期范围（默认今天）
+            date_range_tuple = validate_date_range(date_range)
+            if date_range_tuple:
+                start_date, end_date = date_range_tuple
+            else:
+                start_date = end_date = datetime.now()
 
-            # 关键词共现统计
-            cooccurrence = Counter()
-            keyword_titles = defaultdict(list)
+            # 各天的标题 x 关键词矩阵按共享词表叠加，共现即 XᵀX
+            matrix = KeywordMatrix()
+            day_stats = []
+            current_date = start_date
+            while current_date <= end_date:
+                try:
+                    stats = self.data_service.keyword_stats.get_stats(current_date)
+                except DataNotFoundError:
+                    # 单日查询时保持原有的报错
+                    if start_date == end_date:
+                        raise
+                else:
+                    stats.add_to_matrix(matrix)
+                    day_stats.append(stats)
+                current_date += timedelta(days=1)
 
-            for platform_id, titles in all_titles.items():
-                for title in titles.keys():
-                    # 提取关键词
-                    keywords = self._extract_keywords(title)
-
-                    # 记录每个关键词出现的标题
-                    for kw in keywords:
-                        keyword_titles[kw].append(title)
-
-                    # 计算两两共现
-                    if len(keywords) >= 2:
-                        for i, kw1 in enumerate(keywords):
-                            for kw2 in keywords[i+1:]:
-                                # 统一排序，避免重复
-                                pair = tuple(sorted([kw1, kw2]))
-                                cooccurrence[pair] += 1
-
-            # 过滤低频共现
-            filtered_pairs = [
-                (pair, count) for pair, count in cooccurrence.items()
-                if count >= min_frequency
-            ]
-
-            # 排序并取TOP N
-            top_pairs = sorted(filtered_pairs, key=lambda x: x[1], reverse=True)[:top_n]
+            if not day_stats:
+                raise DataNotFoundError(
+                    f"{start_date.strftime('%Y-%m-%d')} 至 {end_date.strftime('%Y-%m-%d')} 没有数据",
+                    suggestion="请检查日期范围或等待爬虫任务完成"
+                )
+
+            # 过滤低频共现，按次数取TOP N
+            top_pairs = matrix.top_pairs(min_count=min_frequency, top_n=top_n)
 
             # 构建结果
             result_pairs = []
-            for (kw1, kw2), count in top_pairs:
-                # 找出同时包含两个关键词的标题样本
-                titles_with_both = [
-                    title for title in keyword_titles[kw1]
-                    if kw2 in self._extract_keywords(title)
-                ]
+            for kw1, kw2, count in top_pairs:
+                # 同时包含两个关键词的标题样本
+                sample_titles = []
+                for stats in day_stats:
+                    sample_titles.extend(stats.pair_titles(kw1, kw2, limit=3 - len(sample_titles)))
+                    if len(sample_titles) >= 3:
+                        break
 
                 result_pairs.append({
                     "keyword1": kw1,
                     "keyword2": kw2,
                     "cooccurrence_count": count,
-                    "sample_titles": titles_with_both[:3]
+                    "sample_titles": sample_titles
                 })
 
             return {
@@ -611,6 +657,10 @@ class AnalyticsTools:
                 "cooccurrence_pairs": result_pairs,
                 "total_pairs": len(result_pairs),
                 "min_frequency": min_frequency,
+                "date_range": {
+                    "start": start_date.strftime("%Y-%m-%d"),
+                    "end": end_date.strftime("%Y-%m-%d")
+                },
                 "generated_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
             }
 
@@ -953,8 +1003,19 @@ class AnalyticsTools:
 
             limit = validate_limit(limit, default=50)
 
-            # 读取数据
-            all_titles, id_to_name, _ = self.data_service.parser.read_all_titles_for_date()
+            # 读取数据：先用当天索引上的向量化 shingle 相似度筛出短名单，
+            # 再对短名单逐条计算精确相似度
+            day_index = self.data_service.search_index.get_index()
+            if threshold > 0:
+                doc_ids = day_index.similar_ids(
+                    reference_title,
+                    min_score=threshold * SIMILARITY_PREFILTER_RATIO,
+                    top_k=max(limit * 4, SIMILARITY_SHORTLIST_SIZE)
+                )
+            else:
+                doc_ids = range(len(day_index.docs))
+            all_titles = day_index.titles_for(doc_ids)
+            id_to_name = day_index.id_to_name
 
             # 计算相似度
             similar_items = []
@@ -1512,20 +1573,12 @@ class AnalyticsTools:
             current_date = start_date
             while current_date <= end_date:
                 try:
-                    all_titles, _, _ = self.data_service.parser.read_all_titles_for_date(
-                        date=current_date
-                    )
-
-                    # 统计该日的话题出现次数
-                    count = 0
-                    for _, titles in all_titles.items():
-                        for title in titles.keys():
-                            if topic.lower() in title.lower():
-                                count += 1
+                    # 统计该日包含话题子串的标题数（倒排索引候选 + 子串复核）
+                    day_index = self.data_service.search_index.get_index(current_date)
 
                     lifecycle_data.append({
                         "date": current_date.strftime("%Y-%m-%d"),
-                        "count": count
+                        "count": len(day_index.search_ids(topic))
                     })
 
                 except DataNotFoundError:
@@ -1628,9 +1681,14 @@ class AnalyticsTools:
         """
         异常热度检测 - 自动识别突然爆火的话题
 
+        每个爬取批次保存后，关键词的在榜标题数会并入按时间衰减的 EWMA 均值/方差；
+        这里比较最近 time_window 小时（截至最新批次）内的平均在榜水平与窗口开始前的基线。
+        窗口内不足 VIRAL_MIN_COUNT 条标题的关键词不参与判断；突增话题还需
+        z 分数不低于 VIRAL_MIN_Z_SCORE。
+
         Args:
-            threshold: 热度突增倍数阈值
-            time_window: 检测时间窗口（小时）
+            threshold: 热度突增倍数阈值（窗口水平 / 基线水平）
+            time_window: 检测时间窗口（小时），最长 72
 
         Returns:
             爆火话题列表
@@ -1659,63 +1717,59 @@ class AnalyticsTools:
 
             time_window = validate_limit(time_window, default=24, max_limit=72)
 
-            # 读取当前和之前的数据
-            current_all_titles, _, _ = self.data_service.parser.read_all_titles_for_date()
-
-            # 读取昨天的数据作为基准
-            yesterday = datetime.now() - timedelta(days=1)
-            try:
-                previous_all_titles, _, _ = self.data_service.parser.read_all_titles_for_date(
-                    date=yesterday
+            # 各关键词在窗口内的在榜水平，以及窗口开始前的 EWMA 基线
+            bursts, window_start, days = self.data_service.keyword_stats.keyword_bursts(time_window)
+            if window_start is None:
+                raise DataNotFoundError(
+                    "最近没有新闻数据",
+                    suggestion="请等待爬虫任务完成"
                 )
-            except DataNotFoundError:
-                previous_all_titles = {}
-
-            # 统计当前的关键词频率
-            current_keywords = Counter()
-            current_keyword_titles = defaultdict(list)
-
-            for _, titles in current_all_titles.items():
-                for title in titles.keys():
-                    keywords = self._extract_keywords(title)
-                    current_keywords.update(keywords)
-
-                    for kw in keywords:
-                        current_keyword_titles[kw].append(title)
 
-            # 统计之前的关键词频率
-            previous_keywords = Counter()
-
-            for _, titles in previous_all_titles.items():
-                for title in titles.keys():
-                    keywords = self._extract_keywords(title)
-                    previous_keywords.update(keywords)
+            # 窗口内出现过的标题数（去重）
+            window_counts: Dict[str, int] = {}
+            window_docs = []
+            for date, stats in days:
+                doc_ids = stats.docs_after(date, window_start)
+                window_docs.append((stats, doc_ids))
+                for keyword, count in stats.keyword_doc_counts(doc_ids).items():
+                    window_counts[keyword] = window_counts.get(keyword, 0) + count
 
             # 检测异常热度
             viral_topics = []
 
-            for keyword, current_count in current_keywords.items():
-                previous_count = previous_keywords.get(keyword, 0)
+            for burst in bursts:
+                current_count = window_counts.get(burst.keyword, 0)
+
+                # 至少出现5次才认为是爆火（新话题与突增话题一样）
+                if current_count < VIRAL_MIN_COUNT:
+                    continue
 
-                # 计算增长倍数
-                if previous_count == 0:
+                if burst.baseline < VIRAL_NEW_TOPIC_BASELINE:
                     # 新出现的话题
-                    if current_count >= 5:  # 至少出现5次才认为是爆火
-                        growth_rate = float('inf')
-                        is_viral = True
-                    else:
-                        continue
+                    growth_rate = float('inf')
+                    is_viral = True
                 else:
-                    growth_rate = current_count / previous_count
-                    is_viral = growth_rate >= threshold
+                    growth_rate = burst.growth
+                    # 倍数达标且明显高于基线的波动范围
+                    is_viral = growth_rate >= threshold and burst.z_score >= VIRAL_MIN_Z_SCORE
 
                 if is_viral:
+                    sample_titles = []
+                    for stats, doc_ids in reversed(window_docs):
+                        sample_titles.extend(stats.keyword_titles_in(
+                            burst.keyword, doc_ids, limit=3 - len(sample_titles)
+                        ))
+                        if len(sample_titles) >= 3:
+                            break
+
                     viral_topics.append({
-                        "keyword": keyword,
+                        "keyword": burst.keyword,
                         "current_count": current_count,
-                        "previous_count": previous_count,
+                        "current_level": round(burst.level, 2),
+                        "baseline_level": round(burst.baseline, 2),
+                        "z_score": round(burst.z_score, 2),
                         "growth_rate": round(growth_rate, 2) if growth_rate != float('inf') else "新话题",
-                        "sample_titles": current_keyword_titles[keyword][:3],
+                        "sample_titles": sample_titles,
                         "alert_level": "高" if growth_rate > threshold * 2 else "中"
                     })
 
@@ -1739,6 +1793,10 @@ class AnalyticsTools:
                 "total_detected": len(viral_topics),
                 "threshold": threshold,
                 "time_window": time_window,
+                "window": {
+                    "start": window_start.strftime("%Y-%m-%d %H:%M"),
+                    "end": (window_start + timedelta(hours=time_window)).strftime("%Y-%m-%d %H:%M")
+                },
                 "detection_time": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
             }
 
@@ -1802,19 +1860,9 @@ class AnalyticsTools:
                 date = datetime.now() - timedelta(days=days_ago)
 
                 try:
-                    all_titles, _, _ = self.data_service.parser.read_all_titles_for_date(
-                        date=date
-                    )
-
-                    # 统计关键词
-                    keywords_count = Counter()
-                    for _, titles in all_titles.items():
-                        for title in titles.keys():
-                            keywords = self._extract_keywords(title)
-                            keywords_count.update(keywords)
-
                     # 记录每个关键词的历史数据
-                    for keyword, count in keywords_count.items():
+                    stats = self.data_service.keyword_stats.get_stats(date)
+                    for keyword, count in stats.counts.items():
                         keyword_trends[keyword].append(count)
 
                 except DataNotFoundError:
@@ -1822,20 +1870,9 @@ class AnalyticsTools:
 
             # 添加今天的数据
             try:
-                all_titles, _, _ = self.data_service.parser.read_all_titles_for_date()
-
-                keywords_count = Counter()
-                keyword_titles = defaultdict(list)
-
-                for _, titles in all_titles.items():
-                    for title in titles.keys():
-                        keywords = self._extract_keywords(title)
-                        keywords_count.update(keywords)
+                today_stats = self.data_service.keyword_stats.get_stats()
 
-                        for kw in keywords:
-                            keyword_titles[kw].append(title)
-
-                for keyword, count in keywords_count.items():
+                for keyword, count in today_stats.counts.items():
                     keyword_trends[keyword].append(count)
 
             except DataNotFoundError:
@@ -1885,7 +1922,7 @@ class AnalyticsTools:
                             "confidence": round(confidence, 2),
                             "trend_data": trend_data,
                             "prediction": "上升趋势，可能成为热点",
-                            "sample_titles": keyword_titles.get(keyword, [])[:3]
+                            "sample_titles": today_stats.keyword_titles(keyword, limit=3)
                         })
 
             # 按置信度和增长率排序
@@ -1893,10 +1930,20 @@ class AnalyticsTools:
                 key=lambda x: (x["confidence"], x["growth_rate"]),
                 reverse=True
             )
+            top_topics = predicted_topics[:20]  # 返回TOP 20
+
+            # 今天的分时信号：最近 lookahead_hours 小时的平均在榜标题数相对之前同样时长的变化
+            today = datetime.now()
+            for topic in top_topics:
+                batch_times, batch_counts, _ = today_stats.keyword_series(today, topic["keyword"])
+                recent_growth = window_growth(batch_times, batch_counts, lookahead_hours)
+                topic["recent_growth_rate"] = (
+                    round(recent_growth * 100, 2) if recent_growth is not None else None
+                )
 
             return {
                 "success": True,
-                "predicted_topics": predicted_topics[:20],  # 返回TOP 20
+                "predicted_topics": top_topics,
                 "total_predicted": len(predicted_topics),
                 "lookahead_hours": lookahead_hours,
                 "confidence_threshold": confidence_threshold,
@@ -1931,22 +1978,7 @@ class AnalyticsTools:
         Returns:
             关键词列表
         """
-        # 移除URL和特殊字符
-        title = re.sub(r'http[s]?://\S+', '', title)
-        title = re.sub(r'[^\w\s]', ' ', title)
-
-        # 简单分词（按空格和常见分隔符）
-        words = re.split(r'[\s，。！？、]+', title)
-
-        # 过滤停用词和短词
-        stopwords = {'的', '了', '在', '是', '我', '有', '和', '就', '不', '人', '都', '一', '一个', '上', '也', '很', '到', '说', '要', '去', '你', '会', '着', '没有', '看', '好', '自己', '这'}
-
-        keywords = [
-            word.strip() for word in words
-            if word.strip() and len(word.strip()) >= min_length and word.strip() not in stopwords
-        ]
-
-        return keywords
+        return extract_keywords(title, min_length)
 
     def _calculate_similarity(self, text1: str, text2: str) -> float:
         """
@@ -11,6 +11,7 @@ from difflib import SequenceMatcher
 from typing import Dict, List, Optional, Tuple
 
 from ..services.data_service import DataService
+from ..services.search_index import SIMILARITY_PREFILTER_RATIO, SIMILARITY_SHORTLIST_SIZE
 from ..utils.validators import validate_keyword, validate_limit
 from ..utils.errors import MCPError, InvalidParameterError, DataNotFoundError
 
@@ -126,10 +127,17 @@ class SearchTools:
 
             while current_date <= end_date:
                 try:
-                    all_titles, id_to_name, timestamps = self.data_service.parser.read_all_titles_for_date(
-                        date=current_date,
-                        platform_ids=platforms
-                    )
+                    if search_mode == "fuzzy":
+                        # 先用向量化相似度和倒排索引筛出候选，再逐条精确匹配
+                        all_titles, id_to_name = self._fuzzy_candidates(
+                            query, current_date, threshold, platforms
+                        )
+                    else:
+                        # keyword / entity 为子串匹配，先用倒排索引缩小到命中标题
+                        all_titles, id_to_name = self.data_service.search_index.matching_titles(
+                            current_date, query, platforms,
+                            case_sensitive=(search_mode == "entity")
+                        )
 
                     # 根据搜索模式执行不同的搜索逻辑
                     if search_mode == "keyword":
@@ -340,6 +348,54 @@ class SearchTools:
 
         return matches
 
+    def _fuzzy_candidates(
+        self,
+        query: str,
+        current_date: datetime,
+        threshold: float,
+        platforms: Optional[List[str]]
+    ) -> Tuple[Dict, Dict]:
+        """
+        筛选模糊搜索的候选标题
+
+        _fuzzy_match 的三种命中方式分别对应：
+        - 直接包含：倒排索引子串搜索
+        - 整体相似度：shingle 相似度短名单（Dice ≥ threshold 的一半，另加得分最高的若干条）
+        - 关键词重合：以子串形式包含任一查询关键词的标题（倒排索引保证子串召回），
+          以及含方括号或 URL 的标题
+
+        Args:
+            query: 搜索内容
+            current_date: 日期
+            threshold: 相似度阈值
+            platforms: 平台过滤列表
+
+        Returns:
+            (titles, id_to_name)，结构与 read_all_titles_for_date 相同
+        """
+        day_index = self.data_service.search_index.get_index(current_date)
+
+        if threshold <= 0:
+            # 阈值为 0 时所有标题都命中，无法筛选
+            doc_ids = {
+                i for i, doc in enumerate(day_index.docs)
+                if not platforms or doc[0] in platforms
+            }
+        else:
+            doc_ids = set(day_index.similar_ids(
+                query,
+                min_score=threshold * SIMILARITY_PREFILTER_RATIO,
+                top_k=SIMILARITY_SHORTLIST_SIZE,
+                platforms=platforms
+            ))
+            doc_ids.update(day_index.search_ids(query, platforms))
+            # 标题关键词都是标题的子串，只有 _extract_keywords 删掉了
+            # 方括号内容或 URL 的标题例外，这类标题全部保留
+            for word in set(self._extract_keywords(query)) | {"[", "http"}:
+                doc_ids.update(day_index.search_ids(word, platforms))
+
+        return day_index.titles_for(sorted(doc_ids)), dict(day_index.id_to_name)
+
     def _search_by_entity_mode(
         self,
         query: str,
@@ -572,15 +628,17 @@ class SearchTools:
                     suggestion="请提供更详细的文本内容"
                 )
 
-            # 收集所有相关新闻
+            # 收集所有相关新闻（多天的数据由解析服务并行读取，按日期顺序处理）
             all_related_news = []
+            search_dates = []
             current_date = search_start
-
             while current_date <= search_end:
-                try:
-                    # 读取该日期的数据
-                    all_titles, id_to_name, _ = self.data_service.parser.read_all_titles_for_date(current_date)
+                search_dates.append(current_date)
+                current_date += timedelta(days=1)
 
+            day_titles = self.data_service.parser.iter_titles_for_dates(search_dates)
+            for current_date, (all_titles, id_to_name, _) in day_titles:
+                try:
                     # 搜索相关新闻
                     for platform_id, titles in all_titles.items():
                         platform_name = id_to_name.get(platform_id, platform_id)
@@ -621,16 +679,10 @@ class SearchTools:
 
                                 all_related_news.append(news_item)
 
-                except DataNotFoundError:
-                    # 该日期没有数据，继续下一天
-                    pass
                 except Exception as e:
                     # 记录错误但继续处理其他日期
                     print(f"Warning: 处理日期 {current_date.strftime('%Y-%m-%d')} 时出错: {e}")
 
-                # 移动到下一天
-                current_date += timedelta(days=1)
-
             if not all_related_news:
                 return {
                     "success": True,
@@ -7,6 +7,8 @@
 from pathlib import Path
 from typing import Dict, List, Optional
 
+from newshawk.parser import write_titles_file
+
 from ..services.data_service import DataService
 from ..utils.validators import validate_platforms
 from ..utils.errors import MCPError, CrawlTaskError
@@ -260,18 +262,6 @@ class SystemManagementTools:
             # 如果需要持久化，调用保存逻辑
             if save_to_local:
                 try:
-                    import re
-
-                    # 辅助函数：清理标题
-                    def clean_title(title: str) -> str:
-                        """清理标题中的特殊字符"""
-                        if not isinstance(title, str):
-                            title = str(title)
-                        cleaned_title = title.replace("\n", " ").replace("\r", " ")
-                        cleaned_title = re.sub(r"\s+", " ", cleaned_title)
-                        cleaned_title = cleaned_title.strip()
-                        return cleaned_title
-
                     # 辅助函数：创建目录
                     def ensure_directory_exists(directory: str):
                         """确保目录存在"""
@@ -291,48 +281,8 @@ class SystemManagementTools:
                     ensure_directory_exists(str(html_dir))
                     html_file_path = html_dir / f"{time_filename}.html"
 
-                    # 保存 txt 文件（按照 main.py 的格式）
-                    with open(txt_file_path, "w", encoding="utf-8") as f:
-                        for id_value, title_data in results.items():
-                            # id | name 或 id
-                            name = id_to_name.get(id_value)
-                            if name and name != id_value:
-                                f.write(f"{id_value} | {name}\n")
-                            else:
-                                f.write(f"{id_value}\n")
-
-                            # 按排名排序标题
-                            sorted_titles = []
-                            for title, info in title_data.items():
-                                cleaned = clean_title(title)
-                                if isinstance(info, dict):
-                                    ranks = info.get("ranks", [])
-                                    url = info.get("url", "")
-                                    mobile_url = info.get("mobileUrl", "")
-                                else:
-                                    ranks = info if isinstance(info, list) else []
-                                    url = ""
-                                    mobile_url = ""
-
-                                rank = ranks[0] if ranks else 1
-                                sorted_titles.append((rank, cleaned, url, mobile_url))
-
-                            sorted_titles.sort(key=lambda x: x[0])
-
-                            for rank, cleaned, url, mobile_url in sorted_titles:
-                                line = f"{rank}. {cleaned}"
-                                if url:
-                                    line += f" [URL:{url}]"
-                                if mobile_url:
-                                    line += f" [MOBILE:{mobile_url}]"
-                                f.write(line + "\n")
-
-                            f.write("\n")
-
-                        if failed_ids:
-                            f.write("==== 以下ID请求失败 ====\n")
-                            for id_value in failed_ids:
-                                f.write(f"{id_value}\n")
+                    # 保存 txt 文件及快照（与 main.py 共用同一写入实现）
+                    write_titles_file(txt_file_path, results, id_to_name, failed_ids)
 
                     # 保存 html 文件（简化版）
                     html_content = self._generate_simple_html(results, id_to_name, failed_ids, now)
@@ -349,6 +299,12 @@ class SystemManagementTools:
                     }
                     result["note"] = "数据已持久化到 output 文件夹"
 
+                    # 把新批次并入热度检测器（失败不影响本次爬取结果）
+                    try:
+                        self.data_service.keyword_stats.update_detector()
+                    except Exception as e:
+                        print(f"更新热度检测器失败: {e}")
+
                 except Exception as e:
                     print(f"保存文件失败: {e}")
                     result["save_error"] = str(e)
@@ -9,7 +9,7 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent))
 
 from api.database import init_db, SessionLocal
-from api.crud import create_article, article_exists
+from api.crud import bulk_ingest_articles
 from api.utils.data_loader import DataLoader
 from api.models import Article
 
@@ -26,10 +26,10 @@ def migrate_data():
     
     # Load data from JSON files
     print("📥 Loading articles from JSON files...")
-    loader = DataLoader()
+    loader = DataLoader(poll_interval=0)
     
     # Load all articles
-    all_articles = loader.load_all_news()
+    all_articles = [record.to_article() for record in loader.load_all_news()]
     print(f"✅ Loaded {len(all_articles)} articles from JSON files")
     print("")
     
@@ -37,30 +37,11 @@ def migrate_data():
     print("💾 Inserting articles into database...")
     db = SessionLocal()
     
-    inserted = 0
-    skipped = 0
-    errors = 0
-    
     try:
-        for i, article in enumerate(all_articles, 1):
-            try:
-                # Check if article already exists
-                if article_exists(db, article.id):
-                    skipped += 1
-                    continue
-                
-                # Insert article
-                create_article(db, article)
-                inserted += 1
-                
-                # Progress indicator
-                if i % 100 == 0:
-                    print(f"  Processed {i}/{len(all_articles)} articles...")
-                    
-            except Exception as e:
-                errors += 1
-                print(f"  ❌ Error inserting article {article.id}: {e}")
-                continue
+        counts = bulk_ingest_articles(db, all_articles)
+        inserted = counts["inserted"]
+        skipped = counts["skipped"]
+        errors = counts["errors"]
         
         print("")
         print("=" * 60)
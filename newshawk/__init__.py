@@ -0,0 +1,5 @@
+"""
+NewsHawk shared components
+
+Code used by both the crawler (main.py, fetch_* scripts) and the MCP server.
+"""
@@ -0,0 +1,198 @@
+"""
+Streaming burst detection for keywords
+
+Each crawl batch contributes one observation per keyword: how many of its
+titles are on the boards. Every keyword keeps an exponentially weighted mean
+and second moment of that signal. The weight of an observation depends on the
+time since the previous batch (half-life in hours), so irregular crawl
+intervals are handled, and a keyword missing from a batch counts as a zero
+observation without being touched: between its own updates the moments only
+decay by 0.5 ** (elapsed / half_life). A batch therefore costs O(keywords in
+the batch), not O(vocabulary).
+
+Before each update the detector records the keyword's expected level (the
+decayed mean and variance). A query over the last N hours reads only the
+observations inside that window and compares each active keyword's level
+there with its baseline at the start of the window.
+"""
+
+import math
+from collections import deque
+from datetime import datetime
+from typing import Deque, Dict, List, Mapping, Optional, Tuple
+
+
+# Half-life of the baseline in hours
+DEFAULT_HALF_LIFE_HOURS = 12.0
+
+# Observations kept for window queries
+DEFAULT_RETENTION_HOURS = 96.0
+
+
+def _minutes(time: datetime) -> float:
+    return time.timestamp() / 60.0
+
+
+class KeywordBurst:
+    """Activity of one keyword inside a query window"""
+
+    __slots__ = ("keyword", "level", "peak", "baseline", "baseline_std", "batches")
+
+    def __init__(self, keyword: str, level: float, peak: int, baseline: float,
+                 baseline_std: float, batches: int):
+        self.keyword = keyword
+        # Mean number of titles on the boards per batch in the window
+        self.level = level
+        # Most titles on the boards in a single batch
+        self.peak = peak
+        # Expected level (EWMA) and its standard deviation at the window start
+        self.baseline = baseline
+        self.baseline_std = baseline_std
+        # Batches of the window in which the keyword appeared
+        self.batches = batches
+
+    @property
+    def growth(self) -> float:
+        """Level relative to the baseline (inf for a keyword without history)"""
+        if self.baseline <= 0:
+            return math.inf
+        return self.level / self.baseline
+
+    @property
+    def z_score(self) -> float:
+        """Standard score of the level against the baseline"""
+        # A floor keeps near-constant baselines from producing huge scores
+        std = max(self.baseline_std, 0.5)
+        return (self.level - self.baseline) / std
+
+
+class EwmaDetector:
+    """Per-keyword EWMA mean/variance updated batch by batch"""
+
+    def __init__(
+        self,
+        half_life_hours: float = DEFAULT_HALF_LIFE_HOURS,
+        retention_hours: float = DEFAULT_RETENTION_HOURS,
+    ):
+        self.half_life = half_life_hours * 60.0
+        self.retention = retention_hours * 60.0
+        # keyword -> [mean, second moment, minute of the state]
+        self._state: Dict[str, List[float]] = {}
+        # (minute, minute of the previous batch, {keyword: (count, mean, second)})
+        # with the moments as they were just before the batch
+        self._batches: Deque[Tuple[float, Optional[float], Dict[str, Tuple[int, float, float]]]] = deque()
+        self.last_time: Optional[float] = None
+        self._pruned_at: Optional[float] = None
+
+    def __len__(self) -> int:
+        return len(self._state)
+
+    def _decay(self, elapsed: float) -> float:
+        return 0.5 ** (max(elapsed, 0.0) / self.half_life)
+
+    def update(self, time: datetime, counts: Mapping[str, int]) -> None:
+        """
+        Fold one crawl batch into the baselines
+
+        Args:
+            time: Crawl time of the batch (batches must arrive in time order)
+            counts: Titles on the boards per keyword in this batch
+        """
+        now = _minutes(time)
+        previous = self.last_time
+        if previous is not None and now < previous:
+            raise ValueError("Batches must be added in time order")
+        # Weight of this observation; the first batch seeds the baselines
+        weight = 1.0 if previous is None else 1.0 - self._decay(now - previous)
+
+        observed = {}
+        state = self._state
+        for keyword, count in counts.items():
+            moments = state.get(keyword)
+            if moments is None:
+                mean = second = 0.0
+            else:
+                # Zero observations since the keyword's last update
+                decay = self._decay(previous - moments[2])
+                mean, second = moments[0] * decay, moments[1] * decay
+            observed[keyword] = (count, mean, second)
+            state[keyword] = [
+                (1.0 - weight) * mean + weight * count,
+                (1.0 - weight) * second + weight * count * count,
+                now,
+            ]
+
+        self._batches.append((now, previous, observed))
+        self.last_time = now
+
+        while self._batches and self._batches[0][0] < now - self.retention:
+            self._batches.popleft()
+
+        # Now and then forget keywords that have faded out; they restart from 0
+        if self._pruned_at is None:
+            self._pruned_at = now
+        elif now - self._pruned_at >= self.retention / 4:
+            self._prune(now)
+            self._pruned_at = now
+
+    def _prune(self, now: float) -> None:
+        stale = [
+            keyword for keyword, (mean, _, updated) in self._state.items()
+            if updated < now - self.retention and mean * self._decay(now - updated) < 1e-3
+        ]
+        for keyword in stale:
+            del self._state[keyword]
+
+    def bursts(self, window_hours: float) -> List[KeywordBurst]:
+        """
+        Keywords active in the last window_hours (ending at the latest batch)
+
+        Args:
+            window_hours: Window length in hours
+
+        Returns:
+            One KeywordBurst per keyword seen in the window
+        """
+        if self.last_time is None:
+            return []
+        start = self.last_time - window_hours * 60.0
+        # The seeding batch has no baseline to compare with
+        window = [
+            batch for batch in self._batches
+            if batch[0] > start and batch[1] is not None
+        ]
+        if not window:
+            return []
+
+        # Baselines refer to the state just before the first batch of the window
+        reference = window[0][1]
+        totals: Dict[str, int] = {}
+        peaks: Dict[str, int] = {}
+        active: Dict[str, int] = {}
+        baselines: Dict[str, Tuple[float, float]] = {}
+        for _, previous, observed in window:
+            for keyword, (count, mean, second) in observed.items():
+                totals[keyword] = totals.get(keyword, 0) + count
+                active[keyword] = active.get(keyword, 0) + 1
+                if count > peaks.get(keyword, -1):
+                    peaks[keyword] = count
+                if keyword not in baselines:
+                    # Undo the decay between the reference point and this batch
+                    growth = 1.0 / self._decay(previous - reference)
+                    mean, second = mean * growth, second * growth
+                    baselines[keyword] = (mean, second)
+
+        batch_count = len(window)
+        bursts = []
+        for keyword, total in totals.items():
+            mean, second = baselines[keyword]
+            variance = max(second - mean * mean, 0.0)
+            bursts.append(KeywordBurst(
+                keyword,
+                total / batch_count,
+                peaks[keyword],
+                mean,
+                math.sqrt(variance),
+                active[keyword],
+            ))
+        return bursts
@@ -0,0 +1,144 @@
+"""
+Sparse keyword co-occurrence
+
+Each title is a row of a sparse title x keyword count matrix X, stored in
+CSR form (indptr / keyword ids / counts). Co-occurrence counts are the upper
+triangle of X^T X: for keywords a != b in one title the pair gains
+count(a) * count(b), and a keyword repeated c times pairs with itself
+c * (c - 1) / 2 times. Rows of several days are stacked under one shared
+vocabulary, so a multi-day window is a single product.
+
+The product is computed directly from the non-zeros of each row with NumPy
+(repeat/cumsum to expand the row-local pairs, then unique/bincount to sum
+them), so no pair is ever held as a Python object.
+"""
+
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
+
+
+class KeywordMatrix:
+    """Title x keyword count matrix over one or more days"""
+
+    def __init__(self):
+        self.vocabulary: List[str] = []
+        self._ids: Dict[str, int] = {}
+        self._indptr: List[np.ndarray] = []
+        self._indices: List[np.ndarray] = []
+        self._data: List[np.ndarray] = []
+        self._rows = 0
+
+    def __len__(self) -> int:
+        return self._rows
+
+    def keyword_id(self, keyword: str) -> int:
+        """Id of a keyword in the shared vocabulary (interned on first use)"""
+        keyword_id = self._ids.get(keyword)
+        if keyword_id is None:
+            keyword_id = self._ids[keyword] = len(self.vocabulary)
+            self.vocabulary.append(keyword)
+        return keyword_id
+
+    def add_rows(
+        self,
+        vocabulary: Sequence[str],
+        indptr: Sequence[int],
+        indices: Sequence[int],
+        data: Sequence[int],
+    ) -> None:
+        """
+        Append CSR rows whose keyword ids refer to their own vocabulary
+
+        Args:
+            vocabulary: Keyword of each local id
+            indptr: Row offsets into indices/data (len = rows + 1)
+            indices: Local keyword id of each non-zero
+            data: Count of each non-zero
+        """
+        local_to_global = np.fromiter(
+            (self.keyword_id(keyword) for keyword in vocabulary),
+            dtype=np.int64,
+            count=len(vocabulary),
+        )
+        indptr = np.asarray(indptr, dtype=np.int64)
+        indices = np.asarray(indices, dtype=np.int64)
+        self._indptr.append(indptr[1:] - indptr[:-1])
+        self._indices.append(local_to_global[indices] if len(indices) else indices)
+        self._data.append(np.asarray(data, dtype=np.int64))
+        self._rows += len(indptr) - 1
+
+    def _csr(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        if not self._rows:
+            empty = np.zeros(0, dtype=np.int64)
+            return empty, empty, empty
+        row_sizes = np.concatenate(self._indptr)
+        return row_sizes, np.concatenate(self._indices), np.concatenate(self._data)
+
+    def cooccurrence(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Non-zero upper triangle of X^T X, diagonal counted as unordered pairs
+
+        Returns:
+            (first_ids, second_ids, counts) with first_id <= second_id,
+            ordered by (first_id, second_id)
+        """
+        row_sizes, indices, data = self._csr()
+        vocab_size = np.int64(max(len(self.vocabulary), 1))
+
+        # Each non-zero pairs with the non-zeros after it in the same row
+        row_ends = np.repeat(np.cumsum(row_sizes), row_sizes)
+        partners = row_ends - np.arange(len(indices)) - 1
+        left = np.repeat(np.arange(len(indices)), partners)
+        block_starts = np.repeat(np.cumsum(partners) - partners, partners)
+        right = left + 1 + (np.arange(len(left)) - block_starts)
+
+        a = indices[left]
+        b = indices[right]
+        off_diagonal = np.minimum(a, b) * vocab_size + np.maximum(a, b)
+        repeated = data > 1
+        codes = np.concatenate([off_diagonal, indices[repeated] * (vocab_size + 1)])
+        weights = np.concatenate([
+            data[left] * data[right],
+            data[repeated] * (data[repeated] - 1) // 2,
+        ])
+
+        if not len(codes):
+            empty = np.zeros(0, dtype=np.int64)
+            return empty, empty, empty
+        unique_codes, inverse = np.unique(codes, return_inverse=True)
+        counts = np.bincount(inverse.ravel(), weights=weights, minlength=len(unique_codes))
+        return unique_codes // vocab_size, unique_codes % vocab_size, counts.astype(np.int64)
+
+    def top_pairs(self, min_count: int = 1, top_n: int = 20) -> List[Tuple[str, str, int]]:
+        """
+        Most frequent keyword pairs
+
+        Args:
+            min_count: Minimum co-occurrence count
+            top_n: Number of pairs to return
+
+        Returns:
+            [(keyword1, keyword2, count)] by count descending, then by first
+            appearance of the keywords; keyword1 <= keyword2 as strings
+        """
+        first, second, counts = self.cooccurrence()
+        keep = np.flatnonzero(counts >= min_count)
+        if not len(keep) or top_n <= 0:
+            return []
+
+        # Candidates are in (first_id, second_id) order; a stable sort on the
+        # negated count keeps that order among equal counts
+        if len(keep) > top_n:
+            threshold = np.partition(counts[keep], len(keep) - top_n)[len(keep) - top_n]
+            keep = keep[counts[keep] >= threshold]
+        keep = keep[np.argsort(-counts[keep], kind="stable")][:top_n]
+
+        vocabulary = self.vocabulary
+        pairs = []
+        for i in keep:
+            keyword1, keyword2 = vocabulary[first[i]], vocabulary[second[i]]
+            if keyword2 < keyword1:
+                keyword1, keyword2 = keyword2, keyword1
+            pairs.append((keyword1, keyword2, int(counts[i])))
+        return pairs
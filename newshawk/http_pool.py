@@ -0,0 +1,166 @@
+"""
+Shared HTTP session pool
+
+One pooled requests.Session per proxy setting, shared by the crawler, the
+notification senders and the RSS fetch scripts. Connections are kept alive
+between requests, each host gets a bounded connection pool, and every request
+is timed so a run can report where its network time went.
+"""
+
+import threading
+import time
+from typing import Dict, List, Optional
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+
+
+DEFAULT_TIMEOUT = 10
+DEFAULT_POOL_CONNECTIONS = 16
+DEFAULT_POOL_MAXSIZE = 8
+
+
+class RequestMetrics:
+    """Thread-safe per-host request timing"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._hosts: Dict[str, Dict] = {}
+
+    def record(
+        self, host: str, elapsed: float, status: Optional[int], nbytes: int = 0
+    ) -> None:
+        """Record one request; status None means the request raised"""
+        with self._lock:
+            stats = self._hosts.setdefault(
+                host,
+                {"count": 0, "errors": 0, "total_time": 0.0, "max_time": 0.0, "bytes": 0},
+            )
+            stats["count"] += 1
+            stats["total_time"] += elapsed
+            stats["max_time"] = max(stats["max_time"], elapsed)
+            stats["bytes"] += nbytes
+            if status is None or status >= 400:
+                stats["errors"] += 1
+
+    def summary(self) -> Dict[str, Dict]:
+        """Per-host counters with average latency, slowest host first"""
+        with self._lock:
+            items = [(host, dict(stats)) for host, stats in self._hosts.items()]
+
+        result = {}
+        for host, stats in sorted(items, key=lambda x: -x[1]["total_time"]):
+            stats["avg_time"] = stats["total_time"] / stats["count"] if stats["count"] else 0.0
+            result[host] = stats
+        return result
+
+    def format_summary(self) -> List[str]:
+        """Human-readable summary lines"""
+        lines = []
+        for host, stats in self.summary().items():
+            lines.append(
+                f"{host}: {stats['count']} requests, {stats['errors']} errors, "
+                f"avg {stats['avg_time'] * 1000:.0f}ms, max {stats['max_time'] * 1000:.0f}ms, "
+                f"{stats['bytes'] / 1024:.1f}KB"
+            )
+        return lines
+
+    def reset(self) -> None:
+        with self._lock:
+            self._hosts.clear()
+
+
+class HttpPool:
+    """Pooled keep-alive sessions keyed by proxy URL"""
+
+    def __init__(
+        self,
+        pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        timeout: float = DEFAULT_TIMEOUT,
+    ):
+        """
+        Args:
+            pool_connections: Number of hosts whose connection pools are kept
+            pool_maxsize: Maximum open connections per host; extra requests wait
+            timeout: Default request timeout in seconds
+        """
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.timeout = timeout
+        self.metrics = RequestMetrics()
+        self._sessions: Dict[Optional[str], requests.Session] = {}
+        self._lock = threading.Lock()
+
+    def session(self, proxy_url: Optional[str] = None) -> requests.Session:
+        """Get (or create) the session for a proxy setting"""
+        proxy_url = proxy_url or None
+        with self._lock:
+            session = self._sessions.get(proxy_url)
+            if session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(
+                    pool_connections=self.pool_connections,
+                    pool_maxsize=self.pool_maxsize,
+                    pool_block=True,
+                )
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                if proxy_url:
+                    session.proxies = {"http": proxy_url, "https": proxy_url}
+                self._sessions[proxy_url] = session
+            return session
+
+    def request(
+        self, method: str, url: str, proxy_url: Optional[str] = None, **kwargs
+    ) -> requests.Response:
+        """Send a request through the pool and record its timing"""
+        kwargs.setdefault("timeout", self.timeout)
+        host = urlparse(url).netloc
+        start = time.perf_counter()
+        try:
+            response = self.session(proxy_url).request(method, url, **kwargs)
+        except Exception:
+            self.metrics.record(host, time.perf_counter() - start, None)
+            raise
+        self.metrics.record(
+            host, time.perf_counter() - start, response.status_code, len(response.content)
+        )
+        return response
+
+    def get(self, url: str, proxy_url: Optional[str] = None, **kwargs) -> requests.Response:
+        return self.request("GET", url, proxy_url=proxy_url, **kwargs)
+
+    def post(self, url: str, proxy_url: Optional[str] = None, **kwargs) -> requests.Response:
+        return self.request("POST", url, proxy_url=proxy_url, **kwargs)
+
+    def close(self) -> None:
+        """Close every pooled session"""
+        with self._lock:
+            for session in self._sessions.values():
+                session.close()
+            self._sessions.clear()
+
+
+_pool: Optional[HttpPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_pool() -> HttpPool:
+    """Get the process-wide pool"""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = HttpPool()
+        return _pool
+
+
+def configure_pool(**kwargs) -> HttpPool:
+    """Replace the process-wide pool, e.g. to size it for the crawl concurrency"""
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.close()
+        _pool = HttpPool(**kwargs)
+        return _pool
@@ -0,0 +1,322 @@
+"""
+Shared crawl batch reader/writer
+
+The txt batch format is written by the crawler (main.py) and by the MCP
+server's trigger_crawl, and read by both. This module is the single
+implementation of it. Parsed batches are memoized per process, keyed on
+(path, mtime, size): a finished batch never changes, so a 30-day query parses
+each file at most once. Callers always get fresh dicts and may mutate them.
+"""
+
+import sys
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from .snapshot import (
+    clean_title,
+    load_fresh_snapshot,
+    snapshot_path,
+    sorted_title_rows,
+    write_snapshot,
+)
+
+
+# main.py has always written the first marker, trigger_crawl the second
+FAILED_MARKER = "==== 以下IDRequestfailed ===="
+FAILED_MARKERS = (FAILED_MARKER, "==== 以下ID请求失败 ====")
+
+# Upper bound on cached title rows (across all files) before LRU eviction
+DEFAULT_MAX_CACHED_ROWS = 500_000
+
+
+def parse_titles_text(content: str) -> Tuple[Dict, Dict]:
+    """
+    Parse the text of one txt batch
+
+    Returns:
+        (titles_by_id, id_to_name)
+        - titles_by_id: {platform_id: {title: {ranks, url, mobileUrl}}}
+        - id_to_name: {platform_id: platform_name}
+    """
+    titles_by_id = {}
+    id_to_name = {}
+
+    for section in content.split("\n\n"):
+        if not section.strip() or any(marker in section for marker in FAILED_MARKERS):
+            continue
+
+        lines = section.strip().split("\n")
+        if len(lines) < 2:
+            continue
+
+        # id | name or id
+        header_line = lines[0].strip()
+        if " | " in header_line:
+            source_id, name = header_line.split(" | ", 1)
+            source_id = source_id.strip()
+            id_to_name[source_id] = name.strip()
+        else:
+            source_id = header_line
+            id_to_name[source_id] = source_id
+
+        source_titles = titles_by_id[source_id] = {}
+
+        for line in lines[1:]:
+            title_part = line.strip()
+            if not title_part:
+                continue
+
+            # A malformed line only loses that line, not the whole batch
+            try:
+                rank = None
+                if ". " in title_part and title_part.split(". ")[0].isdigit():
+                    rank_str, title_part = title_part.split(". ", 1)
+                    rank = int(rank_str)
+
+                mobile_url = ""
+                if " [MOBILE:" in title_part:
+                    title_part, mobile_part = title_part.rsplit(" [MOBILE:", 1)
+                    if mobile_part.endswith("]"):
+                        mobile_url = mobile_part[:-1]
+
+                url = ""
+                if " [URL:" in title_part:
+                    title_part, url_part = title_part.rsplit(" [URL:", 1)
+                    if url_part.endswith("]"):
+                        url = url_part[:-1]
+
+                source_titles[clean_title(title_part.strip())] = {
+                    "ranks": [rank] if rank is not None else [1],
+                    "url": url,
+                    "mobileUrl": mobile_url,
+                }
+            except ValueError:
+                continue
+
+    return titles_by_id, id_to_name
+
+
+def _read_batch(file_path: Path) -> Tuple[Dict, Dict]:
+    snapshot = load_fresh_snapshot(file_path)
+    if snapshot is not None:
+        return snapshot
+    with open(file_path, "r", encoding="utf-8") as f:
+        return parse_titles_text(f.read())
+
+
+class _ParseCache:
+    """LRU of parsed batches stored as compact interned rows"""
+
+    def __init__(self, max_rows: int = DEFAULT_MAX_CACHED_ROWS):
+        self.max_rows = max_rows
+        self.hits = 0
+        self.misses = 0
+        self._rows = 0
+        self._entries: "OrderedDict[str, Tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _pack(titles_by_id: Dict, id_to_name: Dict) -> Tuple:
+        rows = []
+        for source_id, titles in titles_by_id.items():
+            for title, info in titles.items():
+                rows.append(
+                    (
+                        source_id,
+                        sys.intern(title),
+                        tuple(info["ranks"]),
+                        sys.intern(info["url"]),
+                        sys.intern(info["mobileUrl"]),
+                    )
+                )
+        return dict(id_to_name), tuple(rows)
+
+    @staticmethod
+    def _unpack(id_to_name: Dict, rows: Tuple) -> Tuple[Dict, Dict]:
+        titles_by_id = {source_id: {} for source_id in id_to_name}
+        for source_id, title, ranks, url, mobile_url in rows:
+            titles_by_id[source_id][title] = {
+                "ranks": list(ranks),
+                "url": url,
+                "mobileUrl": mobile_url,
+            }
+        return titles_by_id, dict(id_to_name)
+
+    def get(self, key: str, signature: Tuple) -> Optional[Tuple[Dict, Dict]]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] != signature:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+        return self._unpack(entry[1], entry[2])
+
+    def put(self, key: str, signature: Tuple, titles_by_id: Dict, id_to_name: Dict) -> None:
+        packed_names, rows = self._pack(titles_by_id, id_to_name)
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._rows -= len(old[2])
+            self._entries[key] = (signature, packed_names, rows)
+            self._rows += len(rows)
+            while self._rows > self.max_rows and len(self._entries) > 1:
+                _, evicted = self._entries.popitem(last=False)
+                self._rows -= len(evicted[2])
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._rows = 0
+            self.hits = 0
+            self.misses = 0
+
+    def info(self) -> Dict:
+        with self._lock:
+            return {
+                "files": len(self._entries),
+                "rows": self._rows,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+
+_cache = _ParseCache()
+
+
+def parse_titles_file(file_path: Path) -> Tuple[Dict, Dict]:
+    """
+    Parse one batch file (snapshot first, txt otherwise), memoized per process
+
+    Raises:
+        OSError: The file cannot be read
+    """
+    file_path = Path(file_path)
+    stat = file_path.stat()
+    key = str(file_path.resolve())
+    signature = (stat.st_mtime_ns, stat.st_size)
+
+    cached = _cache.get(key, signature)
+    if cached is not None:
+        return cached
+
+    titles_by_id, id_to_name = _read_batch(file_path)
+    _cache.put(key, signature, titles_by_id, id_to_name)
+    return titles_by_id, id_to_name
+
+
+def clear_parse_cache() -> None:
+    _cache.clear()
+
+
+def parse_cache_info() -> Dict:
+    """Cached file/row counts and hit statistics"""
+    return _cache.info()
+
+
+def list_batch_files(txt_dir: Path) -> List[Path]:
+    """txt batch files of one day, in time order"""
+    txt_dir = Path(txt_dir)
+    if not txt_dir.exists():
+        return []
+    return sorted(f for f in txt_dir.iterdir() if f.suffix == ".txt")
+
+
+def merge_titles_files(
+    txt_files: List[Path],
+    platform_ids: Optional[List[str]] = None,
+) -> Tuple[Dict, Dict, Dict]:
+    """
+    Merge the batches of one day into a single title table
+
+    Ranks of a title seen in several batches are concatenated in batch order.
+    Unreadable files are reported and skipped. Runs in worker processes for
+    range loads, so it only takes and returns plain (picklable) values.
+
+    Args:
+        txt_files: Batch files in time order
+        platform_ids: Platforms to keep, None for all
+
+    Returns:
+        (all_titles, id_to_name, timestamps) where timestamps maps each
+        merged file name to its mtime
+    """
+    all_titles: Dict = {}
+    id_to_name: Dict = {}
+    timestamps: Dict = {}
+
+    for txt_file in txt_files:
+        txt_file = Path(txt_file)
+        try:
+            titles_by_id, file_id_to_name = parse_titles_file(txt_file)
+
+            id_to_name.update(file_id_to_name)
+
+            for platform_id, titles in titles_by_id.items():
+                if platform_ids and platform_id not in platform_ids:
+                    continue
+
+                platform_titles = all_titles.setdefault(platform_id, {})
+                for title, info in titles.items():
+                    if title in platform_titles:
+                        platform_titles[title]["ranks"].extend(info["ranks"])
+                    else:
+                        platform_titles[title] = info.copy()
+
+            timestamps[txt_file.name] = txt_file.stat().st_mtime
+
+        except Exception as e:
+            print(f"Warning: 解析文件 {txt_file} 失败: {e}")
+            continue
+
+    return all_titles, id_to_name, timestamps
+
+
+def format_titles_text(results: Dict, id_to_name: Dict, failed_ids: List) -> str:
+    """Render crawl results in the txt batch format"""
+    lines = []
+    for id_value, title_data in results.items():
+        # id | name or id
+        name = id_to_name.get(id_value)
+        if name and name != id_value:
+            lines.append(f"{id_value} | {name}")
+        else:
+            lines.append(f"{id_value}")
+
+        for rank, cleaned_title, url, mobile_url in sorted_title_rows(title_data):
+            line = f"{rank}. {cleaned_title}"
+            if url:
+                line += f" [URL:{url}]"
+            if mobile_url:
+                line += f" [MOBILE:{mobile_url}]"
+            lines.append(line)
+
+        lines.append("")
+
+    if failed_ids:
+        lines.append(FAILED_MARKER)
+        for id_value in failed_ids:
+            lines.append(f"{id_value}")
+
+    return "".join(line + "\n" for line in lines)
+
+
+def write_titles_file(
+    file_path: Path, results: Dict, id_to_name: Dict, failed_ids: List
+) -> None:
+    """
+    Write a txt batch and its snapshot
+
+    The snapshot is written after the txt, so it is never older than it.
+    A failed snapshot write only costs read speed.
+    """
+    file_path = Path(file_path)
+    with open(file_path, "w", encoding="utf-8") as f:
+        f.write(format_titles_text(results, id_to_name, failed_ids))
+
+    try:
+        write_snapshot(snapshot_path(file_path), results, id_to_name, failed_ids)
+    except OSError as e:
+        print(f"Warning: snapshot write failed for {file_path}: {e}")
@@ -0,0 +1,264 @@
+"""
+Vectorized title similarity
+
+Titles are reduced to sets of character shingles (bigrams by default, which
+work for CJK as well as space-separated scripts). Shingles are hashed to
+32-bit ids and stored as one sorted column, so scoring a query against every
+title of a day is a handful of NumPy searchsorted/bincount calls instead of a
+SequenceMatcher per title. The score is the Dice coefficient of the shingle
+sets, which tracks SequenceMatcher.ratio() closely enough to shortlist
+candidates for an exact re-rank.
+
+The same shingle hashes feed MinHash signatures and LSH banding, which group
+near-duplicate titles (the same story worded slightly differently on several
+platforms) in near-linear time.
+"""
+
+import re
+import zlib
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+import numpy as np
+
+
+SHINGLE_SIZE = 2
+
+# MinHash: NUM_PERM hash functions split into LSH_BANDS bands. With 32 bands of
+# 3 rows a pair with Jaccard 0.5 becomes a candidate with ~99% probability.
+NUM_PERM = 96
+LSH_BANDS = 32
+# Buckets larger than this are shared by generic shingles; their members are
+# only compared to the first few entries
+MAX_BUCKET_COMPARISONS = 64
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_MAX_HASH = np.uint64((1 << 32) - 1)
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize(text: str) -> str:
+    """Lowercase and collapse whitespace"""
+    return _WHITESPACE.sub(" ", text.lower()).strip()
+
+
+def shingles(text: str, size: int = SHINGLE_SIZE) -> Set[str]:
+    """Character shingles of a title; titles shorter than size yield themselves"""
+    text = normalize(text)
+    if len(text) <= size:
+        return {text} if text else set()
+    return {text[i:i + size] for i in range(len(text) - size + 1)}
+
+
+def shingle_ids(text: str, size: int = SHINGLE_SIZE) -> np.ndarray:
+    """Sorted unique 32-bit hashes of a title's shingles"""
+    hashes = [zlib.crc32(s.encode("utf-8")) for s in shingles(text, size)]
+    return np.unique(np.array(hashes, dtype=np.uint32))
+
+
+class ShingleIndex:
+    """Hashed shingle sets of many titles, scored against a query in bulk"""
+
+    def __init__(self, texts: Iterable[str], size: int = SHINGLE_SIZE):
+        self.size = size
+        rows = []
+        cols = []
+        sizes = []
+        for row, text in enumerate(texts):
+            ids = shingle_ids(text, size)
+            rows.append(np.full(len(ids), row, dtype=np.int32))
+            cols.append(ids)
+            sizes.append(len(ids))
+
+        self.count = len(sizes)
+        self.sizes = np.array(sizes, dtype=np.int32)
+        if rows:
+            all_rows = np.concatenate(rows)
+            all_cols = np.concatenate(cols)
+        else:
+            all_rows = np.zeros(0, dtype=np.int32)
+            all_cols = np.zeros(0, dtype=np.uint32)
+
+        order = np.argsort(all_cols, kind="stable")
+        self._cols = all_cols[order]
+        self._rows = all_rows[order]
+
+    def intersections(self, query_ids: np.ndarray) -> np.ndarray:
+        """Number of shared shingles between the query and every title"""
+        if self.count == 0 or len(query_ids) == 0:
+            return np.zeros(self.count, dtype=np.int64)
+        lo = np.searchsorted(self._cols, query_ids, side="left")
+        hi = np.searchsorted(self._cols, query_ids, side="right")
+        hit = hi > lo
+        if not hit.any():
+            return np.zeros(self.count, dtype=np.int64)
+        matched_rows = np.concatenate(
+            [self._rows[a:b] for a, b in zip(lo[hit], hi[hit])]
+        )
+        return np.bincount(matched_rows, minlength=self.count)
+
+    def dice(self, query: str) -> np.ndarray:
+        """Dice coefficient of the query against every title (0-1)"""
+        query_ids = shingle_ids(query, self.size)
+        inter = self.intersections(query_ids)
+        denominator = self.sizes + len(query_ids)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            scores = np.where(denominator > 0, 2.0 * inter / denominator, 0.0)
+        return scores
+
+    def shortlist(
+        self, query: str, min_score: float = 0.0, top_k: Optional[int] = None
+    ) -> List[int]:
+        """
+        Row ids worth an exact comparison, in row order
+
+        Keeps every row scoring at least min_score, plus the top_k best
+        scoring rows with any shingle in common.
+        """
+        scores = self.dice(query)
+        selected = scores >= min_score if min_score > 0 else scores > 0
+        if top_k:
+            positive = np.flatnonzero(scores > 0)
+            if len(positive) > top_k:
+                best = positive[np.argpartition(-scores[positive], top_k - 1)[:top_k]]
+            else:
+                best = positive
+            selected[best] = True
+        return np.flatnonzero(selected).tolist()
+
+
+def _permutations(num_perm: int, seed: int = 1) -> Tuple[np.ndarray, np.ndarray]:
+    rng = np.random.RandomState(seed)
+    a = rng.randint(1, 1 << 31, size=num_perm, dtype=np.int64).astype(np.uint64)
+    b = rng.randint(0, 1 << 31, size=num_perm, dtype=np.int64).astype(np.uint64)
+    return a, b
+
+
+def minhash_signatures(
+    shingle_sets: Sequence[np.ndarray], num_perm: int = NUM_PERM
+) -> np.ndarray:
+    """
+    MinHash signatures of many shingle-id arrays at once
+
+    Returns a (len(shingle_sets), num_perm) uint64 matrix. Rows of empty sets
+    are filled with the maximum hash value.
+    """
+    count = len(shingle_sets)
+    signatures = np.full((count, num_perm), _MAX_HASH, dtype=np.uint64)
+    lengths = np.array([len(ids) for ids in shingle_sets], dtype=np.int64)
+    non_empty = np.flatnonzero(lengths)
+    if len(non_empty) == 0:
+        return signatures
+
+    a, b = _permutations(num_perm)
+    ids = np.concatenate([shingle_sets[i] for i in non_empty]).astype(np.uint64)
+    # (a * x + b) mod p, truncated to 32 bits; a, x < 2**32 so nothing overflows
+    hashed = ((ids[:, None] * a[None, :] + b[None, :]) % _MERSENNE_PRIME) & _MAX_HASH
+    starts = np.concatenate(([0], np.cumsum(lengths[non_empty])[:-1]))
+    signatures[non_empty] = np.minimum.reduceat(hashed, starts, axis=0)
+    return signatures
+
+
+def jaccard(a: Set, b: Set) -> float:
+    """Exact Jaccard similarity of two sets"""
+    if not a or not b:
+        return 0.0
+    inter = len(a & b)
+    return inter / (len(a) + len(b) - inter)
+
+
+class _UnionFind:
+    def __init__(self, size: int):
+        self.parent = list(range(size))
+
+    def find(self, i: int) -> int:
+        parent = self.parent
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    def union(self, i: int, j: int) -> None:
+        ri, rj = self.find(i), self.find(j)
+        if ri != rj:
+            # Keep the smaller index as root so clusters are ordered by first member
+            if rj < ri:
+                ri, rj = rj, ri
+            self.parent[rj] = ri
+
+
+def cluster_near_duplicates(
+    texts: Sequence[str],
+    threshold: float = 0.5,
+    num_perm: int = NUM_PERM,
+    bands: int = LSH_BANDS,
+    size: int = SHINGLE_SIZE,
+    groups: Optional[Sequence] = None,
+) -> List[List[int]]:
+    """
+    Group texts whose shingle sets have Jaccard similarity >= threshold
+
+    Candidate pairs come from LSH buckets (texts agreeing on every row of at
+    least one band) and are confirmed with the exact Jaccard similarity, so
+    false positives never merge; a true pair is missed only if it shares no
+    band. Clusters are transitive (single linkage).
+
+    With groups (one label per text, e.g. the platform), a cluster never
+    holds two texts of the same group: a pair is only merged when the two
+    clusters' groups are disjoint.
+
+    Returns:
+        Lists of indices into texts, each sorted, ordered by their first index.
+        Every text appears in exactly one cluster.
+    """
+    count = len(texts)
+    if count < 2:
+        return [[i] for i in range(count)]
+
+    rows = num_perm // bands
+    shingle_sets = [shingle_ids(text, size) for text in texts]
+    signatures = minhash_signatures(shingle_sets, rows * bands)
+    id_sets = [frozenset(ids.tolist()) for ids in shingle_sets]
+
+    union_find = _UnionFind(count)
+    # Groups present in each cluster, keyed by its root
+    cluster_groups = None if groups is None else {i: {groups[i]} for i in range(count)}
+    checked: Set = set()
+    non_empty = np.array([bool(ids) for ids in id_sets])
+    multipliers = np.array(
+        [0x9E3779B97F4A7C15 >> shift for shift in range(rows)], dtype=np.uint64
+    )
+    for band in range(bands):
+        # Fold the band's rows into one 64-bit bucket key and group equal keys
+        band_rows = signatures[:, band * rows:(band + 1) * rows]
+        with np.errstate(over="ignore"):
+            keys = np.bitwise_xor.reduce(band_rows * multipliers, axis=1)
+        candidates = np.flatnonzero(non_empty)
+        order = candidates[np.argsort(keys[candidates], kind="stable")]
+        sorted_keys = keys[order]
+        boundaries = np.flatnonzero(sorted_keys[1:] != sorted_keys[:-1]) + 1
+        for members in np.split(order, boundaries):
+            if len(members) < 2:
+                continue
+            members = members.tolist()
+            heads = members[:MAX_BUCKET_COMPARISONS]
+            for pos, j in enumerate(members):
+                for i in heads[:pos] if pos < len(heads) else heads:
+                    if union_find.find(i) == union_find.find(j) or (i, j) in checked:
+                        continue
+                    checked.add((i, j))
+                    if jaccard(id_sets[i], id_sets[j]) < threshold:
+                        continue
+                    if cluster_groups is None:
+                        union_find.union(i, j)
+                        continue
+                    ri, rj = union_find.find(i), union_find.find(j)
+                    if cluster_groups[ri].isdisjoint(cluster_groups[rj]):
+                        union_find.union(i, j)
+                        root = union_find.find(i)
+                        cluster_groups[root] = cluster_groups.pop(ri) | cluster_groups.pop(rj)
+
+    clusters: Dict[int, List[int]] = {}
+    for i in range(count):
+        clusters.setdefault(union_find.find(i), []).append(i)
+    return list(clusters.values())
@@ -0,0 +1,226 @@
+"""
+Structured crawl batch snapshots
+
+Every txt batch (output/<date>/txt/HH-MM.txt) gets a binary sibling
+(HH-MM.snap) holding the same data in columnar form. Loading it needs no
+text parsing: platform ids are interned once, per-row platform index and
+rank are fixed-width arrays, and each string column is a single UTF-8 blob
+with character offsets. The txt file stays the human-readable export.
+
+Layout (little-endian):
+    magic b"NHSNAP" | uint16 version
+    string table: platform ids
+    string table: platform names
+    string table: failed ids
+    uint32 row count | uint32[rows] platform index | uint32[rows] rank
+    string table: titles | string table: urls | string table: mobile urls
+
+A string table is uint32 count, uint32 blob byte length,
+uint32[count + 1] character offsets, then the UTF-8 blob.
+"""
+
+import os
+import re
+import struct
+import sys
+from array import array
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+
+MAGIC = b"NHSNAP"
+VERSION = 1
+SNAPSHOT_SUFFIX = ".snap"
+
+_HEADER = struct.Struct("<6sH")
+_UINT32 = struct.Struct("<I")
+_TABLE_HEADER = struct.Struct("<II")
+
+
+def clean_title(title: str) -> str:
+    """Normalize a title the same way the txt export does"""
+    if not isinstance(title, str):
+        title = str(title)
+    cleaned_title = title.replace("\n", " ").replace("\r", " ")
+    cleaned_title = re.sub(r"\s+", " ", cleaned_title)
+    return cleaned_title.strip()
+
+
+def snapshot_path(txt_path: Path) -> Path:
+    """Snapshot file that sits next to a txt batch"""
+    return Path(txt_path).with_suffix(SNAPSHOT_SUFFIX)
+
+
+def sorted_title_rows(title_data: Dict) -> List[Tuple[int, str, str, str]]:
+    """(rank, cleaned title, url, mobile url) rows of one platform, in rank order"""
+    sorted_titles = []
+    for title, info in title_data.items():
+        if isinstance(info, dict):
+            ranks = info.get("ranks", [])
+            url = info.get("url", "")
+            mobile_url = info.get("mobileUrl", "")
+        else:
+            ranks = info if isinstance(info, list) else []
+            url = ""
+            mobile_url = ""
+        rank = ranks[0] if ranks else 1
+        sorted_titles.append((rank, clean_title(title), url or "", mobile_url or ""))
+
+    sorted_titles.sort(key=lambda x: x[0])
+    return sorted_titles
+
+
+def _uint32_array(values: List[int]) -> bytes:
+    data = array("I", values)
+    if sys.byteorder == "big":
+        data.byteswap()
+    return data.tobytes()
+
+
+def _read_uint32_array(buf: memoryview, offset: int, count: int) -> Tuple[array, int]:
+    end = offset + count * 4
+    data = array("I")
+    data.frombytes(buf[offset:end])
+    if sys.byteorder == "big":
+        data.byteswap()
+    return data, end
+
+
+def _pack_strings(strings: List[str]) -> bytes:
+    offsets = [0]
+    for s in strings:
+        offsets.append(offsets[-1] + len(s))
+    blob = "".join(strings).encode("utf-8")
+    return (
+        _TABLE_HEADER.pack(len(strings), len(blob))
+        + _uint32_array(offsets)
+        + blob
+    )
+
+
+def _unpack_strings(buf: memoryview, offset: int) -> Tuple[List[str], int]:
+    count, blob_len = _TABLE_HEADER.unpack_from(buf, offset)
+    offset += _TABLE_HEADER.size
+    offsets, offset = _read_uint32_array(buf, offset, count + 1)
+    text = bytes(buf[offset:offset + blob_len]).decode("utf-8")
+    strings = [text[start:end] for start, end in zip(offsets, offsets[1:])]
+    return strings, offset + blob_len
+
+
+def encode_snapshot(results: Dict, id_to_name: Dict, failed_ids: List) -> bytes:
+    """Encode crawl results; rows follow the txt export (cleaned titles, rank order)"""
+    platform_ids: List[str] = []
+    platform_names: List[str] = []
+    row_platform: List[int] = []
+    row_rank: List[int] = []
+    titles: List[str] = []
+    urls: List[str] = []
+    mobile_urls: List[str] = []
+
+    for id_value, title_data in results.items():
+        platform_index = len(platform_ids)
+        platform_ids.append(id_value)
+        platform_names.append(id_to_name.get(id_value) or id_value)
+
+        for rank, cleaned_title, url, mobile_url in sorted_title_rows(title_data):
+            row_platform.append(platform_index)
+            row_rank.append(rank)
+            titles.append(cleaned_title)
+            urls.append(url)
+            mobile_urls.append(mobile_url)
+
+    return b"".join(
+        [
+            _HEADER.pack(MAGIC, VERSION),
+            _pack_strings(platform_ids),
+            _pack_strings(platform_names),
+            _pack_strings([str(i) for i in failed_ids]),
+            _UINT32.pack(len(titles)),
+            _uint32_array(row_platform),
+            _uint32_array(row_rank),
+            _pack_strings(titles),
+            _pack_strings(urls),
+            _pack_strings(mobile_urls),
+        ]
+    )
+
+
+def decode_snapshot(data: bytes) -> Tuple[Dict, Dict, List[str]]:
+    """
+    Decode a snapshot into (titles_by_id, id_to_name, failed_ids)
+
+    titles_by_id and id_to_name match what parsing the txt batch yields:
+    platforms without titles are omitted and each title carries its first rank.
+    """
+    buf = memoryview(data)
+    magic, version = _HEADER.unpack_from(buf, 0)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError(f"unsupported snapshot format: {magic!r} v{version}")
+
+    offset = _HEADER.size
+    platform_ids, offset = _unpack_strings(buf, offset)
+    platform_names, offset = _unpack_strings(buf, offset)
+    failed_ids, offset = _unpack_strings(buf, offset)
+    (row_count,) = _UINT32.unpack_from(buf, offset)
+    offset += _UINT32.size
+    row_platform, offset = _read_uint32_array(buf, offset, row_count)
+    row_rank, offset = _read_uint32_array(buf, offset, row_count)
+    titles, offset = _unpack_strings(buf, offset)
+    urls, offset = _unpack_strings(buf, offset)
+    mobile_urls, offset = _unpack_strings(buf, offset)
+
+    titles_by_id: Dict[str, Dict] = {}
+    id_to_name: Dict[str, str] = {}
+    current_index = -1
+    source_titles: Dict = {}
+    for platform_index, rank, title, url, mobile_url in zip(
+        row_platform, row_rank, titles, urls, mobile_urls
+    ):
+        if platform_index != current_index:
+            current_index = platform_index
+            source_id = platform_ids[platform_index]
+            source_titles = titles_by_id.setdefault(source_id, {})
+            id_to_name[source_id] = platform_names[platform_index]
+        source_titles[title] = {"ranks": [rank], "url": url, "mobileUrl": mobile_url}
+
+    return titles_by_id, id_to_name, failed_ids
+
+
+def write_snapshot(path: Path, results: Dict, id_to_name: Dict, failed_ids: List) -> None:
+    """Write a snapshot atomically so readers never see a partial file"""
+    path = Path(path)
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(encode_snapshot(results, id_to_name, failed_ids))
+    os.replace(tmp_path, path)
+
+
+def read_snapshot(path: Path) -> Tuple[Dict, Dict, List[str]]:
+    """Read a snapshot file into (titles_by_id, id_to_name, failed_ids)"""
+    with open(path, "rb") as f:
+        return decode_snapshot(f.read())
+
+
+def load_fresh_snapshot(txt_path: Path) -> Optional[Tuple[Dict, Dict]]:
+    """
+    (titles_by_id, id_to_name) from the snapshot next to txt_path
+
+    Returns None when there is no snapshot, it is older than the txt file
+    (the txt was rewritten by something that does not write snapshots) or it
+    cannot be decoded, so callers fall back to parsing the txt.
+    """
+    snap_path = snapshot_path(txt_path)
+    try:
+        snap_stat = snap_path.stat()
+        txt_stat = Path(txt_path).stat()
+    except OSError:
+        return None
+
+    if snap_stat.st_mtime_ns < txt_stat.st_mtime_ns:
+        return None
+
+    try:
+        titles_by_id, id_to_name, _ = read_snapshot(snap_path)
+    except (OSError, ValueError, struct.error, UnicodeDecodeError):
+        return None
+    return titles_by_id, id_to_name
@@ -0,0 +1,239 @@
+"""
+Crawl batch time series
+
+Every txt batch is named after its crawl time (HH时MM分.txt from the MCP
+crawler, HH-MM.txt from main.py), so a day is a sequence of timestamped
+snapshots of the boards. A day's snapshots are kept as flat NumPy columns of
+(batch, title id, rank) occurrences; the series of any set of titles (a
+keyword's postings, or the titles matching a topic) is a mask over those
+columns followed by bincount / minimum.at per batch.
+
+Rollups to hour, day or week buckets count the distinct titles seen in each
+bucket, so a day bucket equals the number of titles of that day and a week
+bucket is the sum of its days. Moving averages and growth rates work on the
+resulting arrays in one pass.
+"""
+
+import re
+from datetime import date, timedelta
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+
+
+GRANULARITIES = ("hour", "day", "week")
+
+_BUCKET_MINUTES = {"hour": 60, "day": 24 * 60, "week": 7 * 24 * 60}
+
+# Placeholder while taking the minimum rank; buckets without a title get 0
+_NO_RANK = np.iinfo(np.int64).max
+
+# HH时MM分.txt, HH-MM.txt and HHMM.txt
+_BATCH_TIME = re.compile(r"^(\d{1,2})\D{0,2}(\d{2})")
+
+
+def batch_minute(filename: str) -> int:
+    """Minutes after midnight encoded in a batch file name (0 if unknown)"""
+    match = _BATCH_TIME.match(filename)
+    if not match:
+        return 0
+    hour, minute = int(match.group(1)), int(match.group(2))
+    if hour >= 24 or minute >= 60:
+        return 0
+    return hour * 60 + minute
+
+
+class DayBatches:
+    """Title occurrences in the crawl batches of one day"""
+
+    def __init__(
+        self,
+        day: date,
+        minutes: Sequence[int],
+        indptr: Sequence[int],
+        docs: Sequence[int],
+        ranks: Sequence[int],
+    ):
+        """
+        Args:
+            day: Date of the batches
+            minutes: Crawl time of each batch, in minutes after midnight
+            indptr: Offsets of each batch into docs/ranks (len = batches + 1)
+            docs: Title id of each occurrence
+            ranks: Best rank of each occurrence
+        """
+        self.day = np.datetime64(day, "D")
+        self.minutes = np.asarray(minutes, dtype=np.int64)
+        indptr = np.asarray(indptr, dtype=np.int64)
+        self.batch_of = np.repeat(np.arange(len(self.minutes)), indptr[1:] - indptr[:-1])
+        self.docs = np.asarray(docs, dtype=np.int64)
+        self.ranks = np.asarray(ranks, dtype=np.int64)
+
+    def __len__(self) -> int:
+        return len(self.minutes)
+
+    @property
+    def times(self) -> np.ndarray:
+        """Crawl time of each batch (datetime64[m])"""
+        return self.day.astype("datetime64[m]") + self.minutes.astype("timedelta64[m]")
+
+    def _selected(self, doc_ids) -> np.ndarray:
+        return np.isin(self.docs, np.asarray(doc_ids, dtype=np.int64))
+
+    def series(self, doc_ids) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Per-batch series of a set of titles
+
+        Args:
+            doc_ids: Title ids (e.g. a keyword's postings)
+
+        Returns:
+            (counts, best_ranks): titles of the set on the board in each
+            batch and their best rank (0 where none was present)
+        """
+        mask = self._selected(doc_ids)
+        batches = self.batch_of[mask]
+        counts = np.bincount(batches, minlength=len(self.minutes))
+        best = np.full(len(self.minutes), _NO_RANK, dtype=np.int64)
+        np.minimum.at(best, batches, self.ranks[mask])
+        best[best == _NO_RANK] = 0
+        return counts, best
+
+
+class Rollup:
+    """Bucketed series over a date range"""
+
+    def __init__(self, starts: np.ndarray, counts: np.ndarray, best_ranks: np.ndarray,
+                 members: List[List[Tuple[int, int]]]):
+        """
+        Args:
+            starts: Start of each bucket (datetime64[m])
+            counts: Distinct titles seen in each bucket
+            best_ranks: Best rank in each bucket (0 if no title)
+            members: (day position, title id) of the titles in each bucket,
+                     in day and title id order
+        """
+        self.starts = starts
+        self.counts = counts
+        self.best_ranks = best_ranks
+        self.members = members
+
+    def __len__(self) -> int:
+        return len(self.counts)
+
+
+def bucket_origin(start: date, granularity: str) -> date:
+    """First bucket start for a range beginning on start (weeks start on Monday)"""
+    if granularity == "week":
+        return start - timedelta(days=start.weekday())
+    return start
+
+
+def rollup(
+    days: Sequence[Tuple[DayBatches, Sequence[int]]],
+    granularity: str,
+    start: date,
+    end: date,
+) -> Rollup:
+    """
+    Roll the series of selected titles up to hour, day or week buckets
+
+    Args:
+        days: (day batches, selected title ids of that day) per loaded day
+        granularity: 'hour', 'day' or 'week'
+        start: First date of the range
+        end: Last date of the range (inclusive)
+
+    Returns:
+        Rollup covering every bucket between start and end
+    """
+    if granularity not in _BUCKET_MINUTES:
+        raise ValueError(f"Unknown granularity: {granularity}")
+    step = _BUCKET_MINUTES[granularity]
+    origin = np.datetime64(bucket_origin(start, granularity), "m")
+    stop = np.datetime64(end + timedelta(days=1), "m")
+    bucket_count = int(-(-(stop - origin).astype(np.int64) // step))
+    starts = origin + np.arange(bucket_count, dtype=np.int64) * np.timedelta64(step, "m")
+
+    doc_limit = max([int(batches.docs.max()) + 1 for batches, _ in days if len(batches.docs)] or [1])
+    day_limit = max(len(days), 1)
+
+    codes = []
+    best = np.full(bucket_count, _NO_RANK, dtype=np.int64)
+    for position, (batches, doc_ids) in enumerate(days):
+        mask = batches._selected(doc_ids)
+        if not mask.any():
+            continue
+        offsets = (batches.day.astype("datetime64[m]") - origin).astype(np.int64)
+        buckets = (offsets + batches.minutes[batches.batch_of[mask]]) // step
+        inside = (buckets >= 0) & (buckets < bucket_count)
+        buckets = buckets[inside]
+        np.minimum.at(best, buckets, batches.ranks[mask][inside])
+        codes.append((buckets * day_limit + position) * doc_limit + batches.docs[mask][inside])
+
+    best[best == _NO_RANK] = 0
+    if codes:
+        unique_codes = np.unique(np.concatenate(codes))
+    else:
+        unique_codes = np.zeros(0, dtype=np.int64)
+    buckets = unique_codes // (day_limit * doc_limit)
+    counts = np.bincount(buckets, minlength=bucket_count)
+
+    positions = (unique_codes // doc_limit) % day_limit
+    docs = unique_codes % doc_limit
+    bounds = np.cumsum(counts)[:-1]
+    members = [
+        list(zip(p.tolist(), d.tolist()))
+        for p, d in zip(np.split(positions, bounds), np.split(docs, bounds))
+    ]
+    return Rollup(starts, counts, best, members)
+
+
+def moving_average(values: np.ndarray, window: int) -> np.ndarray:
+    """Trailing moving average (shorter windows at the start of the series)"""
+    values = np.asarray(values, dtype=np.float64)
+    if not len(values):
+        return values
+    window = max(int(window), 1)
+    sums = np.cumsum(values)
+    sums[window:] = sums[window:] - sums[:-window]
+    sizes = np.minimum(np.arange(1, len(values) + 1), window)
+    return sums / sizes
+
+
+def growth_rates(values: np.ndarray) -> np.ndarray:
+    """Relative change from each point to the next (NaN where the previous point is 0)"""
+    values = np.asarray(values, dtype=np.float64)
+    rates = np.full(len(values), np.nan)
+    if len(values) > 1:
+        previous = values[:-1]
+        np.divide(values[1:] - previous, previous, out=rates[1:], where=previous > 0)
+    return rates
+
+
+def window_growth(times: np.ndarray, values: np.ndarray, window_hours: float) -> Optional[float]:
+    """
+    Growth of the mean value over the last window against the window before it
+
+    Args:
+        times: Batch times (datetime64[m]), ascending
+        values: Per-batch values
+        window_hours: Window length in hours
+
+    Returns:
+        Relative change, or None if the earlier window has no batches or a
+        zero mean
+    """
+    if not len(times):
+        return None
+    values = np.asarray(values, dtype=np.float64)
+    window = np.timedelta64(int(window_hours * 60), "m")
+    last = times[-1]
+    recent = times > last - window
+    earlier = (times > last - 2 * window) & ~recent
+    if not earlier.any():
+        return None
+    earlier_mean = values[earlier].mean()
+    if earlier_mean <= 0:
+        return None
+    return float((values[recent].mean() - earlier_mean) / earlier_mean)
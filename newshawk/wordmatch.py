@@ -0,0 +1,153 @@
+"""
+Compiled frequency word-group matcher
+
+frequency_words.txt defines groups of required (+word), normal and filter
+(!word) words, all matched as case-insensitive substrings. Instead of
+checking every word of every group against each title, all words are
+compiled into one Aho-Corasick automaton: a single pass over the lowercased
+title yields the set of words it contains, and only the groups that
+reference one of those words (or have no words at all) are evaluated.
+"""
+
+from collections import deque
+from typing import Dict, FrozenSet, List, Optional, Set
+
+
+class AhoCorasick:
+    """Multi-pattern substring finder over a fixed word list"""
+
+    def __init__(self, words: List[str]):
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[FrozenSet[int]] = [frozenset()]
+        self._always: FrozenSet[int] = frozenset(
+            i for i, word in enumerate(words) if not word
+        )
+
+        outputs: List[Set[int]] = [set()]
+        for word_id, word in enumerate(words):
+            if not word:
+                continue
+            state = 0
+            for char in word:
+                next_state = self._goto[state].get(char)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto[state][char] = next_state
+                    self._goto.append({})
+                    self._fail.append(0)
+                    outputs.append(set())
+                state = next_state
+            outputs[state].add(word_id)
+
+        # Breadth-first failure links; each state also reports the words of
+        # its failure chain
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(char, 0)
+                self._fail[next_state] = target if target != next_state else 0
+                outputs[next_state] |= outputs[self._fail[next_state]]
+
+        self._output = [frozenset(out) for out in outputs]
+
+    def find(self, text: str) -> Set[int]:
+        """Ids of all words occurring in text"""
+        goto = self._goto
+        fail = self._fail
+        output = self._output
+        found = set(self._always)
+        state = 0
+        for char in text:
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if output[state]:
+                found |= output[state]
+        return found
+
+
+class WordGroupMatcher:
+    """
+    Word groups and filter words compiled for one-pass title matching
+
+    Semantics match the original per-group loop: a title matches nothing if
+    it contains any filter word; a group matches if the title contains all of
+    its required words and, when it has normal words, at least one of them.
+    An empty group list matches every title.
+    """
+
+    def __init__(self, word_groups: List[Dict], filter_words: List[str]):
+        self.word_groups = word_groups
+        self.filter_words = filter_words
+
+        word_ids: Dict[str, int] = {}
+
+        def intern(word: str) -> int:
+            return word_ids.setdefault(word.lower(), len(word_ids))
+
+        self._filter_ids = frozenset(intern(word) for word in filter_words)
+        self._required: List[FrozenSet[int]] = []
+        self._normal: List[FrozenSet[int]] = []
+        self._always: List[int] = []
+        word_to_groups: Dict[int, List[int]] = {}
+
+        for index, group in enumerate(word_groups):
+            required = frozenset(intern(word) for word in group["required"])
+            normal = frozenset(intern(word) for word in group["normal"])
+            self._required.append(required)
+            self._normal.append(normal)
+            if not required and not normal:
+                self._always.append(index)
+            for word_id in required | normal:
+                word_to_groups.setdefault(word_id, []).append(index)
+
+        self._word_to_groups = word_to_groups
+        self._automaton = AhoCorasick(list(word_ids))
+
+    def _candidate_groups(self, found: Set[int]) -> Set[int]:
+        candidates = set(self._always)
+        for word_id in found:
+            candidates.update(self._word_to_groups.get(word_id, ()))
+        return candidates
+
+    def _group_matches(self, index: int, found: Set[int]) -> bool:
+        normal = self._normal[index]
+        return self._required[index] <= found and (not normal or not normal.isdisjoint(found))
+
+    def matching_groups(self, title) -> List[int]:
+        """Indices of all groups the title matches, in configuration order"""
+        if not isinstance(title, str):
+            title = str(title) if title is not None else ""
+        if not title.strip():
+            return []
+        if not self.word_groups:
+            return []
+
+        found = self._automaton.find(title.lower())
+        if not self._filter_ids.isdisjoint(found):
+            return []
+        return sorted(
+            index for index in self._candidate_groups(found)
+            if self._group_matches(index, found)
+        )
+
+    def first_match(self, title) -> Optional[int]:
+        """Index of the first group the title matches, or None"""
+        groups = self.matching_groups(title)
+        return groups[0] if groups else None
+
+    def matches(self, title) -> bool:
+        """Whether the title passes the filters and matches any group"""
+        if not isinstance(title, str):
+            title = str(title) if title is not None else ""
+        if not title.strip():
+            return False
+        if not self.word_groups:
+            return True
+        return bool(self.matching_groups(title))